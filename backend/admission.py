@@ -0,0 +1,202 @@
+"""
+Name: admission.py
+Description: Admission control for the server. Token buckets limit how fast each game (or client)
+may send requests, a per-game counter bounds how many moves may wait for one game at a time, and
+process-wide slots cap how many expensive operations (AI moves, board generation) run at once.
+Requests over a limit fail fast with AdmissionError instead of queueing behind other players.
+Inputs: None
+Outputs: None
+External Sources: Token bucket (https://en.wikipedia.org/wiki/Token_bucket)
+Author(s): Riley Meyerkorth
+Creation Date: 19 October 2026
+"""
+
+import math
+import threading
+import time
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from typing import Iterator
+
+from .constants import (
+    ADMISSION_MAX_BUCKETS,
+    ADMISSION_WAIT_SECONDS,
+    AI_CONCURRENCY,
+    GENERATION_CONCURRENCY,
+    MAX_PENDING_MOVES
+)
+
+
+class AdmissionError(Exception):
+    """
+    Description: A request was turned away. `status` is the HTTP status to answer with (429 when
+    the caller is over its own limits, 503 when the server is saturated) and `retry_after` is a
+    hint in seconds.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+
+    def __init__(self, status: int, reason: str, retry_after: float):
+        """
+        Description: records why and for how long the request was refused
+        Inputs: status (int): HTTP status, reason (str): message, retry_after (float): seconds
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        super().__init__(reason)
+        self.status: int = status
+        self.reason: str = reason
+        self.retry_after: int = max(1, math.ceil(retry_after))
+
+
+class TokenBucket:
+    """
+    Description: Holds up to `burst` tokens, refilled at `rate` tokens per second. Not thread safe
+    on its own; Admission guards it.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    __slots__ = ("rate", "burst", "tokens", "stamp")
+
+    def __init__(self, rate: float, burst: float):
+        """
+        Description: creates a full bucket
+        Inputs: rate (float): tokens per second, burst (float): capacity
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self.rate: float = rate
+        self.burst: float = burst
+        self.tokens: float = burst
+        self.stamp: float = time.monotonic()
+
+    def take(self, cost: float = 1) -> float:
+        """
+        Description: takes `cost` tokens if the bucket holds them
+        Inputs: cost (float): tokens needed
+        Outputs: float: 0 on success, otherwise seconds until enough tokens will be back
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.stamp) * self.rate)
+        self.stamp = now
+        if self.tokens >= cost:
+            self.tokens -= cost
+            return 0.0
+        return (cost - self.tokens) / self.rate
+
+
+class Admission:
+    """
+    Description: Limits shared by every request in this worker: token buckets by key, pending moves
+    by game and concurrency slots by operation. `rejected` counts refusals by reason.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+
+    def __init__(self, max_pending: int = MAX_PENDING_MOVES, ai_slots: int = AI_CONCURRENCY,
+                 generation_slots: int = GENERATION_CONCURRENCY, wait: float = ADMISSION_WAIT_SECONDS):
+        """
+        Description: creates empty limit tables
+        Inputs: max_pending (int): moves allowed in flight per game,
+                ai_slots (int): AI moves allowed at once, generation_slots (int): boards generated at once,
+                wait (float): seconds to wait for a free slot before refusing
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        # least recently used first, so idle callers are forgotten first
+        self._buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+        self._pending: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._slots: dict[str, threading.BoundedSemaphore] = {
+            "ai": threading.BoundedSemaphore(ai_slots),
+            "generation": threading.BoundedSemaphore(generation_slots),
+        }
+        self.max_pending: int = max_pending
+        self.wait: float = wait
+        self.rejected: Counter[str] = Counter()
+
+    def _refuse(self, status: int, reason: str, retry_after: float) -> AdmissionError:
+        """
+        Description: counts a refusal and builds its error
+        Inputs: status (int): HTTP status, reason (str): message, retry_after (float): seconds
+        Outputs: AdmissionError: error to raise
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self.rejected[reason] += 1
+        return AdmissionError(status, reason, retry_after)
+
+    def rate(self, key: str, rate: float, burst: float, cost: float = 1) -> None:
+        """
+        Description: charges a request to the bucket for `key`
+        Inputs: key (str): caller, rate (float): tokens per second, burst (float): capacity,
+                cost (float): tokens this request takes
+        Outputs: None; raises AdmissionError (429) when the bucket is empty
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(rate, burst)
+                if len(self._buckets) > ADMISSION_MAX_BUCKETS:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+            wait = bucket.take(cost)
+            if wait:
+                raise self._refuse(429, "Too many requests", wait)
+
+    @contextmanager
+    def pending(self, game_id: str) -> Iterator[None]:
+        """
+        Description: counts a move as waiting for or holding its game for the duration of the block
+        Inputs: game_id (str): game the move is for
+        Outputs: context manager; raises AdmissionError (429) if the game already has max_pending moves
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        with self._lock:
+            if self._pending[game_id] >= self.max_pending:
+                raise self._refuse(429, "Too many moves in flight for this game", 1)
+            self._pending[game_id] += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._pending[game_id] -= 1
+                if not self._pending[game_id]:
+                    del self._pending[game_id]
+
+    @contextmanager
+    def slot(self, kind: str) -> Iterator[None]:
+        """
+        Description: holds one of the process-wide slots for an expensive operation
+        Inputs: kind (str): "ai" or "generation"
+        Outputs: context manager; raises AdmissionError (503) if no slot frees up within `wait`
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        semaphore = self._slots[kind]
+        if not semaphore.acquire(timeout=self.wait):
+            raise self._refuse(503, f"Server busy ({kind})", 1)
+        try:
+            yield
+        finally:
+            semaphore.release()
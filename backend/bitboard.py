@@ -0,0 +1,586 @@
+"""
+Name: bitboard.py
+Description: Board engine that stores mines, revealed cells and flags as integer bitsets instead of
+2D lists. Mine counts come from bit-sliced adders over shifted mine masks, flood fill from repeated
+bitwise dilation, and the win check is a single mask comparison. It exposes the same public
+methods as Board; AI, solver and hint queries run on a list Board snapshot of the visible state.
+Inputs: None
+Outputs: None
+External Sources: N/A
+Author(s): Riley Meyerkorth
+Creation Date: 19 October 2026
+"""
+
+import random
+
+from .board import Board, draw_mines
+from .constants import CELL_MINE, DEFAULT_COLS, DEFAULT_ROWS
+from .engine import BoardEngine, register_engine
+from .models import (
+    BoardEngineType,
+    BoardPos,
+    BoardSize,
+    BoardStateModel,
+    Cell,
+    GameMode,
+    HintModel,
+    PlayerType
+)
+from .render import TerminalRenderer
+from .solver import Analysis
+from .zobrist import ZobristKeys, get_zobrist_keys
+from typing import Iterable
+
+# Bit planes needed to hold a neighbor count of 0-8
+COUNT_PLANES = 4
+
+
+def shifted_masks(mask: int, cells: int, width: int) -> tuple[int, ...]:
+    """
+    Description: the mask moved one step in each of the eight directions, clipped to `cells`.
+    Rows are `width` bits apart and the bits outside `cells` (at least one padding column) absorb
+    anything that wraps around a row edge.
+    Inputs: mask (int): cells to move, cells (int): every on-board bit, width (int): bits per row
+    Outputs: tuple[int, ...]: eight shifted masks
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    return tuple(
+        shifted & cells
+        for step in (1, width - 1, width, width + 1)
+        for shifted in (mask << step, mask >> step)
+    )
+
+
+def dilate(mask: int, cells: int, width: int) -> int:
+    """
+    Description: the mask plus every cell adjacent to it
+    Inputs: mask (int): cells to grow, cells (int): every on-board bit, width (int): bits per row
+    Outputs: int: grown mask
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    for shifted in shifted_masks(mask, cells, width):
+        mask |= shifted
+    return mask
+
+
+def count_planes(mines: int, cells: int, width: int) -> list[int]:
+    """
+    Description: every cell's neighbor mine count at once. Each of the eight shifted mine masks is
+    added into COUNT_PLANES bit planes with a ripple of half adders, so bit k of a cell's count
+    ends up in plane k.
+    Inputs: mines (int): mine cells, cells (int): every on-board bit, width (int): bits per row
+    Outputs: list[int]: COUNT_PLANES bit planes
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    planes = [0] * COUNT_PLANES
+    for carry in shifted_masks(mines, cells, width):
+        for k in range(COUNT_PLANES):
+            planes[k], carry = planes[k] ^ carry, planes[k] & carry
+            if not carry:
+                break
+    return planes
+
+
+def flood(seeds: int, zero: int, allowed: int, cells: int, width: int) -> int:
+    """
+    Description: cells uncovered by revealing `seeds`: newly revealed blank cells are dilated one
+    step at a time, staying inside `allowed`, until nothing new is added. Several seeds (even on
+    separate boards sharing one bitset) expand together.
+    Inputs: seeds (int): cells being revealed, zero (int): blank cells, allowed (int): cells the
+            fill may enter, cells (int): every on-board bit, width (int): bits per row
+    Outputs: int: every cell the reveal uncovers, seeds included
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    region = frontier = seeds
+    while frontier & zero:
+        frontier = dilate(frontier & zero, cells, width) & allowed & ~region
+        region |= frontier
+    return region
+
+
+@register_engine(BoardEngineType.BITBOARD)
+class BitBoard(BoardEngine):
+    """
+    Description: Bitset Minesweeper engine. Cell (r, c) is bit r * width + c, where width is
+    cols + 1: the spare column on the right is always empty, so horizontal shifts that wrap
+    around a row edge land in it and are masked off.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+
+    def __init__(self, mines: int, game_mode: GameMode = GameMode.SOLO, size: BoardSize | None = None,
+                 lazy_counts: bool = False, seed: int | None = None):
+        """
+        Description: initializes an empty board with given number of mines and size
+        Inputs: mines (int): number of mines to place on the board, game_mode (GameMode): game mode (solo or co-op),
+                size (BoardSize | None): board dimensions, defaults to DEFAULT_ROWS x DEFAULT_COLS,
+                lazy_counts (bool): ignored, the adders count the whole board in a few word operations,
+                seed (int | None): seed for place_mines, None draws from the random module
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self.mines: int = mines
+        self.size: BoardSize = size if size is not None else BoardSize(DEFAULT_ROWS, DEFAULT_COLS)
+        self.seed: int | None = seed
+        self._width: int = self.size.cols + 1
+        # every on-board bit (the padding column excluded)
+        row_mask = (1 << self.size.cols) - 1
+        self._cells: int = sum(row_mask << (r * self._width) for r in range(self.size.rows))
+        self._zobrist_keys: ZobristKeys = get_zobrist_keys(self.size.rows, self.size.cols)
+
+        self.mine_bits: int = 0
+        self.revealed_bits: int = 0
+        self.flag_bits: int = 0
+        # bit k of every cell's neighbor mine count, and the safe cells whose count is zero
+        self._count_planes: list[int] = [0] * COUNT_PLANES
+        self._zero_bits: int = 0
+        self.flag_count: int = 0
+        self.isAlive: bool = True
+        # bumped on every visible change, like Board.version
+        self.version: int = 0
+        self.zobrist: int = 0
+        self._snapshot: tuple[int, Board] | None = None
+
+        # Co-op mode fields
+        self.game_mode: GameMode = game_mode
+        self.current_player: PlayerType = PlayerType.HUMAN
+        self.human_alive: bool = True
+        self.ai_alive: bool = True
+        self.winner: PlayerType | None = None
+        self.game_over: bool = False
+
+    def __getstate__(self) -> dict:
+        """
+        Description: pickled state without the shared Zobrist keys and the snapshot
+        Inputs: None
+        Outputs: dict: attributes to pickle
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        state = self.__dict__.copy()
+        del state["_zobrist_keys"], state["_snapshot"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Description: restores a pickled board and reattaches the shared Zobrist keys
+        Inputs: state (dict): attributes from __getstate__
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self.__dict__.update(state)
+        self._zobrist_keys = get_zobrist_keys(self.size.rows, self.size.cols)
+        self._snapshot = None
+
+    def _bit(self, row: int, col: int) -> int:
+        """
+        Description: single-bit mask of a cell
+        Inputs: row (int), col (int): cell position
+        Outputs: int: mask with only that cell set
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return 1 << (row * self._width + col)
+
+    def _cell(self, index: int) -> Cell:
+        """
+        Description: converts a bit index back to (row, col)
+        Inputs: index (int): bit index
+        Outputs: Cell: (row, col)
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return divmod(index, self._width)
+
+    def _dilate(self, mask: int) -> int:
+        """
+        Description: the mask plus every cell adjacent to it
+        Inputs: mask (int): cells to grow
+        Outputs: int: grown mask
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return dilate(mask, self._cells, self._width)
+
+    def _value(self, index: int) -> int:
+        """
+        Description: value of a cell as Board stores it: CELL_MINE or the neighbor mine count
+        Inputs: index (int): bit index
+        Outputs: int: cell value
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        if (self.mine_bits >> index) & 1:
+            return CELL_MINE
+        return sum(((plane >> index) & 1) << k for k, plane in enumerate(self._count_planes))
+
+    def _indices(self, mask: int) -> Iterable[int]:
+        """
+        Description: yields the bit indices set in a mask, lowest first
+        Inputs: mask (int): cells to walk
+        Outputs: Iterable[int]: bit indices
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        while mask:
+            low = mask & -mask
+            yield low.bit_length() - 1
+            mask ^= low
+
+    def _grid(self, mask: int) -> list[list[bool]]:
+        """
+        Description: expands a mask into a rows x cols grid of booleans
+        Inputs: mask (int): cells to expand
+        Outputs: list[list[bool]]: True where the mask is set
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        rows, cols, w = self.size.rows, self.size.cols, self._width
+        bits = format(mask, "b").zfill(rows * w)[::-1]
+        return [[bits[r * w + c] == "1" for c in range(cols)] for r in range(rows)]
+
+    def values(self) -> list[list[int]]:
+        """
+        Description: every cell's value (CELL_MINE or its count) as a rows x cols grid
+        Inputs: None
+        Outputs: list[list[int]]: same layout as Board.board
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        mines = self._grid(self.mine_bits)
+        planes = [self._grid(plane) for plane in self._count_planes]
+        return [
+            [
+                CELL_MINE if mines[r][c] else sum(plane[r][c] << k for k, plane in enumerate(planes))
+                for c in range(self.size.cols)
+            ]
+            for r in range(self.size.rows)
+        ]
+
+    @property
+    def hidden_count(self) -> int:
+        """
+        Description: number of hidden, unflagged cells
+        Inputs: None
+        Outputs: int: population count of the hidden mask
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return (self._cells & ~self.revealed_bits & ~self.flag_bits).bit_count()
+
+    def place_mines(self, first_pos: BoardPos) -> None:
+        """
+        Description: places mines on the board, ensuring the first click and its neighbors are not
+        mines. Uses the same draw_mines rule as Board.place_mines, so both engines deal the same
+        layout from the same seed.
+        Inputs: first_pos (BoardPos): position of the first cell clicked by the user
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        randint = random.Random(self.seed).randint if self.seed is not None else random.randint
+        for r, c in draw_mines(randint, self.size.rows, self.size.cols, self.mines, (first_pos.x, first_pos.y)):
+            self.mine_bits |= self._bit(r, c)
+
+    def set_mines(self, cells: Iterable[Cell]) -> None:
+        """
+        Description: places mines at exactly the given cells and computes the counts
+        Inputs: cells (Iterable[Cell]): (row, col) of every mine
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        for r, c in cells:
+            self.mine_bits |= self._bit(r, c)
+        self.update_mine_counts()
+
+    def update_mine_counts(self) -> None:
+        """
+        Description: computes every cell's neighbor mine count at once with bit-sliced adders
+        Inputs: None
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        planes = count_planes(self.mine_bits, self._cells, self._width)
+        self._count_planes = planes
+        nonzero = 0
+        for plane in planes:
+            nonzero |= plane
+        self._zero_bits = self._cells & ~self.mine_bits & ~nonzero
+        self.version += 1
+
+    def flag_cell(self, pos: BoardPos) -> None:
+        """
+        Description: flags or unflags the cell at the given position
+        Inputs: pos (BoardPos): position of the cell to flag/unflag
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        bit = self._bit(pos.x, pos.y)
+        # Do not allow flagging revealed cells
+        if self.revealed_bits & bit:
+            return
+        self.flag_bits ^= bit
+        self.flag_count += 1 if self.flag_bits & bit else -1
+        self.zobrist ^= self._zobrist_keys.flag_key(pos.x, pos.y)
+        self.version += 1
+
+    def reveal_cell(self, pos: BoardPos) -> bool:
+        """
+        Description: reveals the cell at the given position. A blank cell grows into its region by
+        dilating the newly revealed blank cells one step at a time, never entering mines, flags or
+        already revealed cells, until nothing new is added.
+        Inputs: pos (BoardPos): position of the cell to reveal
+        Outputs: bool: False if a mine is revealed (game over), True otherwise
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        bit = self._bit(pos.x, pos.y)
+
+        # Don't reveal flagged cells
+        if self.flag_bits & bit:
+            return True
+
+        # If the cell is a mine, game over
+        if self.mine_bits & bit:
+            if not self.revealed_bits & bit:
+                self.revealed_bits |= bit
+                self.zobrist ^= self._zobrist_keys.value_key(pos.x, pos.y, CELL_MINE)
+            self.isAlive = False
+            self.version += 1
+            return False
+
+        if self.revealed_bits & bit:
+            return True
+        self.version += 1
+
+        # Expand through blank cells
+        allowed = self._cells & ~self.mine_bits & ~self.flag_bits & ~self.revealed_bits
+        region = flood(bit, self._zero_bits, allowed, self._cells, self._width)
+        self.revealed_bits |= region
+
+        keys = self._zobrist_keys
+        for index in self._indices(region):
+            r, c = self._cell(index)
+            self.zobrist ^= keys.value_key(r, c, self._value(index))
+        return True
+
+    def check_win(self) -> bool:
+        """
+        Description: checks if the player has won the game (all non-mine cells revealed)
+        Inputs: None
+        Outputs: bool: True if the player has won, False otherwise
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        safe = self._cells & ~self.mine_bits
+        return self.revealed_bits & safe == safe
+
+    def opening_sizes(self) -> list[int]:
+        """
+        Description: number of cells each opening uncovers (blank region plus border)
+        Inputs: None
+        Outputs: list[int]: one size per opening, ordered by lowest cell
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        sizes = []
+        remaining = self._zero_bits
+        while remaining:
+            region = remaining & -remaining
+            while True:
+                grown = self._dilate(region) & self._zero_bits
+                if grown == region:
+                    break
+                region = grown
+            remaining &= ~region
+            sizes.append((self._dilate(region) & ~self.mine_bits).bit_count())
+        return sizes
+
+    def rehash(self) -> None:
+        """
+        Description: recomputes the Zobrist hash from scratch
+        Inputs: None
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        keys = self._zobrist_keys
+        value = 0
+        for index in self._indices(self.revealed_bits):
+            r, c = self._cell(index)
+            value ^= keys.value_key(r, c, self._value(index))
+        for index in self._indices(self.flag_bits & ~self.revealed_bits):
+            value ^= keys.flag_key(*self._cell(index))
+        self.zobrist = value
+        self.version += 1
+
+    def snapshot(self) -> Board:
+        """
+        Description: list Board with the same mines, revealed cells and flags, for the AI, solver
+        and hints. The snapshot shares this board's version and is rebuilt only after a change;
+        it must be treated as read-only.
+        Inputs: None
+        Outputs: Board: reference-engine copy of the current state
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        if self._snapshot is not None and self._snapshot[0] == self.version:
+            return self._snapshot[1]
+        board = Board(self.mines, self.game_mode, self.size, seed=self.seed)
+        board.board = self.values()
+        board.revealed = self._grid(self.revealed_bits)
+        board.flags = self._grid(self.flag_bits)
+        board.flag_count = self.flag_count
+        board.isAlive = self.isAlive
+        board.rehash()
+        # share the version so memoized hints report this board's version
+        board.version = self.version
+        self._snapshot = (self.version, board)
+        return board
+
+    def ai_move(self, difficulty: str, deadline: float | None = None) -> tuple[str, BoardPos]:
+        """
+        Description: runs the AI strategy for a difficulty level on the snapshot
+        Inputs: difficulty (str): one of AI_DIFFICULTIES, deadline (float | None): time.monotonic()
+                limit for strategies that search
+        Outputs: tuple[str, BoardPos]: ("flag" or "reveal", position to act on)
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return self.snapshot().ai_move(difficulty, deadline)
+
+    def ai_move_easy(self) -> tuple[str, BoardPos]:
+        """
+        Description: picks any hidden cell at random
+        Inputs: None
+        Outputs: tuple[str, BoardPos]: ("flag" or "reveal", position to act on)
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return self.snapshot().ai_move_easy()
+
+    def ai_move_medium(self) -> tuple[str, BoardPos]:
+        """
+        Description: applies flag/reveal neighbor rules, else random
+        Inputs: None
+        Outputs: tuple[str, BoardPos]: ("flag" or "reveal", position to act on)
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return self.snapshot().ai_move_medium()
+
+    def ai_move_hard(self, deadline: float | None = None) -> tuple[str, BoardPos]:
+        """
+        Description: applies pattern deductions, medium rules, then the best solver guess
+        Inputs: deadline (float | None): time.monotonic() limit, None for no limit
+        Outputs: tuple[str, BoardPos]: ("flag" or "reveal", position to act on)
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return self.snapshot().ai_move_hard(deadline)
+
+    def analyze(self, deadline: float | None = None) -> Analysis:
+        """
+        Description: solver analysis of the visible board
+        Inputs: deadline (float | None): time.monotonic() limit for the solver
+        Outputs: Analysis: solver result for the current version
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return self.snapshot().analyze(deadline)
+
+    def hint(self) -> HintModel:
+        """
+        Description: hint payload (safe cells, mines, probability heatmap) for the visible board
+        Inputs: None
+        Outputs: HintModel: hint for the current version
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return self.snapshot().hint()
+
+    def print_board(self, show_mines: bool = False, renderer: TerminalRenderer | None = None) -> None:
+        """
+        Description: prints the board to console
+        Inputs: show_mines (bool): whether to show mines (for debugging),
+                renderer (TerminalRenderer | None): renderer to draw with
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self.snapshot().print_board(show_mines, renderer)
+
+    def to_dict(self, reveal_all: bool = False) -> BoardStateModel:
+        """
+        Description: converts the board state to the model expected by the frontend
+        Inputs: reveal_all (bool): whether to reveal all cells (for game over)
+        Outputs: BoardStateModel: board state
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        values = self.values()
+        revealed = self._grid(self.revealed_bits)
+        board = [
+            [value if reveal_all or shown else None for value, shown in zip(value_row, shown_row)]
+            for value_row, shown_row in zip(values, revealed)
+        ]
+        return BoardStateModel(
+            rows=self.size.rows,
+            cols=self.size.cols,
+            mines=self.mines,
+            board=board,
+            revealed=revealed,
+            flags=self._grid(self.flag_bits),
+            flag_count=self.flag_count,
+            alive=self.isAlive,
+            win=self.check_win(),
+            # Co-op mode fields
+            game_mode=self.game_mode,
+            current_player=self.current_player,
+            human_alive=self.human_alive,
+            ai_alive=self.ai_alive,
+            winner=self.winner,
+            game_over=self.game_over
+        )
@@ -9,25 +9,83 @@ Creation Date: 1 September 2025
 """
 
 from .models import (
+    BoardEngineType,
     BoardStateModel,
+    HintModel,
     BoardSize,
     BoardPos,
     GameMode,
-    PlayerType
+    PlayerType,
+    Cell
 )
 from .constants import (
     CELL_BLANK,
     CELL_MINE,
+    CELL_UNCOUNTED,
+    CHAR_FLAG,
     CHAR_MINE,
     CHAR_UNREVEALED,
     DEFAULT_COLS,
-    DEFAULT_ROWS,
-    ROW_TITLES,
-    DIRECTIONS
+    DEFAULT_ROWS
 )
+from .engine import BoardEngine, register_engine
+from .hidden_index import HiddenIndex
+from .neighbors import NeighborTable, get_neighbor_table
+from .render import TerminalRenderer
+from .solver import Analysis, analyze
+from .patterns import (
+    A_MASK as PATTERN_A_MASK,
+    B_MASK as PATTERN_B_MASK,
+    WINDOW as PATTERN_WINDOW,
+    get_pattern_table
+)
+from .zobrist import MISSING, TRANSPOSITION_TABLE, ZobristKeys, get_zobrist_keys
 import random
+from array import array
+from collections import deque
+from typing import Callable, Iterable
+
 
-class Board:
+def _to_pos(cell: Cell) -> BoardPos:
+    """
+    Description: converts an internal (row, col) tuple into the pydantic BoardPos used by the API
+    Inputs: cell (Cell): (row, col) tuple
+    Outputs: BoardPos: validated position for API responses
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    return BoardPos(x=cell[0], y=cell[1])
+
+
+def draw_mines(randint: Callable[[int, int], int], rows: int, cols: int, mines: int, first: Cell) -> list[Cell]:
+    """
+    Description: the first-click-safe placement rule shared by every engine: draws random cells until
+    `mines` distinct ones lie outside the 3x3 around the first click. The draws are the ones
+    Board.place_mines has always made, so a seed deals the same layout in every engine
+    Inputs: randint (Callable): random.randint or a seeded generator's randint, rows (int), cols (int):
+            board size, mines (int): mines to place, first (Cell): first click
+    Outputs: list[Cell]: (row, col) of every mine, in draw order
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    fr, fc = first
+    placed: set[Cell] = set()
+    drawn = []
+    # Place mines randomly until we reach the desired mine count
+    while len(drawn) < mines:
+        r = randint(0, rows - 1)
+        c = randint(0, cols - 1)
+        # Ensure we don't place a mine on the first clicked cell or its adjacent cells
+        if (abs(r - fr) > 1 or abs(c - fc) > 1) and (r, c) not in placed:
+            placed.add((r, c))
+            drawn.append((r, c))
+    return drawn
+
+
+@register_engine(BoardEngineType.LIST)
+class Board(BoardEngine):
     """
     Description: Manages the Minesweeper board state and game logic
     Author(s): Aiden Burke, Riley Meyerkorth, Raj Kaura, Kobe Jordan
@@ -41,10 +99,14 @@ class Board:
     provide methods to reveal cells, check for win/loss, print the board, etc.
     '''
 
-    def __init__(self, mines: int, game_mode: GameMode = GameMode.SOLO):
+    def __init__(self, mines: int, game_mode: GameMode = GameMode.SOLO, size: BoardSize | None = None,
+                 lazy_counts: bool = False, seed: int | None = None):
         """
         Description: initializes the board with given number of mines and size
-        Inputs: mines (int): number of mines to place on the board, game_mode (GameMode): game mode (solo or co-op)
+        Inputs: mines (int): number of mines to place on the board, game_mode (GameMode): game mode (solo or co-op),
+                size (BoardSize | None): board dimensions, defaults to DEFAULT_ROWS x DEFAULT_COLS,
+                lazy_counts (bool): compute each count when the cell is first revealed or inspected,
+                seed (int | None): seed for place_mines, None draws from the random module
         Outputs: None
         Author(s): Aiden Burke, Riley Meyerkorth, Raj Kaura, Kobe Jordan
         Creation Date: 1 September 2025
@@ -53,14 +115,36 @@ class Board:
 
         # Initialize board properties
         self.mines: int = mines
-        self.size: BoardSize = BoardSize(DEFAULT_ROWS, DEFAULT_COLS)
-        # store board as array of ints where each int is the number of adjacent mines, CELL_MINE if mine
-        self.board: list[list[int]] = [[0 for _ in range(self.size.cols)] for _ in range(self.size.rows)]
+        self.size: BoardSize = size if size is not None else BoardSize(DEFAULT_ROWS, DEFAULT_COLS)
+        # a seeded board deals the same mines for the same first click, which lets replays rebuild it
+        self.seed: int | None = seed
+        # neighbor lookups are shared with every other board of the same size
+        self._neighbors: NeighborTable = get_neighbor_table(self.size.rows, self.size.cols)
+        self._zobrist_keys: ZobristKeys = get_zobrist_keys(self.size.rows, self.size.cols)
+        # store board as array of ints where each int is the number of adjacent mines, CELL_MINE if mine;
+        # with lazy counts, safe cells hold CELL_UNCOUNTED until count() fills them in
+        self.lazy_counts: bool = lazy_counts
+        blank = CELL_UNCOUNTED if lazy_counts else 0
+        self.board: list[list[int]] = [[blank for _ in range(self.size.cols)] for _ in range(self.size.rows)]
+        # cells counted so far on a lazy board, so new mines only invalidate those
+        self._counted: list[Cell] = []
         self.revealed: list[list[bool]] = [[False for _ in range(self.size.cols)] for _ in range(self.size.rows)]
         # flags are tracked separately from board values
         self.flags: list[list[bool]] = [[False for _ in range(self.size.cols)] for _ in range(self.size.rows)]
         self.flag_count: int = 0
         self.isAlive: bool = True
+        # hidden, unflagged cells (flat indices), kept in sync by reveal/flag for O(1) random picks
+        self._hidden: HiddenIndex = HiddenIndex(self.size.rows * self.size.cols)
+        # precomputed openings (blank regions plus their numbered border) as flat indices,
+        # and the opening each blank cell belongs to; filled in by update_mine_counts
+        self.openings: list[tuple[int, ...]] = []
+        self._opening_of: array | None = None
+        # bumped on every visible change so derived results (hints, analysis) can be memoized
+        self.version: int = 0
+        # incremental Zobrist hash of what the player can see (revealed values and flags)
+        self.zobrist: int = 0
+        self._analysis: tuple[int, Analysis] | None = None
+        self._hint: tuple[int, HintModel] | None = None
         
         # Co-op mode fields
         self.game_mode: GameMode = game_mode
@@ -70,118 +154,78 @@ class Board:
         self.winner: PlayerType | None = None
         self.game_over: bool = False
     
-    def handle_player_move(self, pos: BoardPos, player: PlayerType) -> bool:
-        """
-        Description: handles a move by a specific player in co-op mode
-        Inputs: pos (BoardPos): position of the cell to reveal, player (PlayerType): player making the move
-        Outputs: bool: True if the move was successful, False if the player hit a mine
-        Author(s): Aiden Burke, Riley Meyerkorth, Raj Kaura, Kobe Jordan
-        Creation Date: 1 September 2025
-        External Sources: N/A
-        """
-        """
-        Handle a move by a specific player in co-op mode.
-        Returns True if the move was successful, False if the player hit a mine.
-        """
-        
-        # Solo mode behaves as normal
-        if self.game_mode != GameMode.COOP:
-            return self.reveal_cell(pos)
-        
-        # Check if it's the player's turn and if they are alive
-        if self.current_player != player:
-            return False  # Not this player's turn
-
-        # Check if the player is alive
-        if player == PlayerType.HUMAN and not self.human_alive:
-            return False  # Human player is out
-        if player == PlayerType.AI and not self.ai_alive:
-            return False  # AI player is out
-        
-        # Make the move
-        success = self.reveal_cell(pos)
-
-        # Check if someone hit a mine
-        if not success:
-            # Player hit a mine, they lose
-            if player == PlayerType.HUMAN:
-                self.human_alive = False
-                self.winner = PlayerType.AI
-            # AI player hit a mine, they lose
-            else: 
-                self.ai_alive = False
-                self.winner = PlayerType.HUMAN
-            self.game_over = True
-        else:
-            # Switch turns
-            self.current_player = PlayerType.AI if player == PlayerType.HUMAN else PlayerType.HUMAN
-        
-        return success
-    
-    def check_coop_win(self) -> bool:
-        """
-        Description: checks if the game is won in co-op mode (all non-mine cells revealed)
-        Inputs: None
-        Outputs: bool: True if the game is won, False otherwise
-        Author(s): Raj Kaura, Kobe Jordan
-        Creation Date: 3 October 2025
-        External Sources: N/A
-        """
-        """
-        Check if the game is won in co-op mode (all non-mine cells revealed).
-        """
-        if self.game_mode != GameMode.COOP:
-            return self.check_win()
-        
-        # In co-op mode, if all cells are revealed without anyone hitting a mine,
-        # it's a draw (both players win)
-        if self.check_win() and not self.game_over:
-            self.winner = None  # Draw
-            self.game_over = True
-            return True
-        
-        return False
-        
-    def _hidden_neighbors(self, pos: BoardPos) -> list[BoardPos]:
+    def _hidden_neighbors(self, row: int, col: int) -> list[Cell]:
         """
         Description: returns a list of hidden neighbors for a given position
-        Inputs: pos (BoardPos): position to check neighbors for
-        Outputs: list[BoardPos]: list of hidden neighbor positions
+        Inputs: row (int), col (int): position to check neighbors for
+        Outputs: list[Cell]: list of hidden neighbor (row, col) tuples
         Author(s): Raj Kaura, Kobe Jordan
         Creation Date: 3 October 2025
         External Sources: N/A
         """
         # Initialize variables
-        rows, cols = self.size.rows, self.size.cols
         neighbors = []
-        # Check all 8 possible directions for hidden neighbors
-        for dr, dc in DIRECTIONS:
-            r, c = pos.x + dr, pos.y + dc
-            if 0 <= r < rows and 0 <= c < cols and not self.revealed[r][c] and not self.flags[r][c]:
-                neighbors.append(BoardPos(x=r, y=c))
+        # Check all in-bounds neighbors for hidden cells
+        for r, c in self._neighbors.of(row, col):
+            if not self.revealed[r][c] and not self.flags[r][c]:
+                neighbors.append((r, c))
         # Return the list of hidden neighbors
         return neighbors
 
-    def _flagged_neighbors(self, pos: BoardPos) -> list[BoardPos]:
+    def _flagged_neighbors(self, row: int, col: int) -> list[Cell]:
         """
         Description: returns a list of flagged neighbors for a given position
-        Inputs: pos (BoardPos): position to check neighbors for
-        Outputs: list[BoardPos]: list of flagged neighbor positions
+        Inputs: row (int), col (int): position to check neighbors for
+        Outputs: list[Cell]: list of flagged neighbor (row, col) tuples
         Author(s): Raj Kaura, Kobe Jordan
         Creation Date: 3 October 2025
         External Sources: N/A
         """
         # Initialize variables
-        rows, cols = self.size.rows, self.size.cols
         neighbors = []
-        # Check all 8 possible directions for flagged neighbors
-        for dr, dc in DIRECTIONS:
-            r, c = pos.x + dr, pos.y + dc
-            if 0 <= r < rows and 0 <= c < cols and self.flags[r][c]:
-                neighbors.append(BoardPos(x=r, y=c))
+        # Check all in-bounds neighbors for flagged cells
+        for r, c in self._neighbors.of(row, col):
+            if self.flags[r][c]:
+                neighbors.append((r, c))
         # Return the list of flagged neighbors
         return neighbors
 
+    def opening_sizes(self) -> list[int]:
+        """
+        Description: number of cells each opening uncovers (blank region plus border), for
+        analytics and the AI
+        Inputs: None
+        Outputs: list[int]: one size per opening, in labeling order
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        # Lazy boards only label openings when asked, which counts every cell
+        if self.lazy_counts and self._opening_of is None:
+            for r in range(self.size.rows):
+                for c in range(self.size.cols):
+                    self.count(r, c)
+            self._label_openings()
+        return [len(opening) for opening in self.openings]
+
+    def ai_move(self, difficulty: str, deadline: float | None = None) -> tuple[str, BoardPos]:
+        """
+        Description: runs the AI strategy for a difficulty level
+        Inputs: difficulty (str): one of AI_DIFFICULTIES, deadline (float | None): time.monotonic()
+                limit for strategies that search
+        Outputs: tuple[str, BoardPos]: ("flag" or "reveal", position to act on)
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        if difficulty == "easy":
+            return self.ai_move_easy()
+        if difficulty == "medium":
+            return self.ai_move_medium()
+        if difficulty == "hard":
+            return self.ai_move_hard(deadline)
+        raise ValueError(f"Invalid AI difficulty: {difficulty}")
+
     def ai_move_easy(self) -> tuple[str, BoardPos]:
         """
         Description: picks any hidden cell at random
@@ -192,17 +236,22 @@ class Board:
         External Sources: N/A
         """
         """Pick any hidden cell at random."""
-        # Get list of all hidden cells
-        hidden = [
-            BoardPos(x=r, y=c)
-            for r in range(self.size.rows)
-            for c in range(self.size.cols)
-            if not self.revealed[r][c] and not self.flags[r][c]
-        ]
-        # Randomly choose to flag or reveal a hidden cell
-        if not hidden:
+        # The hidden-cell index makes this a constant-time pick
+        if not self._hidden:
             return ("none", None)
-        return ("reveal", random.choice(hidden))
+        return ("reveal", _to_pos(divmod(self._hidden.choice(), self.size.cols)))
+
+    @property
+    def hidden_count(self) -> int:
+        """
+        Description: number of hidden, unflagged cells
+        Inputs: None
+        Outputs: int: size of the hidden-cell index
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return len(self._hidden)
 
     def ai_move_medium(self) -> tuple[str, BoardPos]:
         """
@@ -214,6 +263,22 @@ class Board:
         External Sources: N/A
         """
         """Apply flag/reveal neighbor rules, else random."""
+        move = self._cached_move("medium", self._medium_rule)
+        if move is not None:
+            return (move[0], _to_pos(move[1]))
+
+        # Fallback: random
+        return self.ai_move_easy()
+
+    def _medium_rule(self) -> tuple[str, Cell] | None:
+        """
+        Description: finds the first move given by the flag/reveal neighbor rules
+        Inputs: None
+        Outputs: tuple[str, Cell] | None: ("flag" or "reveal", cell), or None if no rule applies
+        Author(s): Raj Kaura, Kobe Jordan
+        Creation Date: 3 October 2025
+        External Sources: N/A
+        """
         # Check all revealed cells for rules
         for r in range(self.size.rows):
             for c in range(self.size.cols):
@@ -227,8 +292,8 @@ class Board:
                     continue
 
                 # Get hidden and flagged neighbors
-                hidden = self._hidden_neighbors(BoardPos(x=r, y=c))
-                flagged = self._flagged_neighbors(BoardPos(x=r, y=c))
+                hidden = self._hidden_neighbors(r, c)
+                flagged = self._flagged_neighbors(r, c)
 
                 # Rule 1: all hidden neighbors are mines
                 if len(hidden) > 0 and len(hidden) == value - len(flagged):
@@ -237,44 +302,134 @@ class Board:
                 # Rule 2: all other hidden neighbors are safe
                 if len(flagged) == value and len(hidden) > 0:
                     return ("reveal", hidden[0])
+        return None
+
+    def ai_move_hard(self, deadline: float | None = None) -> tuple[str, BoardPos]:
+        """
+        Description: applies pattern-database deductions on pairs of adjacent numbers, then the
+        medium rules, then the solver: a forced move if there is one, otherwise the hidden cell
+        with the lowest mine probability (exact or sampled). This is an anytime search: with a
+        deadline, the rules answer immediately and the solver refines the guess only until
+        time.monotonic() passes the deadline, keeping whatever it has found by then.
+        Inputs: deadline (float | None): time.monotonic() limit, None for no limit
+        Outputs: tuple[str, BoardPos]: ("flag" or "reveal", position to act on)
+        Author(s): Raj Kaura, Kobe Jordan
+        Creation Date: 3 October 2025
+        External Sources: N/A
+        """
+        """Apply pattern deductions, medium rules, then the best solver guess."""
+        move = self._cached_move("hard", self._hard_rule) or self._cached_move("medium", self._medium_rule)
+        if move is None:
+            move = self._best_guess(deadline)
+        if move is not None:
+            return (move[0], _to_pos(move[1]))
 
         # Fallback: random
         return self.ai_move_easy()
 
-    def ai_move_hard(self) -> tuple[str, BoardPos]:
+    def _best_guess(self, deadline: float | None = None) -> tuple[str, Cell] | None:
+        """
+        Description: picks a move from the solver analysis: reveal a provably safe cell, flag a
+        provable mine, or else reveal the hidden cell least likely to be a mine
+        Inputs: deadline (float | None): time.monotonic() limit for the solver
+        Outputs: tuple[str, Cell] | None: ("flag" or "reveal", cell), or None without probabilities
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
         """
-        Description: applies medium + 1-2-1 pattern rule, else medium
+        analysis = self.analyze(deadline)
+        # Flags are guesses to the solver, so skip cells the player already flagged
+        for cell in sorted(analysis.safe):
+            if not self.flags[cell[0]][cell[1]]:
+                return ("reveal", cell)
+        for cell in sorted(analysis.mines):
+            if not self.flags[cell[0]][cell[1]]:
+                return ("flag", cell)
+        candidates = [
+            (probability, cell)
+            for cell, probability in analysis.probabilities.items()
+            if not self.flags[cell[0]][cell[1]]
+        ]
+        if not candidates:
+            return None
+        return ("reveal", min(candidates)[1])
+
+    def _hard_rule(self) -> tuple[str, Cell] | None:
+        """
+        Description: looks up every pair of adjacent revealed numbers on the frontier in the
+        pattern database (vertical pairs are transposed onto the horizontal table). Safe reveals
+        are preferred over flags.
         Inputs: None
-        Outputs: tuple[str, BoardPos]: ("flag" or "reveal", position to act on)
-        Author(s): Raj Kaura, Kobe Jordan
-        Creation Date: 3 October 2025
+        Outputs: tuple[str, Cell] | None: ("flag" or "reveal", cell), or None if no pattern applies
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
         External Sources: N/A
         """
-        """Apply medium + 1-2-1 pattern rule."""
-        # Check rows for 1-2-1 patterns
-        for r in range(self.size.rows):
-            for c in range(self.size.cols - 2):
-                if (
-                    self.revealed[r][c]
-                    and self.revealed[r][c + 1]
-                    and self.revealed[r][c + 2]
-                    and self.board[r][c] == 1
-                    and self.board[r][c + 1] == 2
-                    and self.board[r][c + 2] == 1
-                ):
-                    # Deduce: outer neighbors are mines, middle safe
-                    # Return one of those moves
-                    hidden_left = self._hidden_neighbors(BoardPos(r, c))
-                    hidden_mid = self._hidden_neighbors(BoardPos(r, c + 1))
-                    hidden_right = self._hidden_neighbors(BoardPos(r, c + 2))
-                    if hidden_mid:
-                        return ("reveal", hidden_mid[0])
-                    if hidden_left:
-                        return ("flag", hidden_left[0])
-                    if hidden_right:
-                        return ("flag", hidden_right[0])
-        # Fallback to medium
-        return self.ai_move_medium()
+        table = get_pattern_table()
+        rows, cols = self.size.rows, self.size.cols
+        flag_move = None
+        for r in range(rows):
+            for c in range(cols):
+                if not self._is_number(r, c):
+                    continue
+                for vertical in (False, True):
+                    br, bc = (r + 1, c) if vertical else (r, c + 1)
+                    if br >= rows or bc >= cols or not self._is_number(br, bc):
+                        continue
+                    # Encode the window around the pair, mapping offsets through the transpose
+                    cells = []
+                    hidden_mask = 0
+                    flags_a = flags_b = 0
+                    for i, (dr, dc) in enumerate(PATTERN_WINDOW):
+                        if vertical:
+                            dr, dc = dc, dr
+                        wr, wc = r + dr, c + dc
+                        cells.append((wr, wc))
+                        if not (0 <= wr < rows and 0 <= wc < cols) or self.revealed[wr][wc]:
+                            continue
+                        if self.flags[wr][wc]:
+                            flags_a += (PATTERN_A_MASK >> i) & 1
+                            flags_b += (PATTERN_B_MASK >> i) & 1
+                        else:
+                            hidden_mask |= 1 << i
+                    need_a = self.board[r][c] - flags_a
+                    need_b = self.board[br][bc] - flags_b
+                    if not (0 <= need_a <= 8 and 0 <= need_b <= 8) or not hidden_mask:
+                        continue
+                    safe, mines = table.lookup(need_a, need_b, hidden_mask)
+                    if safe:
+                        return ("reveal", cells[(safe & -safe).bit_length() - 1])
+                    if mines and flag_move is None:
+                        flag_move = ("flag", cells[(mines & -mines).bit_length() - 1])
+        return flag_move
+
+    def _is_number(self, row: int, col: int) -> bool:
+        """
+        Description: whether a cell is revealed and shows a non-zero count
+        Inputs: row (int), col (int): cell to check
+        Outputs: bool: True for revealed numbered cells
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return self.revealed[row][col] and self.board[row][col] not in (CELL_BLANK, CELL_MINE)
+
+    def _cached_move(self, kind: str, compute: Callable[[], tuple[str, Cell] | None]) -> tuple[str, Cell] | None:
+        """
+        Description: looks up a deterministic AI decision for the visible position in the shared
+        transposition table, computing and storing it on a miss
+        Inputs: kind (str): which strategy, compute (Callable): strategy to run on a miss
+        Outputs: tuple[str, Cell] | None: cached or computed decision
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        key = (kind, self.size.rows, self.size.cols, self.mines, self.zobrist)
+        move = TRANSPOSITION_TABLE.get(key)
+        if move is MISSING:
+            move = compute()
+            TRANSPOSITION_TABLE.put(key, move)
+        return move
 
     def place_mines(self, first_pos: BoardPos) -> None:
         """
@@ -291,20 +446,24 @@ class Board:
         first_pos: BoardPos object representing the first cell clicked by the user
         """
         # this implementation of place_mines will guarantee first click to be on a 0 cell for better playability
-        from random import randint
-        rows, cols = self.size.rows, self.size.cols
-        mines_placed = 0
-
-        # Place mines randomly until we reach the desired mine count
-        while mines_placed < self.mines:
-            r = randint(0, rows - 1)
-            c = randint(0, cols - 1)
-
-            # Ensure we don't place a mine on the first clicked cell or its adjacent cells
-            if (r not in [first_pos.x-1, first_pos.x, first_pos.x+1] or c not in [first_pos.y-1, first_pos.y, first_pos.y+1]) and self.board[r][c] != CELL_MINE:
-                self.board[r][c] = CELL_MINE
-                mines_placed += 1
+        randint = random.Random(self.seed).randint if self.seed is not None else random.randint
+        for r, c in draw_mines(randint, self.size.rows, self.size.cols, self.mines, (first_pos.x, first_pos.y)):
+            self.board[r][c] = CELL_MINE
  
+    def set_mines(self, cells: Iterable[Cell]) -> None:
+        """
+        Description: places mines at exactly the given cells and computes the counts, for layouts
+        produced elsewhere (e.g. the no-guess generator)
+        Inputs: cells (Iterable[Cell]): (row, col) of every mine
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        for r, c in cells:
+            self.board[r][c] = CELL_MINE
+        self.update_mine_counts()
+
     def update_mine_counts(self) -> None:
         """
         Description: updates the mine counts for each cell based on adjacent mines
@@ -318,27 +477,126 @@ class Board:
         Updates the mine counts for each cell based on adjacent mines.
         Called after placing mines.
         """
+        # Lazy boards count each cell on first use instead, and skip opening labels
+        if self.lazy_counts:
+            for r, c in self._counted:
+                if self.board[r][c] != CELL_MINE:
+                    self.board[r][c] = CELL_UNCOUNTED
+            self._counted = []
+            self.openings = []
+            self._opening_of = None
+            self.version += 1
+            return
+
         rows, cols = self.size.rows, self.size.cols
+        board = self.board
+        neighbors = self._neighbors.coords
 
         # Update counts for each cell
         for r in range(rows):
             for c in range(cols):
 
                 # Skip if it's a mine
-                if self.board[r][c] == CELL_MINE:
+                if board[r][c] == CELL_MINE:
                     continue
                 
-                # Count adjacent mines
+                # Count adjacent mines (neighbor table already excludes out-of-bounds cells)
                 count = 0
-                for dr, dc in DIRECTIONS:
-                    nPos = BoardPos(x=r + dr, y=c + dc)
-
-                    # Check bounds and if it's a mine
-                    if 0 <= nPos.x < rows and 0 <= nPos.y < cols and self.board[nPos.x][nPos.y] == CELL_MINE:
+                for nr, nc in neighbors[r * cols + c]:
+                    if board[nr][nc] == CELL_MINE:
                         count += 1
 
                 # Update the cell with the count
                 self.board[r][c] = count
+        self._label_openings()
+        self.version += 1
+
+    def __getstate__(self) -> dict:
+        """
+        Description: pickled state without the shared per-size tables and memoized results,
+        which are rebuilt or recomputed after loading
+        Inputs: None
+        Outputs: dict: attributes to pickle
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        state = self.__dict__.copy()
+        for name in ("_neighbors", "_zobrist_keys", "_analysis", "_hint"):
+            del state[name]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Description: restores a pickled board and reattaches the shared tables for its size
+        Inputs: state (dict): attributes from __getstate__
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self.__dict__.update(state)
+        self._neighbors = get_neighbor_table(self.size.rows, self.size.cols)
+        self._zobrist_keys = get_zobrist_keys(self.size.rows, self.size.cols)
+        self._analysis = None
+        self._hint = None
+
+    def count(self, row: int, col: int) -> int:
+        """
+        Description: value of a cell (CELL_MINE or its neighbor mine count), computing and storing
+        the count on first use when the board counts lazily
+        Inputs: row (int), col (int): cell to inspect
+        Outputs: int: cell value
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        value = self.board[row][col]
+        if value == CELL_UNCOUNTED:
+            value = 0
+            for nr, nc in self._neighbors.of(row, col):
+                if self.board[nr][nc] == CELL_MINE:
+                    value += 1
+            self.board[row][col] = value
+            self._counted.append((row, col))
+        return value
+
+    def _label_openings(self) -> None:
+        """
+        Description: labels every connected region of blank cells (an "opening") with BFS and stores
+        each opening's cells together with its numbered border, so revealing a blank cell can
+        uncover the whole precomputed region at once
+        Inputs: None
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        rows, cols = self.size.rows, self.size.cols
+        board = self.board
+        neighbors = self._neighbors.indices
+        label = array("i", [-1]) * (rows * cols)
+        openings: list[tuple[int, ...]] = []
+        for start in range(rows * cols):
+            if label[start] >= 0 or board[start // cols][start % cols] != CELL_BLANK:
+                continue
+            opening_id = len(openings)
+            label[start] = opening_id
+            region = [start]
+            border: set[int] = set()
+            queue = deque(region)
+            while queue:
+                cell = queue.popleft()
+                for n in neighbors[cell]:
+                    if board[n // cols][n % cols] != CELL_BLANK:
+                        border.add(n)
+                    elif label[n] < 0:
+                        label[n] = opening_id
+                        region.append(n)
+                        queue.append(n)
+            openings.append(tuple(region) + tuple(sorted(border)))
+        self._opening_of = label
+        self.openings = openings
 
     def flag_cell(self, pos: BoardPos) -> None:
         """
@@ -360,6 +618,12 @@ class Board:
         # Toggle flag state without modifying underlying board values
         self.flags[row][col] = not self.flags[row][col]
         self.flag_count += 1 if self.flags[row][col] else -1
+        if self.flags[row][col]:
+            self._hidden.discard(row * self.size.cols + col)
+        else:
+            self._hidden.add(row * self.size.cols + col)
+        self.zobrist ^= self._zobrist_keys.flag_key(row, col)
+        self.version += 1
 
     def reveal_cell(self, pos: BoardPos) -> bool:
         """
@@ -376,8 +640,20 @@ class Board:
         Returns False if a mine is revealed (game over), True otherwise.
         pos: BoardPos object representing the cell to reveal
         """
-        row, col = pos.x, pos.y
-        rows, cols = self.size.rows, self.size.cols
+        return self._reveal(pos.x, pos.y)
+
+    def _reveal(self, row: int, col: int) -> bool:
+        """
+        Description: reveals the cell at (row, col) using plain integer coordinates; blank cells
+        are expanded with an explicit stack instead of recursion
+        Inputs: row (int), col (int): position of the cell to reveal
+        Outputs: bool: False if a mine is revealed (game over), True otherwise
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        cols = self.size.cols
+        neighbors = self._neighbors.coords
 
         # Don't reveal flagged cells
         if self.flags[row][col]:
@@ -385,28 +661,150 @@ class Board:
 
         # If the cell is a mine, game over
         if self.board[row][col] == CELL_MINE:
-            self.revealed[row][col] = True
+            if not self.revealed[row][col]:
+                self.revealed[row][col] = True
+                self._hidden.discard(row * cols + col)
+                self.zobrist ^= self._zobrist_keys.value_key(row, col, CELL_MINE)
             self.isAlive = False
+            self.version += 1
             return False
-        
-        # If the cell is already revealed, do nothing
+
         if self.revealed[row][col]:
             return True
-        
-        # Reveal the cell
-        self.revealed[row][col] = True
-
-        # If the cell is blank, recursively reveal adjacent cells.
-        # IMPORTANT: Do not reveal mines during flood fill.
-        if self.board[row][col] == CELL_BLANK:
-            for dr, dc in DIRECTIONS:
-                nPos = BoardPos(x=row + dr, y=col + dc)
-                if 0 <= nPos.x < rows and 0 <= nPos.y < cols and not self.revealed[nPos.x][nPos.y]:
-                    # Skip revealing mines during expansion
-                    if self.board[nPos.x][nPos.y] != CELL_MINE:
-                        self.reveal_cell(nPos)
+        self.version += 1
+
+        # Blank cells uncover their precomputed opening in one pass
+        opening_id = -1 if self._opening_of is None else self._opening_of[row * cols + col]
+        if opening_id >= 0 and self.board[row][col] == CELL_BLANK:
+            opening = self.openings[opening_id]
+            if not any(self.revealed[i // cols][i % cols] or self.flags[i // cols][i % cols] for i in opening):
+                keys = self._zobrist_keys
+                for i in opening:
+                    r, c = divmod(i, cols)
+                    self.revealed[r][c] = True
+                    self._hidden.discard(i)
+                    self.zobrist ^= keys.value_key(r, c, self.board[r][c])
+                return True
+
+        # Reveal the cell and expand through blank cells.
+        # IMPORTANT: Do not reveal mines or flagged cells during flood fill.
+        stack = [(row, col)]
+        while stack:
+            r, c = stack.pop()
+            if self.revealed[r][c] or self.flags[r][c]:
+                continue
+            self.revealed[r][c] = True
+            self._hidden.discard(r * cols + c)
+            value = self.count(r, c)
+            self.zobrist ^= self._zobrist_keys.value_key(r, c, value)
+            if value != CELL_BLANK:
+                continue
+            for nr, nc in neighbors[r * cols + c]:
+                if not self.revealed[nr][nc] and self.board[nr][nc] != CELL_MINE:
+                    stack.append((nr, nc))
         return True
     
+    def rehash(self) -> None:
+        """
+        Description: recomputes the Zobrist hash and the hidden-cell index from scratch, for boards
+        whose matrices were edited directly instead of through reveal_cell/flag_cell
+        Inputs: None
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        keys = self._zobrist_keys
+        cols = self.size.cols
+        value = 0
+        for r in range(self.size.rows):
+            for c in range(cols):
+                if self.revealed[r][c]:
+                    value ^= keys.value_key(r, c, self.board[r][c])
+                    self._hidden.discard(r * cols + c)
+                elif self.flags[r][c]:
+                    value ^= keys.flag_key(r, c)
+                    self._hidden.discard(r * cols + c)
+                else:
+                    self._hidden.add(r * cols + c)
+        self.zobrist = value
+        self.version += 1
+
+    def analyze(self, deadline: float | None = None) -> Analysis:
+        """
+        Description: returns the solver analysis (safe cells, mines, probabilities) of the visible
+        board, memoized until the board changes. Results cut short by the deadline are not cached.
+        Inputs: deadline (float | None): time.monotonic() limit for the solver
+        Outputs: Analysis: solver result for the current version
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        if self._analysis is not None and self._analysis[0] == self.version:
+            return self._analysis[1]
+        # Other boards (or earlier games) may already have analysed this exact position
+        key = ("analysis", self.size.rows, self.size.cols, self.mines, self.zobrist)
+        analysis = TRANSPOSITION_TABLE.get(key)
+        if analysis is MISSING:
+            analysis = analyze(self, deadline=deadline)
+            if analysis.timed_out:
+                return analysis
+            TRANSPOSITION_TABLE.put(key, analysis)
+        self._analysis = (self.version, analysis)
+        return analysis
+
+    def hint(self) -> HintModel:
+        """
+        Description: builds the hint payload (safe cells, mines, probability heatmap) for the
+        visible board, memoized until the board changes and shared with every board showing the
+        same position, so boards reloaded from a store do not rebuild it
+        Inputs: None
+        Outputs: HintModel: hint for the current version
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        if self._hint is not None and self._hint[0] == self.version:
+            return self._hint[1]
+        key = ("hint", self.size.rows, self.size.cols, self.mines, self.zobrist)
+        hint = TRANSPOSITION_TABLE.get(key)
+        if hint is MISSING:
+            hint = self._build_hint()
+            TRANSPOSITION_TABLE.put(key, hint)
+        # Only the version differs between boards showing the same position
+        hint = hint.model_copy(update={"version": self.version})
+        self._hint = (self.version, hint)
+        return hint
+
+    def _build_hint(self) -> HintModel:
+        """
+        Description: builds the hint payload from the solver analysis of the visible board
+        Inputs: None
+        Outputs: HintModel: hint without a board version
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        analysis = self.analyze()
+        rows, cols = self.size.rows, self.size.cols
+        probabilities = [
+            [None if self.revealed[r][c] else analysis.probabilities.get((r, c)) for c in range(cols)]
+            for r in range(rows)
+        ]
+        # Error bounds only exist for sampled probabilities
+        uncertainty = [
+            [analysis.uncertainty.get((r, c)) for c in range(cols)]
+            for r in range(rows)
+        ] if analysis.uncertainty else None
+        return HintModel(
+            ok=True,
+            safe=[_to_pos(cell) for cell in sorted(analysis.safe)],
+            mines=[_to_pos(cell) for cell in sorted(analysis.mines)],
+            probabilities=probabilities,
+            uncertainty=uncertainty,
+            exact=analysis.exact,
+        )
+
     def check_win(self) -> bool:
         """
         Description: checks if the player has won the game (all non-mine cells revealed)
@@ -428,72 +826,45 @@ class Board:
                     return False
         return True
     
-    def _print_column_titles(self) -> None:
-        """
-        Description: prints the column titles for the board
-        Inputs: None
-        Outputs: None
-        Author(s): Riley Meyerkorth, Aiden Burke
-        Creation Date: 1 September 2025
+    def glyphs(self, show_mines: bool = False) -> list[str]:
+        """
+        Description: one display character per cell, row-major: counts and mines for revealed
+        cells, flags, and the unrevealed marker for the rest
+        Inputs: show_mines (bool): show hidden mines as well (for debugging and game over)
+        Outputs: list[str]: rows * cols glyphs
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
         External Sources: N/A
         """
-        """
-        Prints the column titles for the board.
-        """
-        print(f"    ", end='')
-        for i in range(self.size.cols): # number of columns
-            print(f"| {i+1} ", end='')
-        print("|")
-        print((self.size.cols*4+4)*"-")
-
-    def _print_row(self, row: int, show_mines: bool) -> None:
-        """
-        Description: prints a single row of the board
-        Inputs: row (int): the row index to print, show_mines (bool): whether to show mines (for debugging)
-        Outputs: None
-        Author(s): Riley Meyerkorth, Aiden Burke
-        Creation Date: 1 September 2025
-        External Sources: N/A
-        """
-        """
-        Prints a single row of the board.
-        row: int representing the row index to print
-        """
-        print(f"{ROW_TITLES[row]} |", end=' ')
-        for col in range(self.size.cols): # number of columns
-            if self.revealed[row][col]:
-                if self.board[row][col] == CELL_MINE:
-                    print(f"  {CHAR_MINE}", end=' ')
+        glyphs = []
+        for r in range(self.size.rows):
+            revealed, flags, values = self.revealed[r], self.flags[r], self.board[r]
+            for c in range(self.size.cols):
+                if revealed[c]:
+                    value = self.count(r, c)
+                    glyphs.append(CHAR_MINE if value == CELL_MINE else str(value))
+                elif flags[c]:
+                    glyphs.append(CHAR_FLAG)
+                elif show_mines and values[c] == CELL_MINE:
+                    glyphs.append(CHAR_MINE)
                 else:
-                    print(f"  {self.board[row][col]}", end=' ')
-            else:
-                print(f"  {CHAR_UNREVEALED}", end=' ')
-            # else:
-            #     if show_mines and self.board[r][c] == CELL_MINE:
-            #         print('X', end=' ')
-            #     else:
-            #         print(self.board[r][c], end=' ')
-        print()
+                    glyphs.append(CHAR_UNREVEALED)
+        return glyphs
 
-    
-    def print_board(self, show_mines: bool = False) -> None:
+    def print_board(self, show_mines: bool = False, renderer: TerminalRenderer | None = None) -> None:
         """
-        Description: prints the board to console
-        Inputs: show_mines (bool): whether to show mines (for debugging)
+        Description: prints the board to console as one buffered frame
+        Inputs: show_mines (bool): whether to show mines (for debugging),
+                renderer (TerminalRenderer | None): renderer to draw with, so repeated draws can
+                update in place; a plain one is used when not given
         Outputs: None
         Author(s): Riley Meyerkorth, Aiden Burke
         Creation Date: 1 September 2025
         External Sources: N/A
         """
-        """
-        Prints the board to console.
-        Primarily for debugging purposes.
-        """
-        self._print_column_titles()
-
-        # Print each row
-        for r in range(self.size.rows): # number of rows
-            self._print_row(r, show_mines)
+        if renderer is None:
+            renderer = TerminalRenderer(self.size.rows, self.size.cols)
+        renderer.draw(self.glyphs(show_mines))
 
     def to_dict(self, reveal_all: bool = False) -> BoardStateModel:
         """
@@ -515,7 +886,7 @@ class Board:
         for r in range(rows):
             for c in range(cols):
                 if self.revealed[r][c] or reveal_all:
-                    board[r][c] = self.board[r][c]
+                    board[r][c] = self.count(r, c)
                 else:
                     board[r][c] = None
 
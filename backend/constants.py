@@ -8,10 +8,14 @@ Author(s): Riley Meyerkorth
 Creation Date: 10 September 2025
 """
 
+import os
+
 ### API CONFIG
 API_HOST = "0.0.0.0"
 API_PORT = 8000
 API_PREFIX = "/api"
+# Worker processes for `python -m backend.server`; more than one needs a shared game store
+API_WORKERS = int(os.environ.get("MINESWEEPER_WORKERS", "1"))
 
 class APIRoutes:
     """
@@ -27,6 +31,11 @@ class APIRoutes:
     API_ROUTE_STATE = f"{API_PREFIX}/state"
     API_ROUTE_CLICK = f"{API_PREFIX}/click"
     API_ROUTE_FLAG = f"{API_PREFIX}/flag"
+    API_ROUTE_HINT = f"{API_PREFIX}/hint"
+    API_ROUTE_STORE_STATS = f"{API_PREFIX}/store/stats"
+    API_ROUTE_SPECTATE = f"{API_PREFIX}/spectate"
+    API_ROUTE_LEADERBOARD = f"{API_PREFIX}/stats/leaderboard"
+    API_ROUTE_PROFILE = f"{API_PREFIX}/stats/profile"
 
 ### VISUALS
 CHAR_MINE = '*'
@@ -48,12 +57,120 @@ MAX_COLS = 20
 MIN_MINES = 10
 MAX_MINES = 20
 
+### AI
+AI_DIFFICULTIES = ("easy", "medium", "hard")
+AI_DEFAULT_DEADLINE_MS = 250    # per-move search budget unless the game or request sets one
+AI_MAX_DEADLINE_MS = 5_000
+
+### SOLVER
+# Search nodes allowed when enumerating one frontier component
+SOLVER_NODE_BUDGET = 200_000
+# Monte Carlo fallback for frontiers too large to enumerate
+MC_SAMPLES = 2_000      # chain steps recorded per estimate
+MC_BURN_IN = 200        # chain steps discarded before recording
+MC_BATCHES = 20         # batches used for the error bounds
+MC_BLOCK_SIZE = 16       # frontier cells re-drawn together per step
+# Entries kept in the process-wide AI/solver transposition table
+TRANSPOSITION_TABLE_SIZE = 65_536
+
+### NO-GUESS GENERATION
+NO_GUESS_POOL_CAPACITY = 8      # layouts kept ready per (rows, cols, mines)
+NO_GUESS_POOL_WORKERS = 2       # background generator processes
+NO_GUESS_ATTEMPTS = 200         # random layouts a worker tries per job
+
+### PATTERN DATABASE
+# Generated on first use (or offline with `python -m backend.patterns`)
+PATTERN_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "patterns.bin")
+
+### BOARD CORPUS
+CORPUS_WORKERS = os.cpu_count() or 1  # processes dealing boards for `python -m backend.corpus`
+CORPUS_CHUNK = 1_024            # boards a worker deals per task
+
+### CO-OP SIMULATOR
+SIM_WORKERS = os.cpu_count() or 1   # processes playing tournament matches
+SIM_CHUNK = 50                  # matches of one pairing a worker plays per task
+
+### GAME STORE
+# "memory" keeps games in the worker process, "sqlite" shares them between workers
+GAME_STORE = os.environ.get("MINESWEEPER_STORE", "sqlite" if API_WORKERS > 1 else "memory")
+GAME_STORE_PATH = os.environ.get(
+    "MINESWEEPER_STORE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "games.sqlite3"),
+)
+GAME_COOKIE = "game_id"
+GAME_STORE_RETRIES = 5          # attempts before a request that keeps losing version races gives up
+GAME_STORE_BUSY_TIMEOUT_MS = 5_000
+# The memory store moves idle games to compressed files and reloads them on their next request
+GAME_HIBERNATE_PATH = os.environ.get(
+    "MINESWEEPER_HIBERNATE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "hibernated"),
+)
+GAME_IDLE_SECONDS = 600         # games untouched this long are hibernated
+GAME_MEMORY_BUDGET = int(os.environ.get("MINESWEEPER_MEMORY_BUDGET", str(64 * 1024 * 1024)))  # bytes of resident games
+GAME_HIBERNATE_LEVEL = 6        # zlib level for hibernated games
+# Games nobody touched for this long are deleted, resident, hibernated or in the database
+GAME_EXPIRE_SECONDS = int(os.environ.get("MINESWEEPER_GAME_TTL", str(24 * 60 * 60)))
+GAME_EXPIRE_INTERVAL = 60       # seconds between expiry sweeps of one store
+
+### REPLAYS
+# Finished games are appended here; set MINESWEEPER_REPLAY_PATH to an empty string to stop recording
+REPLAY_PATH = os.environ.get(
+    "MINESWEEPER_REPLAY_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "replays"),
+)
+REPLAY_MAGIC = b"MSRP\x01"      # file signature and format version
+REPLAY_FILE_BYTES = 64 * 1024 * 1024  # replay files roll over at this size
+REPLAY_READ_CHUNK = 1 << 20     # bytes the reader pulls from a file at a time
+
+### STATISTICS
+# Finished games are recorded here for leaderboards and profiles; set MINESWEEPER_STATS_PATH to an empty string to turn it off
+STATS_PATH = os.environ.get(
+    "MINESWEEPER_STATS_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "stats.sqlite3"),
+)
+PLAYER_COOKIE = "player_id"     # long-lived cookie identifying a player across games
+PLAYER_COOKIE_MAX_AGE = 10 * 365 * 24 * 3600
+PLAYER_NAME_MAX_LENGTH = 24
+DEFAULT_PLAYER_NAME = "Anonymous"
+STATS_BATCH_SIZE = 256          # most finished games committed in one transaction
+STATS_FLUSH_SECONDS = 0.5       # longest a finished game waits for its batch to fill
+STATS_QUEUE_SIZE = 10_000       # finished games queued before new ones are dropped
+LEADERBOARD_SIZE = 10           # entries returned unless the request asks for more
+LEADERBOARD_MAX_SIZE = 100
+
+### ADMISSION CONTROL
+MOVE_RATE = 20.0                # requests per second a game may sustain
+MOVE_BURST = 40                 # requests a game may send at once after being idle
+AI_MOVE_COST = 5                # tokens an AI move takes from its game's bucket
+NEW_GAME_RATE = 1.0             # new games per second a client may sustain
+NEW_GAME_BURST = 10
+MAX_PENDING_MOVES = 4           # requests allowed in flight (running or waiting) per game
+AI_CONCURRENCY = 4              # AI moves computed at once per worker
+GENERATION_CONCURRENCY = 2      # games created or no-guess boards searched at once per worker
+ADMISSION_WAIT_SECONDS = 0.25   # wait for a busy AI or generation slot before answering 503
+ADMISSION_MAX_BUCKETS = 100_000 # token buckets remembered before the least recently used are dropped
+
+### SPECTATORS
+SPECTATOR_QUEUE_SIZE = 4        # frames buffered per spectator before the oldest are dropped
+SPECTATOR_POLL_SECONDS = 1.0    # how often a spectator stream checks the store for moves made by other workers
+
+### INFINITE BOARD
+CHUNK_SIZE = 16                 # chunks are CHUNK_SIZE x CHUNK_SIZE cells
+CHUNK_MINE_DENSITY = 0.16       # share of each chunk's cells that are mines
+CHUNK_CACHE_SIZE = 256          # chunks kept in memory before clean ones are evicted
+INFINITE_FLOOD_LIMIT = 10_000   # most cells a single reveal may uncover
+
 ### GAME_DATA
 CELL_MINE = -1
 CELL_BLANK = 0
+CELL_UNCOUNTED = -2    # safe cell whose count has not been computed yet (lazy-count boards)
 
 ### INPUT
 KEY_QUIT = 'q'
+# Move scripts for the headless CLI (`python -m backend.main --script moves.txt`)
+SCRIPT_FLAG = 'f'               # "f A5" flags A5
+SCRIPT_NEW_GAME = 'new'         # "new [seed]" starts the next game
+SCRIPT_COMMENT = '#'
 
 ### UTILS
 LETTER_TO_ROW = {chr(i + ord('A')): i for i in range(DEFAULT_ROWS)}
@@ -8,14 +8,102 @@ Author(s): Riley Meyerkorth
 Creation Date: 10 September 2025
 """
 
-from .board import Board
-from .models import BoardPos
+import random
+import time
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+from .engine import BoardEngine, create_engine
+from .models import BoardEngineType, BoardPos, BoardSize
+from .render import TerminalRenderer, parse_row_label
 from .constants import (
+    DEFAULT_COLS,
     DEFAULT_MINE_COUNT,
+    DEFAULT_ROWS,
     KEY_QUIT,
-    LETTER_TO_ROW
+    SCRIPT_COMMENT,
+    SCRIPT_FLAG,
+    SCRIPT_NEW_GAME
 )
 
+
+class GameResult(NamedTuple):
+    """
+    Description: Outcome of one headless game. `result` is "won", "lost", "quit" (the script
+    asked to quit) or "unfinished" (the moves ran out first)
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    result: str
+    moves: int
+    seconds: float
+    seed: Optional[int]
+
+
+class ScriptedGame(NamedTuple):
+    """
+    Description: One game of a move script: its seed (None for a random board) and its moves as
+    ("reveal" | "flag" | "quit", position) pairs
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    seed: Optional[int]
+    moves: list[tuple[str, Optional[BoardPos]]]
+
+
+def parse_cell(text: str) -> BoardPos:
+    """
+    Description: parses a cell written as a row label and a 1-based column, e.g. "A5" or "AB12"
+    Inputs: text (str): cell as typed by the player
+    Outputs: BoardPos: position of the cell; raises ValueError if it cannot be read
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    text = text.strip()
+    letters = len(text) - len(text.lstrip("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"))
+    if not letters or not text[letters:].isdigit() or int(text[letters:]) < 1:
+        raise ValueError(f"Not a cell: {text!r}")
+    return BoardPos(x=parse_row_label(text[:letters]), y=int(text[letters:]) - 1)
+
+
+def parse_script(lines: Iterable[str]) -> list[ScriptedGame]:
+    """
+    Description: reads a move script. Each line is a cell to reveal ("A5"), a flag ("F A5"),
+    "q" to quit, or "new [seed]" to start the next game; text after "#" is ignored. Moves before
+    the first "new" belong to a first game with a random board
+    Inputs: lines (Iterable[str]): script lines
+    Outputs: list[ScriptedGame]: games in script order; raises ValueError naming the bad line
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    games: list[ScriptedGame] = []
+    for number, line in enumerate(lines, start=1):
+        words = line.split(SCRIPT_COMMENT, 1)[0].split()
+        if not words:
+            continue
+        command = words[0].lower()
+        try:
+            if command == SCRIPT_NEW_GAME:
+                games.append(ScriptedGame(int(words[1]) if len(words) > 1 else None, []))
+                continue
+            if not games:
+                games.append(ScriptedGame(None, []))
+            if command == KEY_QUIT:
+                games[-1].moves.append(("quit", None))
+            elif command == SCRIPT_FLAG and len(words) == 2:
+                games[-1].moves.append(("flag", parse_cell(words[1])))
+            elif len(words) == 1:
+                games[-1].moves.append(("reveal", parse_cell(words[0])))
+            else:
+                raise ValueError(f"Unknown command: {line.strip()!r}")
+        except ValueError as e:
+            raise ValueError(f"line {number}: {e}") from None
+    return games
+
+
 class Controller:
     """
     Description: A controller for the Minesweeper game.
@@ -27,8 +115,14 @@ class Controller:
     A controller for the Minesweeper game.
     Mainly just runs a simple CLI game loop for testing.
     """
-    def __init__(self):
-        self._board: Board = Board(DEFAULT_MINE_COUNT)
+    def __init__(self, mines: int = DEFAULT_MINE_COUNT, size: BoardSize | None = None,
+                 engine: BoardEngineType = BoardEngineType.LIST, ansi: bool = False):
+        self._mines: int = mines
+        self._size: BoardSize = size if size is not None else BoardSize(DEFAULT_ROWS, DEFAULT_COLS)
+        self._engine: BoardEngineType = engine
+        self._board: BoardEngine = create_engine(engine, mines, size=self._size)
+        # ANSI redraws the board in place instead of printing a new one after every move
+        self._renderer: TerminalRenderer = TerminalRenderer(self._size.rows, self._size.cols, ansi)
         self._row: int = 0
         self._col: int = 0
         self._pos: BoardPos = BoardPos(x=self._row, y=self._col)
@@ -40,7 +134,7 @@ class Controller:
         """
         # Initialize game
         self._init_game()
-        
+
         # Main game loop
         self._running = True
         while self._running:
@@ -52,13 +146,12 @@ class Controller:
         The first click determines mine placement.
         """
         # Init board
-        self._board.print_board()
+        self._board.print_board(renderer=self._renderer)
 
         # First click: place mines around it and compute counts
         first_click = input("Enter your first click (e.g. A5): ")
-        self._row = LETTER_TO_ROW[first_click[0].upper()]
-        self._col = int(first_click[1:]) - 1
-        self._pos = BoardPos(x=self._row, y=self._col)
+        self._pos = parse_cell(first_click)
+        self._row, self._col = self._pos.x, self._pos.y
 
         # Place mines and reveal first cell
         self._board.place_mines(self._pos)
@@ -71,23 +164,111 @@ class Controller:
         The function that runs every game loop iteration.
         Returns True if the game should continue, False if it should end.
         """
-        self._board.print_board()
+        self._board.print_board(renderer=self._renderer)
         click = input(f"Enter your next click (e.g. A5), or '{KEY_QUIT}' to quit: ")
         if click.lower() == KEY_QUIT:
             return False
-        row = LETTER_TO_ROW[click[0].upper()]
-        col = int(click[1:]) - 1
-        pos = BoardPos(x=row, y=col)
+        pos = parse_cell(click)
         if not self._board.reveal_cell(pos):
-            self._board.print_board(show_mines=True)
+            self._board.print_board(show_mines=True, renderer=self._renderer)
             print("Game Over! You hit a mine.")
             return False
-        
+
         # Check for win after a successful reveal
         if self._board.check_win():
             print("Congratulations! You cleared the board.")
-            self._board.print_board(show_mines=True)
+            self._board.print_board(show_mines=True, renderer=self._renderer)
             return False
 
         # Continue the game loop
         return True
+
+    def play(self, moves: Iterable[tuple[str, Optional[BoardPos]]], seed: Optional[int] = None,
+             watch: bool = False) -> GameResult:
+        """
+        Description: plays one game on a fresh board without rendering. The first reveal deals
+        the mines, as in the interactive game; moves outside the board are skipped
+        Inputs: moves (Iterable): ("reveal" | "flag" | "quit", position) pairs, consumed lazily so
+                they may depend on the board, seed (int | None): board seed, None for a random board,
+                watch (bool): draw the board after every move after all
+        Outputs: GameResult: outcome, moves applied and time taken
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self._board = create_engine(self._engine, self._mines, size=self._size, seed=seed)
+        rows, cols = self._size.rows, self._size.cols
+        placed = False
+        count = 0
+        result = "unfinished"
+        start = time.perf_counter()
+        for action, pos in moves:
+            if action == "quit":
+                result = "quit"
+                break
+            if pos is None or not (0 <= pos.x < rows and 0 <= pos.y < cols):
+                continue
+            count += 1
+            if action == "flag":
+                self._board.flag_cell(pos)
+            else:
+                if not placed:
+                    self._board.place_mines(pos)
+                    self._board.update_mine_counts()
+                    placed = True
+                if not self._board.reveal_cell(pos):
+                    result = "lost"
+                # every covered cell left is a mine (flags only cover cells), which check_win would scan for
+                elif self._board.hidden_count + self._board.flag_count == self._mines:
+                    result = "won"
+            if watch:
+                self._board.print_board(show_mines=result != "unfinished", renderer=self._renderer)
+            if result != "unfinished":
+                break
+        return GameResult(result, count, time.perf_counter() - start, seed)
+
+    def ai_moves(self, difficulty: str) -> Iterator[tuple[str, Optional[BoardPos]]]:
+        """
+        Description: endless moves chosen by the AI on the board being played, for play()
+        Inputs: difficulty (str): one of AI_DIFFICULTIES ("easy" plays at random)
+        Outputs: Iterator: moves until the AI has nothing left to play
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        while True:
+            action, pos = self._board.ai_move(difficulty)
+            if pos is None:
+                return
+            yield action, pos
+
+    def run_script(self, games: Iterable[ScriptedGame], watch: bool = False) -> Iterator[GameResult]:
+        """
+        Description: plays every game of a parsed move script headlessly
+        Inputs: games (Iterable[ScriptedGame]): games from parse_script, watch (bool): draw every move
+        Outputs: Iterator[GameResult]: one result per game, as each finishes
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        for game in games:
+            yield self.play(game.moves, game.seed, watch)
+
+    def run_random(self, games: int, seed: int = 0, difficulty: str = "easy", watch: bool = False) -> Iterator[GameResult]:
+        """
+        Description: plays `games` headless games with the AI picking every move. Game i uses
+        board seed `seed + i` and the random AI picks are seeded too, so runs are repeatable
+        Inputs: games (int): number of games, seed (int): first board seed,
+                difficulty (str): AI difficulty making the moves, watch (bool): draw every move
+        Outputs: Iterator[GameResult]: one result per game, as each finishes
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        saved = random.getstate()
+        try:
+            for game in range(seed, seed + games):
+                random.seed(game)
+                yield self.play(self.ai_moves(difficulty), game, watch)
+        finally:
+            random.setstate(saved)
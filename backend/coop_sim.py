@@ -0,0 +1,380 @@
+"""
+Name: coop_sim.py
+Description: Headless co-op matches and tournaments. Two strategies take turns on one board through
+handle_player_move, handle_player_flag and check_coop_win, with the same turn, elimination and
+draw rules as the server's co-op games. Tournaments play every ordered pairing of strategies on
+seeded boards across worker processes and report the outcome distribution of each pairing along
+with throughput, so co-op balance can be tuned without anyone playing. Searching strategies get no
+deadline unless one is asked for, so the solver's node and sample budgets alone bound their moves
+and a seeded tournament gives the same outcomes on any machine.
+Inputs: None
+Outputs: None
+External Sources: N/A
+Author(s): Riley Meyerkorth
+Creation Date: 19 October 2026
+"""
+
+import random
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import product
+from typing import Callable, NamedTuple
+
+from .constants import DEFAULT_COLS, DEFAULT_MINE_COUNT, DEFAULT_ROWS, SIM_CHUNK, SIM_WORKERS
+from .engine import BoardEngine, create_engine
+from .models import BoardEngineType, BoardPos, BoardSize, GameMode, PlayerType
+
+# A strategy picks the move for whoever's turn it is: ("flag" or "reveal", position), or
+# ("none", None) when it has nothing to play. The float is the time.monotonic() search deadline,
+# None when the search is only bounded by the solver's budgets.
+Strategy = Callable[[BoardEngine, float | None], tuple[str, BoardPos | None]]
+
+# Strategies by name; register_strategy adds more
+STRATEGIES: dict[str, Strategy] = {}
+
+# Outcomes of a match, from the seat's point of view
+OUTCOMES = ("first", "second", "draw", "stalled")
+
+
+def register_strategy(name: str) -> Callable[[Strategy], Strategy]:
+    """
+    Description: decorator that makes a strategy selectable by name in tournaments
+    Inputs: name (str): name the strategy is selected by
+    Outputs: Callable: decorator returning the strategy unchanged
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    def register(strategy: Strategy) -> Strategy:
+        STRATEGIES[name] = strategy
+        return strategy
+    return register
+
+
+@register_strategy("easy")
+def easy(board: BoardEngine, deadline: float | None) -> tuple[str, BoardPos | None]:
+    """
+    Description: strategy that reveals a random hidden cell (the easy AI)
+    Inputs: board (BoardEngine): board to move on,
+            deadline (float | None): time.monotonic() value to finish by, None for no limit
+    Outputs: tuple[str, BoardPos | None]: ("flag" or "reveal", position), position None if there is no move
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    return board.ai_move("easy")
+
+
+@register_strategy("medium")
+def medium(board: BoardEngine, deadline: float | None) -> tuple[str, BoardPos | None]:
+    """
+    Description: strategy that applies the neighbor flag/reveal rules, else plays at random (the medium AI)
+    Inputs: board (BoardEngine): board to move on,
+            deadline (float | None): time.monotonic() value to finish by, None for no limit
+    Outputs: tuple[str, BoardPos | None]: ("flag" or "reveal", position), position None if there is no move
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    return board.ai_move("medium")
+
+
+@register_strategy("hard")
+def hard(board: BoardEngine, deadline: float | None) -> tuple[str, BoardPos | None]:
+    """
+    Description: strategy that plays solver moves, else the cell least likely to be a mine (the hard AI)
+    Inputs: board (BoardEngine): board to move on,
+            deadline (float | None): time.monotonic() value to finish by, None for no limit
+    Outputs: tuple[str, BoardPos | None]: ("flag" or "reveal", position), position None if there is no move
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    return board.ai_move("hard", deadline)
+
+
+@register_strategy("safe")
+def safe(board: BoardEngine, deadline: float | None) -> tuple[str, BoardPos | None]:
+    """
+    Description: hard AI that never spends a turn on a flag: reveals proven safe cells, else guesses
+    Inputs: board (BoardEngine): board to move on,
+            deadline (float | None): time.monotonic() value to finish by, None for no limit
+    Outputs: tuple[str, BoardPos | None]: ("reveal", position), position None if there is no move
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    analysis = board.analyze(deadline)
+    if analysis.safe:
+        r, c = min(analysis.safe)
+        return ("reveal", BoardPos(x=r, y=c))
+    action, pos = board.ai_move("hard", deadline)
+    if action == "flag":
+        return board.ai_move("easy")
+    return action, pos
+
+
+class MatchResult(NamedTuple):
+    """
+    Description: Result of one co-op match. `outcome` is one of OUTCOMES: the seat that survived
+    when the other hit a mine, "draw" when the board was cleared, or "stalled" when the move
+    limit ran out or the player to move had nothing to play.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    outcome: str
+    moves: int
+    flags: int
+    revealed: float     # share of the safe cells uncovered when the match ended
+    seconds: float
+
+
+def play_match(first: str, second: str, rows: int = DEFAULT_ROWS, cols: int = DEFAULT_COLS,
+               mines: int = DEFAULT_MINE_COUNT, seed: int = 0,
+               engine: BoardEngineType = BoardEngineType.LIST,
+               deadline_ms: int | None = None) -> MatchResult:
+    """
+    Description: plays one co-op match. `first` moves as the human (who opens the game), `second`
+    as the AI. Mines are dealt on the first reveal, from the match seed, exactly as the server
+    deals them for the opening click; random strategies also draw from the match seed. Without a
+    deadline the match depends on nothing but its seed
+    Inputs: first, second (str): strategy names, rows, cols, mines (int): board configuration,
+            seed (int): match seed, engine (BoardEngineType): board engine,
+            deadline_ms (int | None): wall-clock search budget per move for strategies that search,
+            None to bound searches by the solver's node and sample budgets only
+    Outputs: MatchResult: outcome and move counts
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    rng = random.Random(f"coop:{seed}")
+    board = create_engine(engine, mines, GameMode.COOP, BoardSize(rows, cols), seed=rng.getrandbits(63))
+    seats = {PlayerType.HUMAN: STRATEGIES[first], PlayerType.AI: STRATEGIES[second]}
+    names = {PlayerType.HUMAN: "first", PlayerType.AI: "second"}
+    # flags can be toggled back and forth, so a match that makes no progress is cut off
+    limit = 4 * rows * cols
+    placed = False
+    moves = flags = 0
+    outcome = "stalled"
+    # the random AI picks draw from the global random module
+    saved = random.getstate()
+    random.seed(rng.getrandbits(64))
+    start = time.perf_counter()
+    try:
+        while moves < limit:
+            player = board.current_player
+            deadline = time.monotonic() + deadline_ms / 1000 if deadline_ms is not None else None
+            action, pos = seats[player](board, deadline)
+            if pos is None:
+                break
+            moves += 1
+            if action == "flag":
+                # flagging uses up the player's turn
+                board.handle_player_flag(pos, player)
+                flags += 1
+            else:
+                if not placed:
+                    board.place_mines(pos)
+                    board.update_mine_counts()
+                    placed = True
+                board.handle_player_move(pos, player)
+            if board.check_coop_win():
+                outcome = "draw"
+                break
+            if board.game_over:
+                outcome = names[board.winner]
+                break
+    finally:
+        random.setstate(saved)
+    seconds = time.perf_counter() - start
+    # a lost match revealed one mine, every other mine is still covered
+    covered_mines = mines - (outcome in ("first", "second"))
+    safe_cells = rows * cols - mines
+    revealed = (safe_cells - (board.hidden_count + board.flag_count - covered_mines)) / safe_cells if placed else 0.0
+    return MatchResult(outcome, moves, flags, revealed, seconds)
+
+
+@dataclass
+class PairingStats:
+    """
+    Description: Outcome distribution of one ordered pairing in a tournament
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    first: str
+    second: str
+    outcomes: Counter = field(default_factory=Counter)
+    games: int = 0
+    moves: int = 0
+    flags: int = 0
+    revealed: float = 0.0
+    seconds: float = 0.0
+
+    def add(self, result: MatchResult) -> None:
+        """
+        Description: folds one match into the totals
+        Inputs: result (MatchResult): finished match
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self.outcomes[result.outcome] += 1
+        self.games += 1
+        self.moves += result.moves
+        self.flags += result.flags
+        self.revealed += result.revealed
+        self.seconds += result.seconds
+
+    def merge(self, other: "PairingStats") -> None:
+        """
+        Description: adds the totals of another batch of the same pairing
+        Inputs: other (PairingStats): batch to add
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self.outcomes.update(other.outcomes)
+        self.games += other.games
+        self.moves += other.moves
+        self.flags += other.flags
+        self.revealed += other.revealed
+        self.seconds += other.seconds
+
+    def share(self, outcome: str) -> float:
+        """
+        Description: fraction of the pairing's games that ended with `outcome`
+        Inputs: outcome (str): one of OUTCOMES
+        Outputs: float: share between 0 and 1
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return self.outcomes[outcome] / self.games if self.games else 0.0
+
+
+@dataclass
+class TournamentReport:
+    """
+    Description: Results of a tournament: one PairingStats per ordered pairing, plus wall-clock
+    time for the throughput figures
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    pairings: dict[tuple[str, str], PairingStats]
+    wall_seconds: float
+
+    @property
+    def games(self) -> int:
+        """
+        Description: games played over every pairing
+        Inputs: None
+        Outputs: int: game count
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return sum(stats.games for stats in self.pairings.values())
+
+    @property
+    def moves(self) -> int:
+        """
+        Description: moves played over every pairing
+        Inputs: None
+        Outputs: int: move count
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return sum(stats.moves for stats in self.pairings.values())
+
+    def format(self) -> str:
+        """
+        Description: plain-text table of every pairing and the overall throughput
+        Inputs: None
+        Outputs: str: report
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        lines = [f"{'first':>8} {'second':>8} {'games':>7} {'first':>7} {'second':>7} {'draw':>7} {'stalled':>7} {'moves':>7} {'cleared':>7}"]
+        for (first, second), stats in sorted(self.pairings.items()):
+            shares = " ".join(f"{stats.share(outcome):>7.1%}" for outcome in OUTCOMES)
+            lines.append(f"{first:>8} {second:>8} {stats.games:>7} {shares} "
+                         f"{stats.moves / max(stats.games, 1):>7.1f} {stats.revealed / max(stats.games, 1):>7.1%}")
+        lines.append(f"{self.games} games, {self.moves} moves in {self.wall_seconds:.2f}s "
+                     f"({self.games / self.wall_seconds:.0f} games/s, {self.moves / self.wall_seconds:.0f} moves/s)")
+        return "\n".join(lines)
+
+
+def _play_batch(first: str, second: str, seeds: range, rows: int, cols: int, mines: int,
+                engine: BoardEngineType, deadline_ms: int | None) -> PairingStats:
+    """
+    Description: plays one pairing over a range of match seeds; runs in the worker processes
+    Inputs: first, second (str): strategy names, seeds (range): match seeds,
+            rows, cols, mines (int): board configuration, engine (BoardEngineType): board engine,
+            deadline_ms (int | None): wall-clock search budget per move, None for none
+    Outputs: PairingStats: totals of the batch
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    stats = PairingStats(first, second)
+    for seed in seeds:
+        stats.add(play_match(first, second, rows, cols, mines, seed, engine, deadline_ms))
+    return stats
+
+
+def run_tournament(strategies: list[str], games: int, rows: int = DEFAULT_ROWS, cols: int = DEFAULT_COLS,
+                   mines: int = DEFAULT_MINE_COUNT, seed: int = 0,
+                   engine: BoardEngineType = BoardEngineType.LIST,
+                   deadline_ms: int | None = None, workers: int = SIM_WORKERS) -> TournamentReport:
+    """
+    Description: plays `games` matches for every ordered pairing of `strategies` (self-play
+    included). Every pairing plays the same match seeds, so pairings are compared on the same
+    boards and swapping seats isolates the advantage of moving first. Without a deadline the
+    report's outcomes depend only on the seed, not on machine load or the number of workers
+    Inputs: strategies (list[str]): strategy names, games (int): matches per pairing,
+            rows, cols, mines (int): board configuration, seed (int): tournament seed,
+            engine (BoardEngineType): board engine,
+            deadline_ms (int | None): wall-clock search budget per move, None for none,
+            workers (int): processes (1 plays in this process)
+    Outputs: TournamentReport: per-pairing outcome distributions and timing
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    for name in strategies:
+        if name not in STRATEGIES:
+            raise ValueError(f"Unknown strategy: {name}")
+    base = seed * games
+    jobs = [(first, second, range(start, min(start + SIM_CHUNK, base + games)))
+            for first, second in product(strategies, repeat=2)
+            for start in range(base, base + games, SIM_CHUNK)]
+    pairings = {(first, second): PairingStats(first, second) for first, second in product(strategies, repeat=2)}
+    start = time.perf_counter()
+    if workers <= 1 or len(jobs) == 1:
+        batches = [_play_batch(*job, rows, cols, mines, engine, deadline_ms) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_play_batch, *job, rows, cols, mines, engine, deadline_ms) for job in jobs]
+            batches = [future.result() for future in futures]
+    for batch in batches:
+        pairings[(batch.first, batch.second)].merge(batch)
+    return TournamentReport(pairings, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    # python -m backend.coop_sim [strategies] [games] [rows cols mines] [seed]
+    names = sys.argv[1].split(",") if len(sys.argv) > 1 else ["easy", "medium", "hard"]
+    match_count = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    shape = tuple(int(arg) for arg in sys.argv[3:6]) if len(sys.argv) >= 6 else (DEFAULT_ROWS, DEFAULT_COLS, DEFAULT_MINE_COUNT)
+    master_seed = int(sys.argv[6]) if len(sys.argv) > 6 else 0
+    print(run_tournament(names, match_count, *shape, seed=master_seed).format())
@@ -0,0 +1,341 @@
+"""
+Name: corpus.py
+Description: Offline corpora of dealt boards for tuning the AI and board generation. Boards are
+dealt with place_mines and update_mine_counts from a seeded first click, and stored column by
+column in one fixed-size file: each metadata field (first click, opening count, largest opening,
+3BV, solvability) is a contiguous little-endian array and every board's cell values take a fixed
+slice of the cell block. Worker processes fill disjoint ranges of the memory-mapped file in
+parallel, and the reader hands out memoryviews straight into the mapping, so scanning millions of
+boards involves no parsing or copying.
+Inputs: None
+Outputs: None
+External Sources: 3BV (https://minesweepergame.com/statistics.php)
+Author(s): Riley Meyerkorth
+Creation Date: 19 October 2026
+"""
+
+import mmap
+import os
+import random
+import struct
+import sys
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from .board import Board
+from .constants import CELL_BLANK, CELL_MINE, CORPUS_CHUNK, CORPUS_WORKERS
+from .generator import is_no_guess
+from .models import BoardPos, BoardSize, Cell
+
+_MAGIC = b"MSBC"
+_VERSION = 2
+# magic, version, rows, cols, mines, boards, seed
+_HEADER = struct.Struct("<4sIHHHxxQQ")
+
+# Metadata columns in file order: name -> array typecode
+# Rows and columns are stored as "H" in the header, so every count fits in "I"
+COLUMNS: dict[str, str] = {
+    "first_row": "H",
+    "first_col": "H",
+    "openings": "I",        # number of openings
+    "largest_opening": "I", # cells uncovered by the biggest opening
+    "bbbv": "I",            # 3BV: fewest clicks that clear the board
+    "solvable": "B",        # 1 if the board can be cleared from the first click without guessing
+}
+
+
+def _layout(count: int, cells: int) -> tuple[dict[str, int], int, int]:
+    """
+    Description: byte offsets of every column for a corpus of `count` boards
+    Inputs: count (int): boards, cells (int): cells per board
+    Outputs: tuple: column offsets by name, offset of the cell block, total file size
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    offsets = {}
+    offset = _HEADER.size
+    for name, code in COLUMNS.items():
+        # keep every column aligned for its item size
+        size = array(code).itemsize
+        offset += -offset % size
+        offsets[name] = offset
+        offset += size * count
+    return offsets, offset, offset + cells * count
+
+
+def board_seed(seed: int, index: int) -> random.Random:
+    """
+    Description: the random generator a corpus board is dealt from, so any board can be dealt
+    again from the corpus seed and its index
+    Inputs: seed (int): corpus seed, index (int): board number
+    Outputs: random.Random: generator for the first click and the board seed
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    return random.Random((seed << 40) | index)
+
+
+def deal(rows: int, cols: int, mines: int, seed: int, index: int) -> tuple[Board, Cell]:
+    """
+    Description: deals corpus board `index`: a random first click, then place_mines and counts
+    Inputs: rows, cols, mines (int): configuration, seed (int): corpus seed, index (int): board number
+    Outputs: tuple: dealt board with nothing revealed, first click
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    rng = board_seed(seed, index)
+    first = (rng.randrange(rows), rng.randrange(cols))
+    board = Board(mines, size=BoardSize(rows, cols), seed=rng.getrandbits(63))
+    board.place_mines(BoardPos(x=first[0], y=first[1]))
+    board.update_mine_counts()
+    return board, first
+
+
+def bbbv(board: Board) -> int:
+    """
+    Description: 3BV of a dealt board: one click per opening plus one per numbered cell that no
+    opening uncovers
+    Inputs: board (Board): board with counts computed
+    Outputs: int: 3BV
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    cols = board.size.cols
+    covered = set()
+    for opening in board.openings:
+        covered.update(opening)
+    lone = sum(
+        1
+        for r, row in enumerate(board.board)
+        for c, value in enumerate(row)
+        if value > CELL_BLANK and r * cols + c not in covered
+    )
+    return len(board.openings) + lone
+
+
+def _fill(path: str, rows: int, cols: int, mines: int, count: int, seed: int,
+          start: int, stop: int, solvability: bool) -> int:
+    """
+    Description: deals boards start..stop-1 and writes them into their slots of the mapped file.
+    Runs in the worker processes; ranges never overlap, so no locking is needed
+    Inputs: path (str): preallocated corpus file, rows, cols, mines, count, seed (int): corpus
+            parameters, start, stop (int): board range, solvability (bool): run the solver
+    Outputs: int: boards written
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    cells = rows * cols
+    offsets, cell_offset, _ = _layout(count, cells)
+    fields = [(name, struct.Struct("<" + code), offsets[name]) for name, code in COLUMNS.items()]
+    with open(path, "r+b") as f, mmap.mmap(f.fileno(), 0) as mapped:
+        for index in range(start, stop):
+            board, first = deal(rows, cols, mines, seed, index)
+            sizes = board.opening_sizes()
+            values = {
+                "first_row": first[0],
+                "first_col": first[1],
+                "openings": len(sizes),
+                "largest_opening": max(sizes, default=0),
+                "bbbv": bbbv(board),
+                "solvable": 0,
+            }
+            grid = bytes(value & 0xFF for row in board.board for value in row)
+            mapped[cell_offset + index * cells:cell_offset + (index + 1) * cells] = grid
+            # the solver plays the board in place, so it runs after the cells are copied out
+            if solvability:
+                values["solvable"] = int(is_no_guess(board, first))
+            for name, field, offset in fields:
+                field.pack_into(mapped, offset + index * field.size, values[name])
+    return stop - start
+
+
+def write_corpus(path: str, rows: int, cols: int, mines: int, count: int, seed: int = 0,
+                 workers: int = CORPUS_WORKERS, solvability: bool = True) -> None:
+    """
+    Description: deals `count` boards with parallel workers and writes the corpus atomically to `path`
+    Inputs: path (str): output file, rows, cols, mines (int): configuration, count (int): boards,
+            seed (int): corpus seed, workers (int): processes (1 deals in this process),
+            solvability (bool): run the no-guess solver on every board
+    Outputs: None; raises ValueError if the configuration does not fit the file format
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    # Checked up front so a bad configuration fails before any board is dealt
+    if not (1 <= rows <= 0xFFFF and 1 <= cols <= 0xFFFF):
+        raise ValueError(f"Corpus boards must be 1 to {0xFFFF} rows and columns, got {rows}x{cols}")
+    # place_mines keeps the 3x3 around the first click clear
+    if not 0 <= mines <= min(0xFFFF, rows * cols - 9):
+        raise ValueError(f"Cannot deal {mines} mines on a {rows}x{cols} corpus board")
+    if count < 0:
+        raise ValueError(f"Corpus size must not be negative, got {count}")
+    _, _, size = _layout(count, rows * cols)
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.truncate(size)
+            f.write(_HEADER.pack(_MAGIC, _VERSION, rows, cols, mines, count, seed))
+        ranges = [(start, min(start + CORPUS_CHUNK, count)) for start in range(0, count, CORPUS_CHUNK)]
+        if workers <= 1 or len(ranges) == 1:
+            for start, stop in ranges:
+                _fill(tmp, rows, cols, mines, count, seed, start, stop, solvability)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                jobs = [pool.submit(_fill, tmp, rows, cols, mines, count, seed, start, stop, solvability)
+                        for start, stop in ranges]
+                for job in jobs:
+                    job.result()
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+
+class Corpus:
+    """
+    Description: Read-only, memory-mapped view of a corpus file. Columns and cells are memoryviews
+    into the mapping; keep them only while the corpus is open.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+
+    def __init__(self, path: str):
+        """
+        Description: maps a corpus file and checks its header
+        Inputs: path (str): corpus file
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.rows, self.cols, self.mines, self.count, self.seed = _HEADER.unpack_from(self._map)
+        if magic != _MAGIC or version != _VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a version {_VERSION} board corpus")
+        self.cells: int = self.rows * self.cols
+        offsets, cell_offset, size = _layout(self.count, self.cells)
+        if len(self._map) != size:
+            self._map.close()
+            raise ValueError(f"{path} is truncated")
+        view = memoryview(self._map)
+        self._columns: dict[str, memoryview | array] = {}
+        for name, code in COLUMNS.items():
+            raw = view[offsets[name]:offsets[name] + array(code).itemsize * self.count]
+            # The file is little-endian; on other platforms fall back to an in-memory swapped copy
+            if sys.byteorder == "little" or array(code).itemsize == 1:
+                self._columns[name] = raw.cast(code)
+            else:
+                swapped = array(code, raw.tobytes())
+                swapped.byteswap()
+                self._columns[name] = swapped
+        self._cells = view[cell_offset:].cast("b")
+
+    def __len__(self) -> int:
+        """
+        Description: number of boards in the corpus
+        Inputs: None
+        Outputs: int: board count
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return self.count
+
+    def __enter__(self) -> "Corpus":
+        """
+        Description: lets the corpus be used in a with block
+        Inputs: None
+        Outputs: Corpus: this corpus
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """
+        Description: closes the corpus at the end of a with block
+        Inputs: exc: exception details, if any (not suppressed)
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self.close()
+
+    def column(self, name: str) -> memoryview:
+        """
+        Description: one metadata field for every board
+        Inputs: name (str): a key of COLUMNS
+        Outputs: memoryview: typed view with one item per board
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return self._columns[name]
+
+    def cells_of(self, index: int) -> memoryview:
+        """
+        Description: cell values of a board in row-major order (CELL_MINE or the neighbor count)
+        Inputs: index (int): board number
+        Outputs: memoryview: signed bytes, rows * cols long
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return self._cells[index * self.cells:(index + 1) * self.cells]
+
+    def board(self, index: int) -> Board:
+        """
+        Description: rebuilds a playable Board from a corpus entry
+        Inputs: index (int): board number
+        Outputs: Board: board with the same mines and counts, nothing revealed
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        values = self.cells_of(index)
+        mines = [divmod(cell, self.cols) for cell in range(self.cells) if values[cell] == CELL_MINE]
+        board = Board(self.mines, size=BoardSize(self.rows, self.cols))
+        board.set_mines(mines)
+        return board
+
+    def close(self) -> None:
+        """
+        Description: releases the views and unmaps the file
+        Inputs: None
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        for column in self._columns.values():
+            if isinstance(column, memoryview):
+                column.release()
+        self._cells.release()
+        self._map.close()
+
+
+if __name__ == "__main__":
+    # python -m backend.corpus path count [rows cols mines] [seed]
+    if len(sys.argv) < 3:
+        sys.exit("usage: python -m backend.corpus path count [rows cols mines] [seed]")
+    target, total = sys.argv[1], int(sys.argv[2])
+    shape = tuple(int(arg) for arg in sys.argv[3:6]) if len(sys.argv) >= 6 else (16, 30, 99)
+    corpus_seed = int(sys.argv[6]) if len(sys.argv) > 6 else 0
+    write_corpus(target, *shape, total, corpus_seed)
+    with Corpus(target) as corpus:
+        solvable = sum(corpus.column("solvable"))
+        print(f"{len(corpus)} boards of {shape[0]}x{shape[1]} with {shape[2]} mines, {solvable} solvable without guessing")
@@ -0,0 +1,343 @@
+"""
+Name: engine.py
+Description: Interface every board engine implements, the co-op turn logic they share, and the
+registry used to pick an engine per game.
+Inputs: None
+Outputs: None
+External Sources: N/A
+Author(s): Riley Meyerkorth
+Creation Date: 19 October 2026
+"""
+
+from abc import ABC, abstractmethod
+from typing import Callable, Iterable
+
+from .models import (
+    BoardEngineType,
+    BoardPos,
+    BoardSize,
+    BoardStateModel,
+    Cell,
+    GameMode,
+    HintModel,
+    PlayerType
+)
+from .render import TerminalRenderer
+from .solver import Analysis
+
+
+class BoardEngine(ABC):
+    """
+    Description: Public surface of a Minesweeper board. The server, controller and AI only use
+    these methods and the attributes below, so engines are interchangeable. Engines must set:
+    mines, size, flag_count, isAlive, version, zobrist, game_mode, current_player, human_alive,
+    ai_alive, winner and game_over.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    mines: int
+    size: BoardSize
+    flag_count: int
+    isAlive: bool
+    version: int
+    zobrist: int
+    game_mode: GameMode
+    current_player: PlayerType
+    human_alive: bool
+    ai_alive: bool
+    winner: PlayerType | None
+    game_over: bool
+
+    @abstractmethod
+    def __init__(self, mines: int, game_mode: GameMode = GameMode.SOLO, size: BoardSize | None = None,
+                 lazy_counts: bool = False, seed: int | None = None):
+        """
+        Description: creates an empty board; mines are placed later. With a seed, place_mines deals the same
+        layout for the same first click every time
+        Inputs: mines (int): mine count, game_mode (GameMode): solo or co-op, size (BoardSize | None): board size,
+                lazy_counts (bool): compute counts on demand (engines may ignore it), seed (int | None): mine seed
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+
+    @abstractmethod
+    def place_mines(self, first_pos: BoardPos) -> None:
+        """
+        Description: places mines at random, keeping the first click and its neighbors clear
+        Inputs: first_pos (BoardPos): position of the first click
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+
+    @abstractmethod
+    def set_mines(self, cells: Iterable[Cell]) -> None:
+        """
+        Description: places mines at exactly the given cells and computes the counts
+        Inputs: cells (Iterable[Cell]): (row, col) of every mine
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+
+    @abstractmethod
+    def update_mine_counts(self) -> None:
+        """
+        Description: computes every cell's neighbor mine count after placement
+        Inputs: None
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+
+    @abstractmethod
+    def flag_cell(self, pos: BoardPos) -> None:
+        """
+        Description: toggles the flag on a hidden cell
+        Inputs: pos (BoardPos): cell to flag or unflag
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+
+    @abstractmethod
+    def reveal_cell(self, pos: BoardPos) -> bool:
+        """
+        Description: reveals a cell, expanding blank regions
+        Inputs: pos (BoardPos): cell to reveal
+        Outputs: bool: False if the cell was a mine, True otherwise
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+
+    @abstractmethod
+    def check_win(self) -> bool:
+        """
+        Description: checks whether every non-mine cell is revealed
+        Inputs: None
+        Outputs: bool: True if the game is won
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+
+    @property
+    @abstractmethod
+    def hidden_count(self) -> int:
+        """
+        Description: number of hidden, unflagged cells
+        Inputs: None
+        Outputs: int: hidden cell count
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+
+    @abstractmethod
+    def opening_sizes(self) -> list[int]:
+        """
+        Description: cells uncovered by each opening (blank region plus its numbered border)
+        Inputs: None
+        Outputs: list[int]: size of every opening
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+
+    @abstractmethod
+    def rehash(self) -> None:
+        """
+        Description: recomputes the Zobrist hash of the visible state from scratch
+        Inputs: None
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+
+    @abstractmethod
+    def ai_move(self, difficulty: str, deadline: float | None = None) -> tuple[str, BoardPos]:
+        """
+        Description: picks an AI move for the visible board
+        Inputs: difficulty (str): one of AI_DIFFICULTIES, deadline (float | None): time.monotonic() value to finish by
+        Outputs: tuple[str, BoardPos]: ("flag" or "reveal", position to act on)
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+
+    @abstractmethod
+    def analyze(self, deadline: float | None = None) -> Analysis:
+        """
+        Description: solver analysis of the visible board
+        Inputs: deadline (float | None): time.monotonic() value to finish by
+        Outputs: Analysis: safe cells, mines and probabilities
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+
+    @abstractmethod
+    def hint(self) -> HintModel:
+        """
+        Description: hint for the visible board
+        Inputs: None
+        Outputs: HintModel: safe cells, mines and heatmap
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+
+    @abstractmethod
+    def print_board(self, show_mines: bool = False, renderer: TerminalRenderer | None = None) -> None:
+        """
+        Description: prints the board to the console, through `renderer` if given
+        Inputs: show_mines (bool): reveal hidden mines, renderer (TerminalRenderer | None): renderer to draw with
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+
+    @abstractmethod
+    def to_dict(self, reveal_all: bool = False) -> BoardStateModel:
+        """
+        Description: board state in the model the frontend expects
+        Inputs: reveal_all (bool): show every cell
+        Outputs: BoardStateModel: board, flags and status
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+
+    def handle_player_move(self, pos: BoardPos, player: PlayerType) -> bool:
+        """
+        Description: handles a move by a specific player in co-op mode
+        Inputs: pos (BoardPos): position of the cell to reveal, player (PlayerType): player making the move
+        Outputs: bool: True if the move was successful, False if the player hit a mine
+        Author(s): Aiden Burke, Riley Meyerkorth, Raj Kaura, Kobe Jordan
+        Creation Date: 1 September 2025
+        External Sources: N/A
+        """
+        """
+        Handle a move by a specific player in co-op mode.
+        Returns True if the move was successful, False if the player hit a mine.
+        """
+        
+        # Solo mode behaves as normal
+        if self.game_mode != GameMode.COOP:
+            return self.reveal_cell(pos)
+        
+        # Check if it's the player's turn and if they are alive
+        if self.current_player != player:
+            return False  # Not this player's turn
+
+        # Check if the player is alive
+        if player == PlayerType.HUMAN and not self.human_alive:
+            return False  # Human player is out
+        if player == PlayerType.AI and not self.ai_alive:
+            return False  # AI player is out
+        
+        # Make the move
+        success = self.reveal_cell(pos)
+
+        # Check if someone hit a mine
+        if not success:
+            # Player hit a mine, they lose
+            if player == PlayerType.HUMAN:
+                self.human_alive = False
+                self.winner = PlayerType.AI
+            # AI player hit a mine, they lose
+            else: 
+                self.ai_alive = False
+                self.winner = PlayerType.HUMAN
+            self.game_over = True
+        else:
+            # Switch turns
+            self.current_player = PlayerType.AI if player == PlayerType.HUMAN else PlayerType.HUMAN
+        
+        return success
+    
+    def check_coop_win(self) -> bool:
+        """
+        Description: checks if the game is won in co-op mode (all non-mine cells revealed)
+        Inputs: None
+        Outputs: bool: True if the game is won, False otherwise
+        Author(s): Raj Kaura, Kobe Jordan
+        Creation Date: 3 October 2025
+        External Sources: N/A
+        """
+        """
+        Check if the game is won in co-op mode (all non-mine cells revealed).
+        """
+        if self.game_mode != GameMode.COOP:
+            return self.check_win()
+        
+        # In co-op mode, if all cells are revealed without anyone hitting a mine,
+        # it's a draw (both players win)
+        if self.check_win() and not self.game_over:
+            self.winner = None  # Draw
+            self.game_over = True
+            return True
+        
+        return False
+
+    def handle_player_flag(self, pos: BoardPos, player: PlayerType) -> None:
+        """
+        Description: toggles a flag for a player; in co-op mode a flag uses up the player's turn
+        Inputs: pos (BoardPos): position of the cell to flag/unflag, player (PlayerType): player making the move
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self.flag_cell(pos)
+        if self.game_mode == GameMode.COOP:
+            self.current_player = PlayerType.AI if player == PlayerType.HUMAN else PlayerType.HUMAN
+
+
+# Engine classes by type; each engine module registers itself on import
+ENGINES: dict[BoardEngineType, type[BoardEngine]] = {}
+
+
+def register_engine(kind: BoardEngineType) -> Callable[[type[BoardEngine]], type[BoardEngine]]:
+    """
+    Description: class decorator that makes an engine selectable under `kind`
+    Inputs: kind (BoardEngineType): name the engine is selected by
+    Outputs: Callable: decorator returning the class unchanged
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    def register(cls: type[BoardEngine]) -> type[BoardEngine]:
+        ENGINES[kind] = cls
+        return cls
+    return register
+
+
+def create_engine(kind: BoardEngineType, mines: int, game_mode: GameMode = GameMode.SOLO,
+                  size: BoardSize | None = None, lazy_counts: bool = False, seed: int | None = None) -> BoardEngine:
+    """
+    Description: builds a new, empty board with the selected engine
+    Inputs: kind (BoardEngineType): engine to use, mines (int): number of mines,
+            game_mode (GameMode): solo or co-op, size (BoardSize | None): board dimensions,
+            lazy_counts (bool): count cells on first use instead of after placement,
+            seed (int | None): seed for place_mines, None uses the random module
+    Outputs: BoardEngine: new board
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    # Importing the built-in engines registers them
+    from . import bitboard, board  # noqa: F401
+    if kind not in ENGINES:
+        raise ValueError(f"Unknown board engine: {kind}")
+    return ENGINES[kind](mines, game_mode, size, lazy_counts, seed)
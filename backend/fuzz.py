@@ -0,0 +1,160 @@
+"""
+Name: fuzz.py
+Description: Seeded differential fuzz harness for board engines. Plays the same random games on a
+reference engine and a candidate engine and checks that everything a caller can observe is
+identical after every step.
+Inputs: None
+Outputs: None
+External Sources: N/A
+Author(s): Riley Meyerkorth
+Creation Date: 19 October 2026
+"""
+
+import random
+import sys
+from typing import Any
+
+from .engine import BoardEngine, create_engine
+from .models import BoardEngineType, BoardPos, BoardSize, GameMode, PlayerType
+
+
+class EngineMismatch(AssertionError):
+    """
+    Description: Raised when two engines disagree; the message names the seed, game and step so
+    the failing sequence can be replayed.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+
+
+def observe(engine: BoardEngine, full: bool = False) -> dict[str, Any]:
+    """
+    Description: everything a caller can see of an engine's state. The full view also reads the
+    hidden solution and opening sizes, which makes lazy engines count every cell, so it is only
+    taken once a game is over.
+    Inputs: engine (BoardEngine): board to inspect, full (bool): include hidden information
+    Outputs: dict[str, Any]: observable fields by name
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    fields = {
+        "state": engine.to_dict().model_dump(),
+        "win": engine.check_win(),
+        "hidden_count": engine.hidden_count,
+        "zobrist": engine.zobrist,
+        "version": engine.version,
+    }
+    if full:
+        fields["solution"] = engine.to_dict(reveal_all=True).board
+        fields["opening_sizes"] = engine.opening_sizes()
+    return fields
+
+
+def _compare(reference: BoardEngine, candidate: BoardEngine, where: str, full: bool = False) -> None:
+    """
+    Description: raises EngineMismatch naming every observable field that differs
+    Inputs: reference, candidate (BoardEngine): boards to compare, where (str): replay location,
+            full (bool): include hidden information
+    Outputs: None
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    expected, actual = observe(reference, full), observe(candidate, full)
+    fields = [name for name in expected if expected[name] != actual[name]]
+    if fields:
+        raise EngineMismatch(f"{where}: engines differ in {', '.join(fields)}")
+
+
+def _place(engine: BoardEngine, first: BoardPos, mine_seed: int, layout: list | None) -> None:
+    """
+    Description: deals the mines for one game, either from a fixed layout or through the engine's
+    own place_mines with the global random module seeded, restoring its state afterwards
+    Inputs: engine (BoardEngine): board to fill, first (BoardPos): first click,
+            mine_seed (int): seed for place_mines, layout (list | None): explicit mine cells
+    Outputs: None
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    if layout is not None:
+        engine.set_mines(layout)
+        return
+    saved = random.getstate()
+    try:
+        random.seed(mine_seed)
+        engine.place_mines(first)
+    finally:
+        random.setstate(saved)
+    engine.update_mine_counts()
+
+
+def fuzz_engines(candidate: BoardEngineType, reference: BoardEngineType = BoardEngineType.LIST,
+                 seed: int = 0, games: int = 50, steps: int = 60, lazy_counts: bool = False) -> int:
+    """
+    Description: plays `games` random games of `steps` moves each (reveals, flags and co-op turns)
+    on both engines, comparing their observable state after placement and after every move
+    Inputs: candidate (BoardEngineType): engine under test, reference (BoardEngineType): trusted engine,
+            seed (int): master seed, games (int): number of games, steps (int): moves per game,
+            lazy_counts (bool): build the candidate with lazy counts
+    Outputs: int: number of comparisons made; raises EngineMismatch on the first difference
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    checks = 0
+    for game in range(games):
+        rng = random.Random(f"fuzz:{seed}:{game}")
+        rows, cols = rng.randint(5, 20), rng.randint(5, 20)
+        mines = rng.randint(1, rows * cols - 9)
+        mode = rng.choice((GameMode.SOLO, GameMode.COOP))
+        first = BoardPos(x=rng.randrange(rows), y=rng.randrange(cols))
+        # Half the games use explicit layouts so set_mines is covered as well
+        layout = None
+        if rng.random() < 0.5:
+            layout = rng.sample([(r, c) for r in range(rows) for c in range(cols)], mines)
+        mine_seed = rng.getrandbits(32)
+
+        boards = [
+            create_engine(reference, mines, mode, BoardSize(rows, cols)),
+            create_engine(candidate, mines, mode, BoardSize(rows, cols), lazy_counts),
+        ]
+        for board in boards:
+            _place(board, first, mine_seed, layout)
+        _compare(*boards, f"seed {seed}, game {game}, placement")
+        checks += 1
+
+        for step in range(steps):
+            pos = BoardPos(x=rng.randrange(rows), y=rng.randrange(cols))
+            player = rng.choice((PlayerType.HUMAN, PlayerType.AI))
+            move = rng.choices(("reveal", "flag", "turn", "turn_flag"), weights=(5, 2, 2, 1))[0]
+            results = []
+            for board in boards:
+                if move == "reveal":
+                    results.append(board.reveal_cell(pos))
+                elif move == "flag":
+                    results.append(board.flag_cell(pos))
+                elif move == "turn":
+                    results.append((board.handle_player_move(pos, player), board.check_coop_win()))
+                else:
+                    results.append(board.handle_player_flag(pos, player))
+            where = f"seed {seed}, game {game}, step {step} ({move} {pos.x},{pos.y} by {player.value})"
+            if results[0] != results[1]:
+                raise EngineMismatch(f"{where}: results differ {results[0]!r} != {results[1]!r}")
+            _compare(*boards, where)
+            checks += 1
+        _compare(*boards, f"seed {seed}, game {game}, end", full=True)
+        checks += 1
+    return checks
+
+
+if __name__ == "__main__":
+    # python -m backend.fuzz [engine] [seed] [games] [lazy]
+    engine = BoardEngineType(sys.argv[1]) if len(sys.argv) > 1 else BoardEngineType.BITBOARD
+    master_seed = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    game_count = int(sys.argv[3]) if len(sys.argv) > 3 else 200
+    lazy = len(sys.argv) > 4 and sys.argv[4] == "lazy"
+    total = fuzz_engines(engine, seed=master_seed, games=game_count, lazy_counts=lazy)
+    print(f"{engine.value}{' (lazy counts)' if lazy else ''} matches {BoardEngineType.LIST.value} on {total} checks")
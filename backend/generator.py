@@ -0,0 +1,307 @@
+"""
+Name: generator.py
+Description: No-guess board generation. Candidate layouts are checked with the solver so the whole
+board can be cleared by deduction from the first click. Layouts are produced ahead of time by a
+background process pool and kept in a small inventory per (rows, cols, mines) configuration.
+Inputs: None
+Outputs: None
+External Sources: N/A
+Author(s): Riley Meyerkorth
+Creation Date: 19 October 2026
+"""
+
+import random
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from .board import Board
+from .constants import (
+    CELL_BLANK,
+    NO_GUESS_ATTEMPTS,
+    NO_GUESS_POOL_CAPACITY,
+    NO_GUESS_POOL_WORKERS,
+)
+from .models import BoardSize, Cell
+
+
+@dataclass(frozen=True)
+class Layout:
+    """
+    Description: A mine layout together with every first-click cell it is solvable from.
+    Inputs: rows, cols, mines (frozenset of mine cells), starts (frozenset of start cells)
+    Outputs: immutable layout shared between the pool workers and the server
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    """
+    rows: int
+    cols: int
+    mines: frozenset[Cell]
+    starts: frozenset[Cell]
+
+    def transformed(self, transform: Callable[[int, int], Cell]) -> "Layout":
+        """
+        Description: applies a board symmetry to the mines and start cells
+        Inputs: transform (Callable): maps (row, col) to the new (row, col)
+        Outputs: Layout: the transformed layout
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return Layout(
+            rows=self.rows,
+            cols=self.cols,
+            mines=frozenset(transform(r, c) for r, c in self.mines),
+            starts=frozenset(transform(r, c) for r, c in self.starts),
+        )
+
+
+def symmetries(rows: int, cols: int) -> list[Callable[[int, int], Cell]]:
+    """
+    Description: lists the board symmetries (reflections, plus rotations on square boards)
+    Inputs: rows (int), cols (int): board dimensions
+    Outputs: list of (row, col) -> (row, col) transforms, identity first
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    last_r, last_c = rows - 1, cols - 1
+    transforms = [
+        lambda r, c: (r, c),
+        lambda r, c: (last_r - r, c),
+        lambda r, c: (r, last_c - c),
+        lambda r, c: (last_r - r, last_c - c),
+    ]
+    if rows == cols:
+        transforms += [
+            lambda r, c: (c, r),
+            lambda r, c: (last_c - c, r),
+            lambda r, c: (c, last_r - r),
+            lambda r, c: (last_c - c, last_r - r),
+        ]
+    return transforms
+
+
+def _board_for(rows: int, cols: int, mines: frozenset[Cell]) -> Board:
+    """
+    Description: builds a Board with the given mines placed and counts computed
+    Inputs: rows (int), cols (int), mines (frozenset[Cell])
+    Outputs: Board: fresh board ready to be played
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    board = Board(len(mines), size=BoardSize(rows, cols))
+    board.set_mines(mines)
+    return board
+
+
+def is_no_guess(board: Board, start: Cell) -> bool:
+    """
+    Description: plays the board from `start` using only provably safe reveals and reports whether
+    every safe cell gets uncovered. The board is played in place.
+    Inputs: board (Board): board with mines placed, start (Cell): first click
+    Outputs: bool: True if the board never requires a guess
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    if not board._reveal(*start):
+        return False
+    while not board.check_win():
+        analysis = board.analyze()
+        safe = [cell for cell in analysis.safe if not board.revealed[cell[0]][cell[1]]]
+        if not safe:
+            return False
+        for r, c in safe:
+            board._reveal(r, c)
+    return True
+
+
+def solvable_starts(rows: int, cols: int, mines: frozenset[Cell]) -> frozenset[Cell]:
+    """
+    Description: finds every blank cell the layout can be solved from. Clicking any blank cell of an
+    opening reveals the same area, so one solver run per opening is enough.
+    Inputs: rows (int), cols (int), mines (frozenset[Cell])
+    Outputs: frozenset[Cell]: valid first clicks
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    reference = _board_for(rows, cols, mines)
+    starts: set[Cell] = set()
+    seen: set[Cell] = set()
+    for r in range(rows):
+        for c in range(cols):
+            if reference.board[r][c] != CELL_BLANK or (r, c) in seen:
+                continue
+            opening = _opening(reference, (r, c))
+            seen |= opening
+            if is_no_guess(_board_for(rows, cols, mines), (r, c)):
+                starts |= opening
+    return frozenset(starts)
+
+
+def _opening(board: Board, start: Cell) -> set[Cell]:
+    """
+    Description: collects the blank cells connected to `start`
+    Inputs: board (Board): board with counts computed, start (Cell): blank cell
+    Outputs: set[Cell]: blank cells of the opening
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    opening = {start}
+    stack = [start]
+    while stack:
+        r, c = stack.pop()
+        for cell in board._neighbors.of(r, c):
+            if cell not in opening and board.board[cell[0]][cell[1]] == CELL_BLANK:
+                opening.add(cell)
+                stack.append(cell)
+    return opening
+
+
+def generate_layout(rows: int, cols: int, mines: int, seed: int, attempts: int = NO_GUESS_ATTEMPTS) -> Optional[Layout]:
+    """
+    Description: draws random layouts until one can be solved without guessing from some opening.
+    Runs inside the pool workers, so it only uses its own seeded random generator.
+    Inputs: rows, cols, mines (int): configuration, seed (int): RNG seed, attempts (int): layouts to try
+    Outputs: Layout | None: a no-guess layout, or None if every attempt needed a guess
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    rng = random.Random(seed)
+    cells = [(r, c) for r in range(rows) for c in range(cols)]
+    for _ in range(attempts):
+        layout = frozenset(rng.sample(cells, mines))
+        starts = solvable_starts(rows, cols, layout)
+        if starts:
+            return Layout(rows, cols, layout, starts)
+    return None
+
+
+class NoGuessPool:
+    """
+    Description: Keeps a bounded inventory of pre-generated no-guess layouts per
+    (rows, cols, mines) and refills it from a background process pool.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: concurrent.futures
+    """
+
+    def __init__(self, capacity: int = NO_GUESS_POOL_CAPACITY, max_workers: int = NO_GUESS_POOL_WORKERS):
+        """
+        Description: sets up an empty inventory; worker processes start on first use
+        Inputs: capacity (int): layouts kept per configuration, max_workers (int): worker processes
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self.capacity: int = capacity
+        self.max_workers: int = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._inventory: dict[tuple[int, int, int], deque[Layout]] = {}
+        self._pending: dict[tuple[int, int, int], int] = {}
+        self._lock = threading.Lock()
+        self._seeds = random.Random()
+
+    def ensure(self, rows: int, cols: int, mines: int) -> None:
+        """
+        Description: schedules enough background jobs to fill the inventory for a configuration
+        Inputs: rows, cols, mines (int): configuration
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        key = (rows, cols, mines)
+        with self._lock:
+            stock = self._inventory.setdefault(key, deque(maxlen=self.capacity))
+            missing = self.capacity - len(stock) - self._pending.get(key, 0)
+            if missing <= 0:
+                return
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            self._pending[key] = self._pending.get(key, 0) + missing
+            futures = [
+                self._executor.submit(generate_layout, rows, cols, mines, self._seeds.getrandbits(64))
+                for _ in range(missing)
+            ]
+        for future in futures:
+            future.add_done_callback(lambda f, key=key: self._collect(key, f))
+
+    def _collect(self, key: tuple[int, int, int], future: Future) -> None:
+        """
+        Description: stores a finished layout; jobs that came up empty are retried on the next take()
+        Inputs: key (tuple): configuration, future (Future): finished generation job
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        layout = None if future.cancelled() or future.exception() else future.result()
+        with self._lock:
+            self._pending[key] -= 1
+            if layout is not None:
+                self._inventory[key].append(layout)
+
+    def take(self, rows: int, cols: int, mines: int, first: Cell) -> Optional[Layout]:
+        """
+        Description: removes a stocked layout that is solvable from `first`, trying every board
+        symmetry of each layout, and tops the inventory back up. On a miss the oldest layout is
+        evicted, so a stock that never matches keeps turning over instead of going stale
+        Inputs: rows, cols, mines (int): configuration, first (Cell): first click
+        Outputs: Layout | None: matching layout (mapped so `first` is a start cell), or None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        key = (rows, cols, mines)
+        match = None
+        with self._lock:
+            stock = self._inventory.get(key, ())
+            for layout in stock:
+                for transform in symmetries(rows, cols):
+                    # Check the start cells first so only the winning symmetry is materialized
+                    if any(transform(r, c) == first for r, c in layout.starts):
+                        match = (layout, transform)
+                        break
+                if match:
+                    stock.remove(match[0])
+                    break
+            if match is None and stock:
+                # Nothing matched: drop the oldest layout, ensure() below schedules its replacement
+                stock.popleft()
+        self.ensure(rows, cols, mines)
+        return match[0].transformed(match[1]) if match else None
+
+    def stocked(self, rows: int, cols: int, mines: int) -> int:
+        """
+        Description: number of layouts ready for a configuration
+        Inputs: rows, cols, mines (int): configuration
+        Outputs: int: inventory size
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        with self._lock:
+            return len(self._inventory.get((rows, cols, mines), ()))
+
+    def shutdown(self) -> None:
+        """
+        Description: stops the worker processes and drops queued jobs
+        Inputs: None
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
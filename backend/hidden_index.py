@@ -0,0 +1,100 @@
+"""
+Name: hidden_index.py
+Description: Index of the hidden, unflagged cells of a board with constant-time insert, remove,
+membership, count and uniform random pick.
+Inputs: None
+Outputs: None
+External Sources: N/A
+Author(s): Riley Meyerkorth
+Creation Date: 19 October 2026
+"""
+
+import random
+
+
+class HiddenIndex:
+    """
+    Description: Dense array of flat cell indices plus a position map. Removal swaps the last
+    element into the freed slot, so every operation is O(1).
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    __slots__ = ("cells", "where")
+
+    def __init__(self, size: int):
+        """
+        Description: creates an index that starts with every cell hidden
+        Inputs: size (int): number of cells on the board
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self.cells: list[int] = list(range(size))
+        # where[i] is the slot of cell i in `cells`, or -1 if it is not in the index
+        self.where: list[int] = list(range(size))
+
+    def add(self, cell: int) -> None:
+        """
+        Description: adds a cell if it is not already present
+        Inputs: cell (int): flat cell index
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        if self.where[cell] < 0:
+            self.where[cell] = len(self.cells)
+            self.cells.append(cell)
+
+    def discard(self, cell: int) -> None:
+        """
+        Description: removes a cell if present by swapping the last cell into its slot
+        Inputs: cell (int): flat cell index
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        slot = self.where[cell]
+        if slot < 0:
+            return
+        last = self.cells.pop()
+        if last != cell:
+            self.cells[slot] = last
+            self.where[last] = slot
+        self.where[cell] = -1
+
+    def choice(self, rng: random.Random | None = None) -> int:
+        """
+        Description: picks a cell uniformly at random
+        Inputs: rng (random.Random | None): random generator, defaults to the random module
+        Outputs: int: flat cell index
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return self.cells[(rng or random).randrange(len(self.cells))]
+
+    def __contains__(self, cell: int) -> bool:
+        """
+        Description: whether a cell is in the index
+        Inputs: cell (int): row-major cell index
+        Outputs: bool: True if the cell is hidden
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return self.where[cell] >= 0
+
+    def __len__(self) -> int:
+        """
+        Description: number of cells in the index
+        Inputs: None
+        Outputs: int: hidden cell count
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return len(self.cells)
@@ -0,0 +1,400 @@
+"""
+Name: infinite.py
+Description: Unbounded Minesweeper board. The plane is split into square chunks whose mines are
+derived from the board seed and a hash of the chunk coordinate, so any chunk can be rebuilt at
+will. Only explored chunks are kept in memory: counts are computed per chunk on first use, and
+chunks the player has not touched are evicted least-recently-used once the cache is full.
+Inputs: None
+Outputs: None
+External Sources: N/A
+Author(s): Riley Meyerkorth
+Creation Date: 19 October 2026
+"""
+
+import hashlib
+import random
+from collections import OrderedDict
+
+from .constants import (
+    CELL_MINE,
+    CHUNK_CACHE_SIZE,
+    CHUNK_MINE_DENSITY,
+    CHUNK_SIZE,
+    DIRECTIONS,
+    INFINITE_FLOOD_LIMIT
+)
+from .models import BoardPos, Cell
+
+
+class Chunk:
+    """
+    Description: One CHUNK_SIZE x CHUNK_SIZE square. Cell (r, c) of the chunk is bit
+    r * CHUNK_SIZE + c of each mask. A chunk is dirty once the player revealed or flagged any of
+    its cells; only clean chunks may be evicted, since they can be regenerated from the seed.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    __slots__ = ("mines", "revealed", "flags", "counts")
+
+    def __init__(self, mines: int):
+        """
+        Description: creates an untouched chunk
+        Inputs: mines (int): mine mask
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self.mines: int = mines
+        self.revealed: int = 0
+        self.flags: int = 0
+        # neighbor mine count per cell, filled in on first use
+        self.counts: bytes | None = None
+
+    @property
+    def dirty(self) -> bool:
+        """
+        Description: whether the chunk holds player state that the seed cannot rebuild
+        Inputs: None
+        Outputs: bool: True once any cell was revealed or flagged
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return bool(self.revealed or self.flags)
+
+
+class InfiniteBoard:
+    """
+    Description: Board without edges. Rows and columns are any integers, negative included.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+
+    def __init__(self, seed: int | None = None, density: float = CHUNK_MINE_DENSITY,
+                 cache_size: int = CHUNK_CACHE_SIZE):
+        """
+        Description: creates a board; nothing is generated until cells are inspected
+        Inputs: seed (int | None): board seed, random if None, density (float): share of mines per chunk,
+                cache_size (int): chunks kept before clean ones are evicted
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self.seed: int = seed if seed is not None else random.getrandbits(64)
+        self.chunk_mines: int = round(density * CHUNK_SIZE * CHUNK_SIZE)
+        self.cache_size: int = cache_size
+        self._chunks: OrderedDict[Cell, Chunk] = OrderedDict()
+        # first click and its neighbors, kept free of mines
+        self._cleared: frozenset[Cell] = frozenset()
+        # cells still to expand when a reveal hit INFINITE_FLOOD_LIMIT
+        self._frontier: list[Cell] = []
+        self.started: bool = False
+        self.isAlive: bool = True
+        self.revealed_count: int = 0
+        self.flag_count: int = 0
+        self.version: int = 0
+
+    def _locate(self, row: int, col: int) -> tuple[Cell, int]:
+        """
+        Description: chunk coordinate of a cell and its bit inside the chunk
+        Inputs: row (int), col (int): cell position
+        Outputs: tuple[Cell, int]: ((chunk row, chunk col), bit index)
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        chunk_row, r = divmod(row, CHUNK_SIZE)
+        chunk_col, c = divmod(col, CHUNK_SIZE)
+        return (chunk_row, chunk_col), r * CHUNK_SIZE + c
+
+    def _generate(self, key: Cell) -> int:
+        """
+        Description: mine mask of a chunk, drawn from a generator seeded with a hash of the board
+        seed and the chunk coordinate, minus the cleared first-click area
+        Inputs: key (Cell): chunk coordinate
+        Outputs: int: mine mask
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        digest = hashlib.blake2b(f"{self.seed}:{key[0]}:{key[1]}".encode(), digest_size=8).digest()
+        rng = random.Random(int.from_bytes(digest, "little"))
+        mines = 0
+        for i in rng.sample(range(CHUNK_SIZE * CHUNK_SIZE), self.chunk_mines):
+            mines |= 1 << i
+        for row, col in self._cleared:
+            cleared_key, i = self._locate(row, col)
+            if cleared_key == key:
+                mines &= ~(1 << i)
+        return mines
+
+    def _chunk(self, key: Cell) -> Chunk:
+        """
+        Description: returns a chunk, materializing it on first use and marking it recently used.
+        Eviction is left to the end of each public call so chunks in use are never dropped.
+        Inputs: key (Cell): chunk coordinate
+        Outputs: Chunk: cached chunk
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        chunk = self._chunks.get(key)
+        if chunk is None:
+            chunk = Chunk(self._generate(key))
+            self._chunks[key] = chunk
+        else:
+            self._chunks.move_to_end(key)
+        return chunk
+
+    def _mines_of(self, key: Cell) -> int:
+        """
+        Description: mine mask of a chunk without caching it
+        Inputs: key (Cell): chunk coordinate
+        Outputs: int: mine mask
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        chunk = self._chunks.get(key)
+        return chunk.mines if chunk is not None else self._generate(key)
+
+    def _counts(self, key: Cell, chunk: Chunk) -> bytes:
+        """
+        Description: neighbor mine counts of every cell of a chunk, computed once from the chunk
+        and the border of its eight neighbors
+        Inputs: key (Cell): chunk coordinate, chunk (Chunk): the chunk itself
+        Outputs: bytes: count per bit index
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        if chunk.counts is not None:
+            return chunk.counts
+        size = CHUNK_SIZE
+        padded = size + 2
+        # Mines of the chunk plus a one-cell ring taken from the neighboring chunks
+        grid = bytearray(padded * padded)
+        for dr in (-1, 0, 1):
+            for dc in (-1, 0, 1):
+                mines = chunk.mines if dr == dc == 0 else self._mines_of((key[0] + dr, key[1] + dc))
+                while mines:
+                    low = mines & -mines
+                    r, c = divmod(low.bit_length() - 1, size)
+                    pr, pc = r + dr * size + 1, c + dc * size + 1
+                    if 0 <= pr < padded and 0 <= pc < padded:
+                        grid[pr * padded + pc] = 1
+                    mines ^= low
+        counts = bytearray(size * size)
+        for r in range(size):
+            for c in range(size):
+                center = (r + 1) * padded + c + 1
+                counts[r * size + c] = sum(grid[center + dr * padded + dc] for dr, dc in DIRECTIONS)
+        chunk.counts = bytes(counts)
+        return chunk.counts
+
+    def _evict(self) -> None:
+        """
+        Description: drops least recently used clean chunks until the cache fits again; dirty
+        chunks are kept whatever their age
+        Inputs: None
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        excess = len(self._chunks) - self.cache_size
+        if excess <= 0:
+            return
+        for key in [key for key, chunk in self._chunks.items() if not chunk.dirty][:excess]:
+            del self._chunks[key]
+
+    def value(self, row: int, col: int) -> int:
+        """
+        Description: CELL_MINE or the neighbor mine count of any cell, revealed or not
+        Inputs: row (int), col (int): cell position
+        Outputs: int: cell value
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        key, i = self._locate(row, col)
+        chunk = self._chunk(key)
+        value = CELL_MINE if (chunk.mines >> i) & 1 else self._counts(key, chunk)[i]
+        self._evict()
+        return value
+
+    def visible(self, row: int, col: int) -> int | None:
+        """
+        Description: what the player sees at a cell
+        Inputs: row (int), col (int): cell position
+        Outputs: int | None: value of a revealed cell, None if hidden
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        key, i = self._locate(row, col)
+        chunk = self._chunks.get(key)
+        if chunk is None or not (chunk.revealed >> i) & 1:
+            return None
+        return CELL_MINE if (chunk.mines >> i) & 1 else self._counts(key, chunk)[i]
+
+    def is_flagged(self, row: int, col: int) -> bool:
+        """
+        Description: whether a cell carries a flag
+        Inputs: row (int), col (int): cell position
+        Outputs: bool: True if flagged
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        key, i = self._locate(row, col)
+        chunk = self._chunks.get(key)
+        return chunk is not None and bool((chunk.flags >> i) & 1)
+
+    def window(self, top: int, left: int, rows: int, cols: int) -> list[list[int | None]]:
+        """
+        Description: the visible values of a rectangle of the board, for rendering a viewport
+        Inputs: top (int), left (int): upper-left cell, rows (int), cols (int): viewport size
+        Outputs: list[list[int | None]]: visible value per cell, None if hidden
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return [[self.visible(r, c) for c in range(left, left + cols)] for r in range(top, top + rows)]
+
+    def _start(self, row: int, col: int) -> None:
+        """
+        Description: clears the first click and its neighbors of mines, regenerating any chunk
+        already in memory so the cleared area applies everywhere
+        Inputs: row (int), col (int): first click
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self._cleared = frozenset([(row, col)] + [(row + dr, col + dc) for dr, dc in DIRECTIONS])
+        for key, chunk in self._chunks.items():
+            chunk.mines = self._generate(key)
+            chunk.counts = None
+        self.started = True
+
+    def flag_cell(self, pos: BoardPos) -> None:
+        """
+        Description: flags or unflags a hidden cell
+        Inputs: pos (BoardPos): position of the cell to flag/unflag
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        key, i = self._locate(pos.x, pos.y)
+        chunk = self._chunk(key)
+        if not (chunk.revealed >> i) & 1:
+            chunk.flags ^= 1 << i
+            self.flag_count += 1 if (chunk.flags >> i) & 1 else -1
+            self.version += 1
+        self._evict()
+
+    def reveal_cell(self, pos: BoardPos) -> bool:
+        """
+        Description: reveals a cell; blank cells expand like Board.reveal_cell, across chunk
+        borders. One call uncovers at most INFINITE_FLOOD_LIMIT cells; the unexpanded frontier is
+        kept and the expansion resumes on the next reveal_cell or expand call
+        Inputs: pos (BoardPos): position of the cell to reveal
+        Outputs: bool: False if a mine is revealed (game over), True otherwise
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        if not self.started:
+            self._start(pos.x, pos.y)
+        key, i = self._locate(pos.x, pos.y)
+        chunk = self._chunk(key)
+
+        # Flagged or already revealed cells are left alone, but a pending expansion still goes on
+        if (chunk.flags >> i) & 1 or (chunk.revealed >> i) & 1:
+            self._flood([])
+            return True
+
+        # If the cell is a mine, game over
+        if (chunk.mines >> i) & 1:
+            chunk.revealed |= 1 << i
+            self.revealed_count += 1
+            self.isAlive = False
+            self.version += 1
+            self._evict()
+            return False
+
+        self._flood([(pos.x, pos.y)])
+        return True
+
+    def expand(self) -> int:
+        """
+        Description: continues an expansion that an earlier reveal stopped at INFINITE_FLOOD_LIMIT
+        Inputs: None
+        Outputs: int: cells uncovered by this call
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return self._flood([])
+
+    def _flood(self, cells: list[Cell]) -> int:
+        """
+        Description: reveals `cells`, then the pending frontier, expanding blank cells until the
+        frontier is empty or INFINITE_FLOOD_LIMIT cells were uncovered; what is left is kept
+        Inputs: cells (list[Cell]): newly clicked cells
+        Outputs: int: cells uncovered
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        # The click goes on top, so its own area opens before older leftovers
+        stack = self._frontier + cells
+        self._frontier = []
+        uncovered = 0
+        while stack and uncovered < INFINITE_FLOOD_LIMIT:
+            r, c = stack.pop()
+            key, i = self._locate(r, c)
+            chunk = self._chunk(key)
+            bit = 1 << i
+            if chunk.revealed & bit or chunk.flags & bit or chunk.mines & bit:
+                continue
+            chunk.revealed |= bit
+            uncovered += 1
+            if self._counts(key, chunk)[i] == 0:
+                stack.extend((r + dr, c + dc) for dr, dc in DIRECTIONS)
+        self._frontier = stack
+        if uncovered:
+            self.revealed_count += uncovered
+            self.version += 1
+        self._evict()
+        return uncovered
+
+    @property
+    def expanding(self) -> bool:
+        """
+        Description: whether an expansion was cut off at INFINITE_FLOOD_LIMIT and has cells left
+        Inputs: None
+        Outputs: bool: True while expand() has work to do
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return bool(self._frontier)
+
+    @property
+    def loaded_chunks(self) -> int:
+        """
+        Description: number of chunks currently in memory
+        Inputs: None
+        Outputs: int: cached chunk count
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return len(self._chunks)
@@ -1,6 +1,7 @@
 """
 Name: main.py
-Description: Entry point for the backend logic.
+Description: Entry point for the backend logic. With no arguments it starts the interactive CLI
+game; --script and --random play games headlessly and print only results and timing.
 Inputs: None
 Outputs: None
 External Sources: N/A
@@ -8,19 +9,98 @@ Author(s): Riley Meyerkorth (this is what version control is for lol)
 Creation Date: 10 September 2025 (this is what version control is for lol)
 """
 
+import argparse
+import sys
+import time
+from collections import Counter
+
 # Support both `python -m backend.main` and `python backend/main.py`
 if __name__ == "__main__" and (__package__ is None or __package__ == ""):
     # Running as a script: add project root to sys.path and use absolute import
     import os
-    import sys
     PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     if PROJECT_ROOT not in sys.path:
         sys.path.insert(0, PROJECT_ROOT)
-    from backend.controller import Controller  # type: ignore
+    from backend.controller import Controller, parse_script  # type: ignore
+    from backend.constants import AI_DIFFICULTIES, DEFAULT_COLS, DEFAULT_MINE_COUNT, DEFAULT_ROWS  # type: ignore
+    from backend.models import BoardEngineType, BoardSize  # type: ignore
 else:
     # Running as a module: relative import works
-    from .controller import Controller
+    from .controller import Controller, parse_script
+    from .constants import AI_DIFFICULTIES, DEFAULT_COLS, DEFAULT_MINE_COUNT, DEFAULT_ROWS
+    from .models import BoardEngineType, BoardSize
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Description: command line options for the CLI
+    Inputs: argv (list[str] | None): arguments, defaults to sys.argv
+    Outputs: argparse.Namespace: parsed options
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    parser = argparse.ArgumentParser(description="Minesweeper on the command line.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--script", metavar="FILE", help="play the moves in FILE ('-' reads stdin) without rendering")
+    mode.add_argument("--random", metavar="GAMES", type=int, help="play GAMES seeded games with the AI picking moves")
+    parser.add_argument("--ai", choices=AI_DIFFICULTIES, default="easy", help="AI used by --random (easy plays at random)")
+    parser.add_argument("--seed", type=int, default=0, help="board seed of the first --random game")
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    parser.add_argument("--cols", type=int, default=DEFAULT_COLS)
+    parser.add_argument("--mines", type=int, default=DEFAULT_MINE_COUNT)
+    parser.add_argument("--engine", type=BoardEngineType, choices=list(BoardEngineType), default=BoardEngineType.LIST)
+    parser.add_argument("--quiet", action="store_true", help="print only the summary")
+    parser.add_argument("--watch", action="store_true", help="draw every headless move, updating the board in place")
+    parser.add_argument("--ansi", action="store_true", help="redraw the interactive board in place")
+    return parser.parse_args(argv)
+
+
+def run_headless(args: argparse.Namespace) -> int:
+    """
+    Description: plays the scripted or random games and prints one line per game and a summary
+    Inputs: args (argparse.Namespace): options from parse_args
+    Outputs: int: exit status (1 if the script could not be read)
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    controller = Controller(args.mines, BoardSize(args.rows, args.cols), args.engine, ansi=args.watch)
+    if args.script is not None:
+        try:
+            if args.script == "-":
+                games = parse_script(sys.stdin)
+            else:
+                with open(args.script) as f:
+                    games = parse_script(f)
+        except (OSError, ValueError) as e:
+            print(f"{args.script}: {e}", file=sys.stderr)
+            return 1
+        results = controller.run_script(games, args.watch)
+    else:
+        results = controller.run_random(args.random, args.seed, args.ai, args.watch)
+
+    outcomes: Counter[str] = Counter()
+    moves = 0
+    start = time.perf_counter()
+    for number, result in enumerate(results, start=1):
+        outcomes[result.result] += 1
+        moves += result.moves
+        if not args.quiet:
+            seed = "random" if result.seed is None else result.seed
+            print(f"game {number} (seed {seed}): {result.result} after {result.moves} moves in {result.seconds * 1000:.2f} ms")
+    elapsed = time.perf_counter() - start
+    games = sum(outcomes.values())
+    summary = ", ".join(f"{count} {outcome}" for outcome, count in sorted(outcomes.items()))
+    print(f"{games} games ({summary or 'none played'}), {moves} moves in {elapsed:.3f}s "
+          f"({games / elapsed if elapsed else 0:.0f} games/s, {moves / elapsed if elapsed else 0:.0f} moves/s)")
+    return 0
+
 
 if __name__ == "__main__":
-    c = Controller()
-    c.run()
\ No newline at end of file
+    options = parse_args()
+    if options.script is None and options.random is None:
+        c = Controller(options.mines, BoardSize(options.rows, options.cols), options.engine, options.ansi)
+        c.run()
+    else:
+        sys.exit(run_headless(options))
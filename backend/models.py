@@ -14,6 +14,8 @@ from typing import Optional, Union, List
 from enum import Enum
 
 from .constants import (
+    AI_DEFAULT_DEADLINE_MS,
+    AI_MAX_DEADLINE_MS,
     DEFAULT_COLS,
     DEFAULT_MINE_COUNT,
     DEFAULT_ROWS,
@@ -22,7 +24,8 @@ from .constants import (
     MIN_COLS,
     MAX_COLS,
     MIN_MINES,
-    MAX_MINES
+    MAX_MINES,
+    PLAYER_NAME_MAX_LENGTH
 )
 
 from dataclasses import dataclass
@@ -49,6 +52,17 @@ class PlayerType(str, Enum):
     HUMAN = "human"
     AI = "ai"
 
+class BoardEngineType(str, Enum):
+    """
+    Description: Selects the board implementation used for a game.
+    Inputs: None
+    Outputs: Enum values accepted by NewGameParams.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    """
+    LIST = "list"           # Board: 2D lists (reference engine)
+    BITBOARD = "bitboard"   # BitBoard: integer bitsets
+
 class BoardPos(BaseModel):
     """
     Description: Simple Pydantic model representing a board coordinate.
@@ -77,6 +91,10 @@ class BoardPos(BaseModel):
                 data = {**data, 'x': data.get('x', data['row']), 'y': data.get('y', data['col'])}
         return data
 
+# Lightweight (row, col) coordinate used inside Board hot loops.
+# BoardPos is reserved for the API boundary since constructing it runs validation.
+Cell = tuple[int, int]
+
 @dataclass
 class BoardSize:
     """
@@ -133,15 +151,128 @@ class BoardFrontendModel(BaseModel):
     win: Optional[bool] = None
     error: Optional[str] = None
     state: Optional[BoardStateModel] = None
+    # Public id spectators can watch the game with, sent to the player only
+    watch_id: Optional[str] = None
+    # Whether the game is on a no-guess board; turns False when none matched the first click
+    no_guess: Optional[bool] = None
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+class HintModel(BaseModel):
+    """
+    Description: Hint payload for the visible board: provably safe cells,
+    provable mines, and a mine-probability heatmap (None for revealed cells
+    or where no probability could be computed). Sampled heatmaps also carry
+    per-cell error bounds.
+    Inputs: solver analysis of the current board
+    Outputs: payload sent to the frontend
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    """
+    ok: bool
+    error: Optional[str] = None
+    safe: List[BoardPos] = []
+    mines: List[BoardPos] = []
+    probabilities: Optional[List[List[Optional[float]]]] = None
+    # 95% error bounds, only present when probabilities were sampled
+    uncertainty: Optional[List[List[Optional[float]]]] = None
+    exact: bool = True
+    version: int = 0
 
     def __getitem__(self, key):
         return getattr(self, key)
 
+class StoreStatsModel(BaseModel):
+    """
+    Description: Memory report for the game store: games held in memory
+    versus hibernated to disk, the bytes each tier uses, and how many
+    abandoned games were expired.
+    Inputs: GameStore.stats()
+    Outputs: payload for the store stats route
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    """
+    kind: str
+    resident: int = 0
+    hibernated: int = 0
+    resident_bytes: int = 0
+    hibernated_bytes: int = 0
+    budget_bytes: Optional[int] = None
+    # games deleted by this worker after sitting idle for expire_seconds
+    expired: int = 0
+    expire_seconds: Optional[float] = None
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+class LeaderboardEntryModel(BaseModel):
+    """
+    Description: One player's row on a leaderboard: their fastest win in the
+    configuration and their record in it.
+    Inputs: statistics aggregates
+    Outputs: leaderboard entry
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    """
+    rank: int
+    name: str
+    best_seconds: float
+    played: int
+    won: int
+    win_rate: float
+    best_streak: int
+
+class LeaderboardModel(BaseModel):
+    """
+    Description: Fastest players for one game configuration.
+    Inputs: StatsStore.leaderboard()
+    Outputs: payload for the leaderboard route
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    """
+    ok: bool
+    error: Optional[str] = None
+    config: Optional[str] = None
+    entries: List[LeaderboardEntryModel] = []
+
+class ProfileConfigModel(BaseModel):
+    """
+    Description: A player's aggregates for one game configuration.
+    Inputs: statistics aggregates
+    Outputs: part of the profile payload
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    """
+    config: str
+    played: int
+    won: int
+    win_rate: float
+    best_seconds: Optional[float] = None
+    average_seconds: float
+    streak: int
+    best_streak: int
+
+class ProfileModel(BaseModel):
+    """
+    Description: The calling player's statistics across every configuration
+    they have played.
+    Inputs: StatsStore.profile()
+    Outputs: payload for the profile route
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    """
+    ok: bool
+    error: Optional[str] = None
+    name: Optional[str] = None
+    configs: List[ProfileConfigModel] = []
+
 class NewGameParams(BaseModel):
     """
     Description: Parameters accepted when creating a new game. Performs
     basic validation via pydantic (bounds on rows/cols/mines).
-    Inputs: rows, cols, mines, interactive, game_mode, ai_difficulty
+    Inputs: rows, cols, mines, interactive, game_mode, ai_difficulty, no_guess, ai_deadline_ms, engine, lazy_counts,
+            player_name
     Outputs: validated parameters or a raised ValidationError
     Author(s): Riley Meyerkorth, Changwen Gong, John Tran
     Creation Date: 05 October 2025
@@ -152,6 +283,11 @@ class NewGameParams(BaseModel):
     interactive: bool = False   # <--- NEW
     game_mode: GameMode = GameMode.SOLO
     ai_difficulty: str = "medium"  # for co-op mode
+    no_guess: bool = False  # only deal boards that can be solved without guessing
+    ai_deadline_ms: int = Field(default=AI_DEFAULT_DEADLINE_MS, ge=1, le=AI_MAX_DEADLINE_MS)  # per-move AI search budget
+    engine: BoardEngineType = BoardEngineType.LIST  # board implementation for this game
+    lazy_counts: bool = False  # count cells when first revealed instead of after the first click
+    player_name: Optional[str] = Field(default=None, min_length=1, max_length=PLAYER_NAME_MAX_LENGTH)  # shown on leaderboards
 
     @model_validator(mode='after')
     def validate_mines_vs_cells(self):
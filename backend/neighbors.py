@@ -0,0 +1,88 @@
+"""
+Name: neighbors.py
+Description: Precomputed neighbor tables shared by every board of the same size.
+Inputs: None
+Outputs: None
+External Sources: N/A
+Author(s): Riley Meyerkorth
+Creation Date: 19 October 2026
+"""
+
+import threading
+import weakref
+
+from .constants import DIRECTIONS
+from .models import Cell
+
+
+class NeighborTable:
+    """
+    Description: Read-only lookup of the in-bounds neighbors of every cell on a rows x cols board.
+    Entries are indexed by the flat cell index (row * cols + col), so edge handling is done once
+    when the table is built instead of on every neighbor walk.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    __slots__ = ("rows", "cols", "coords", "indices", "__weakref__")
+
+    def __init__(self, rows: int, cols: int):
+        """
+        Description: builds the neighbor coordinates and flat indices for every cell
+        Inputs: rows (int), cols (int): board dimensions
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self.rows: int = rows
+        self.cols: int = cols
+        coords: list[tuple[Cell, ...]] = []
+        indices: list[tuple[int, ...]] = []
+        for r in range(rows):
+            for c in range(cols):
+                # Keep only the directions that stay on the board
+                cells = tuple(
+                    (r + dr, c + dc)
+                    for dr, dc in DIRECTIONS
+                    if 0 <= r + dr < rows and 0 <= c + dc < cols
+                )
+                coords.append(cells)
+                indices.append(tuple(nr * cols + nc for nr, nc in cells))
+        self.coords: tuple[tuple[Cell, ...], ...] = tuple(coords)
+        self.indices: tuple[tuple[int, ...], ...] = tuple(indices)
+
+    def of(self, row: int, col: int) -> tuple[Cell, ...]:
+        """
+        Description: returns the (row, col) neighbors of a cell
+        Inputs: row (int), col (int): cell to look up
+        Outputs: tuple[Cell, ...]: in-bounds neighbor coordinates
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return self.coords[row * self.cols + col]
+
+
+# Tables live only as long as some board holds a reference to them
+_tables: "weakref.WeakValueDictionary[tuple[int, int], NeighborTable]" = weakref.WeakValueDictionary()
+_tables_lock = threading.Lock()
+
+
+def get_neighbor_table(rows: int, cols: int) -> NeighborTable:
+    """
+    Description: returns the shared neighbor table for a board size, building it on first use.
+    Unused tables are evicted automatically once the last board of that size is gone.
+    Inputs: rows (int), cols (int): board dimensions
+    Outputs: NeighborTable: shared read-only table
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    key = (rows, cols)
+    with _tables_lock:
+        table = _tables.get(key)
+        if table is None:
+            table = NeighborTable(rows, cols)
+            _tables[key] = table
+        return table
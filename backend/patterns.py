@@ -0,0 +1,216 @@
+"""
+Name: patterns.py
+Description: Local-pattern deduction database for the rule-based AI. Every window around two
+adjacent revealed numbers is mapped to the cells those two numbers force to be safe or mines.
+The table is written to a flat binary file (by `python -m backend.patterns`, or on first use if the
+file is missing) and memory-mapped at runtime, so a lookup is a single array index per frontier
+pair. Where the file cannot be written or mapped, the table is built in memory instead.
+Inputs: None
+Outputs: None
+External Sources: N/A
+Author(s): Riley Meyerkorth
+Creation Date: 19 October 2026
+"""
+
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+from array import array
+from typing import Optional
+
+from .constants import PATTERN_DB_PATH
+
+# Window around a horizontal pair A=(r, c), B=(r, c + 1), as offsets from A. The pair itself is
+# left out; these ten cells hold every other neighbor of A and B.
+WINDOW: tuple[tuple[int, int], ...] = (
+    (-1, -1), (-1, 0), (-1, 1), (-1, 2),
+    (0, -1),                    (0, 2),
+    (1, -1), (1, 0), (1, 1), (1, 2),
+)
+WINDOW_CELLS = len(WINDOW)
+# Bits of the window that neighbor A and B respectively
+A_MASK = sum(1 << i for i, (_, dc) in enumerate(WINDOW) if dc <= 1)
+B_MASK = sum(1 << i for i, (_, dc) in enumerate(WINDOW) if dc >= 0)
+
+# Remaining mine counts (number minus adjacent flags) range over 0-8
+NEED_VALUES = 9
+ENTRIES = NEED_VALUES * NEED_VALUES * (1 << WINDOW_CELLS)
+
+# Entry layout: bits 0-9 forced-safe window cells, bits 10-19 forced-mine window cells
+MINE_SHIFT = WINDOW_CELLS
+CELL_BITS = (1 << WINDOW_CELLS) - 1
+
+_MAGIC = b"MSPD"
+_VERSION = 1
+_HEADER = struct.Struct("<4sII4x")
+
+
+def pattern_index(need_a: int, need_b: int, hidden_mask: int) -> int:
+    """
+    Description: table index of a window
+    Inputs: need_a, need_b (int): mines still missing around A and B, hidden_mask (int): hidden window cells
+    Outputs: int: entry index
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    return ((need_a * NEED_VALUES + need_b) << WINDOW_CELLS) | hidden_mask
+
+
+def build_pattern_entries() -> array:
+    """
+    Description: enumerates every window. For each hidden mask, every mine assignment is visited
+    once and filed under the (mines around A, mines around B) it produces; a cell that is empty in
+    every assignment of a bucket is safe, one that is filled in every assignment is a mine.
+    Inputs: None
+    Outputs: array('I'): packed entries indexed by pattern_index
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    entries = array("I", bytes(4 * ENTRIES))
+    for mask in range(1 << WINDOW_CELLS):
+        always: dict[tuple[int, int], int] = {}
+        ever: dict[tuple[int, int], int] = {}
+        # Walk every subset of the hidden cells
+        sub = mask
+        while True:
+            key = ((sub & A_MASK).bit_count(), (sub & B_MASK).bit_count())
+            always[key] = always.get(key, sub) & sub
+            ever[key] = ever.get(key, 0) | sub
+            if sub == 0:
+                break
+            sub = (sub - 1) & mask
+        for (need_a, need_b), mines in always.items():
+            safe = mask & ~ever[(need_a, need_b)]
+            entries[pattern_index(need_a, need_b, mask)] = safe | (mines << MINE_SHIFT)
+    return entries
+
+
+def write_pattern_db(path: str = PATTERN_DB_PATH) -> None:
+    """
+    Description: generates the database and writes it atomically to `path`
+    Inputs: path (str): output file
+    Outputs: None
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    entries = build_pattern_entries()
+    if sys.byteorder != "little":
+        entries.byteswap()
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, ENTRIES))
+            entries.tofile(f)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+
+class PatternTable:
+    """
+    Description: Read-only, memory-mapped view of the pattern database, or an in-memory copy
+    when the file is unavailable.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+
+    def __init__(self, path: str = PATTERN_DB_PATH):
+        """
+        Description: maps the database file, generating it first if it is missing or stale. If the
+        file cannot be written or mapped (e.g. a read-only install), the entries are built in memory
+        Inputs: path (str): database file
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self._map: Optional[mmap.mmap] = None
+        self._entries: memoryview | array
+        try:
+            if not _valid(path):
+                write_pattern_db(path)
+            with open(path, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Building the table only takes a moment, so lookups still work without the file
+            self._entries = build_pattern_entries()
+            return
+        view = memoryview(self._map)[_HEADER.size:]
+        # The file is little-endian; on other platforms fall back to an in-memory swapped copy
+        if sys.byteorder == "little":
+            self._entries = view.cast("I")
+        else:
+            self._entries = array("I", view.tobytes())
+            self._entries.byteswap()
+
+    def lookup(self, need_a: int, need_b: int, hidden_mask: int) -> tuple[int, int]:
+        """
+        Description: forced cells for a window
+        Inputs: need_a, need_b (int): mines still missing around A and B, hidden_mask (int): hidden window cells
+        Outputs: tuple[int, int]: (safe window mask, mine window mask)
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        entry = self._entries[pattern_index(need_a, need_b, hidden_mask)]
+        return entry & CELL_BITS, entry >> MINE_SHIFT
+
+
+def _valid(path: str) -> bool:
+    """
+    Description: checks that a database file exists and matches this version of the format
+    Inputs: path (str): database file
+    Outputs: bool: True if the file can be mapped as-is
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    try:
+        with open(path, "rb") as f:
+            magic, version, entries = _HEADER.unpack(f.read(_HEADER.size))
+        return (
+            magic == _MAGIC
+            and version == _VERSION
+            and entries == ENTRIES
+            and os.path.getsize(path) == _HEADER.size + 4 * ENTRIES
+        )
+    except (OSError, struct.error):
+        return False
+
+
+_table: Optional[PatternTable] = None
+_table_lock = threading.Lock()
+
+
+def get_pattern_table() -> PatternTable:
+    """
+    Description: returns the process-wide pattern table, mapping it on first use
+    Inputs: None
+    Outputs: PatternTable: shared table
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    global _table
+    with _table_lock:
+        if _table is None:
+            _table = PatternTable()
+        return _table
+
+
+if __name__ == "__main__":
+    # Offline generation: python -m backend.patterns [path]
+    target = sys.argv[1] if len(sys.argv) > 1 else PATTERN_DB_PATH
+    write_pattern_db(target)
+    print(f"Wrote {ENTRIES} patterns to {target}")
@@ -0,0 +1,150 @@
+"""
+Name: render.py
+Description: Terminal rendering for the CLI. A frame is built as one string and written with a
+single call, rows are labeled A..Z, AA, AB, ... so boards of any size get unique labels, and
+column widths grow with the column numbers. With ANSI output enabled, later frames only move the
+cursor to the cells that changed and rewrite those, which keeps large boards watchable while a
+simulation plays.
+Inputs: None
+Outputs: None
+External Sources: ANSI escape codes (https://en.wikipedia.org/wiki/ANSI_escape_code)
+Author(s): Riley Meyerkorth
+Creation Date: 19 October 2026
+"""
+
+import sys
+from typing import Sequence, TextIO
+
+_CLEAR = "\x1b[H\x1b[2J"   # cursor home, clear screen
+
+
+def row_label(row: int) -> str:
+    """
+    Description: label of a row: A..Z, then AA..AZ, BA.. and so on, like spreadsheet columns
+    Inputs: row (int): 0-based row index
+    Outputs: str: label
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    label = ""
+    row += 1
+    while row:
+        row, digit = divmod(row - 1, 26)
+        label = chr(ord("A") + digit) + label
+    return label
+
+
+def parse_row_label(label: str) -> int:
+    """
+    Description: row index of a label written by row_label (case-insensitive)
+    Inputs: label (str): letters only
+    Outputs: int: 0-based row index; raises ValueError for anything but letters
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    if not label or not label.isascii() or not label.isalpha():
+        raise ValueError(f"Not a row label: {label!r}")
+    row = 0
+    for letter in label.upper():
+        row = row * 26 + ord(letter) - ord("A") + 1
+    return row - 1
+
+
+class TerminalRenderer:
+    """
+    Description: Draws boards of one size. Cells are given as a flat, row-major sequence of
+    one-character glyphs. Without ANSI every draw writes the whole frame; with ANSI the first
+    draw clears the screen and later draws rewrite only the cells whose glyph changed.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+
+    def __init__(self, rows: int, cols: int, ansi: bool = False, stream: TextIO | None = None):
+        """
+        Description: works out the label and column widths for the board size
+        Inputs: rows, cols (int): board size, ansi (bool): redraw changed cells in place,
+                stream (TextIO | None): output, defaults to sys.stdout at draw time
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self.rows: int = rows
+        self.cols: int = cols
+        self.ansi: bool = ansi
+        self.stream: TextIO | None = stream
+        self._label_width: int = len(row_label(rows - 1))
+        self._cell_width: int = len(str(cols))
+        self._labels: list[str] = [row_label(r).ljust(self._label_width) for r in range(rows)]
+        self._header: str = (" " * (self._label_width + 1)
+                             + "".join(f"| {c + 1:>{self._cell_width}} " for c in range(cols)) + "|")
+        self._previous: list[str] | None = None
+
+    def frame(self, glyphs: Sequence[str]) -> str:
+        """
+        Description: the whole board as text: column numbers, a divider and one labeled line per row
+        Inputs: glyphs (Sequence[str]): one glyph per cell, row-major
+        Outputs: str: frame ending in a newline
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        width, cols = self._cell_width, self.cols
+        lines = [self._header, "-" * len(self._header)]
+        for r in range(self.rows):
+            cells = glyphs[r * cols:(r + 1) * cols]
+            lines.append(self._labels[r] + " " + "".join(f"  {glyph:>{width}} " for glyph in cells))
+        lines.append("")
+        return "\n".join(lines)
+
+    def _cursor(self, index: int) -> str:
+        """
+        Description: ANSI escape moving the cursor onto a cell of the frame drawn at the top left
+        Inputs: index (int): row-major cell index
+        Outputs: str: escape sequence
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        r, c = divmod(index, self.cols)
+        # two header lines above the first row; 1-based terminal coordinates
+        return f"\x1b[{r + 3};{self._label_width + 2 + c * (self._cell_width + 3) + 2}H"
+
+    def update(self, glyphs: Sequence[str]) -> str:
+        """
+        Description: text that brings the terminal up to date with `glyphs`: the whole frame,
+        or with ANSI after the first frame, cursor moves and the changed glyphs only
+        Inputs: glyphs (Sequence[str]): one glyph per cell, row-major
+        Outputs: str: text to write
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        glyphs = list(glyphs)
+        previous, self._previous = self._previous, glyphs
+        if not self.ansi:
+            return self.frame(glyphs)
+        if previous is None:
+            return _CLEAR + self.frame(glyphs)
+        width = self._cell_width
+        parts = [self._cursor(i) + f"{glyph:>{width}}"
+                 for i, (glyph, old) in enumerate(zip(glyphs, previous)) if glyph != old]
+        # park the cursor below the board and clear what was printed there last time
+        parts.append(f"\x1b[{self.rows + 3};1H\x1b[J")
+        return "".join(parts)
+
+    def draw(self, glyphs: Sequence[str]) -> None:
+        """
+        Description: writes the update for `glyphs` with a single write call
+        Inputs: glyphs (Sequence[str]): one glyph per cell, row-major
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        stream = self.stream if self.stream is not None else sys.stdout
+        stream.write(self.update(glyphs))
+        stream.flush()
@@ -0,0 +1,443 @@
+"""
+Name: replay.py
+Description: Compact binary replays of finished games. A replay is a small header (seed, size, mine
+count, mode, AI difficulty, outcome and, for boards that a seed cannot rebuild, the mine layout)
+followed by the moves, each a varint holding the cell, action and player plus a varint delay in
+milliseconds. Replays are appended length-prefixed to rolling files and read back as a stream, so
+analytics and benchmarks can walk millions of games in constant memory and rebuild any board state.
+Inputs: None
+Outputs: None
+External Sources: LEB128 varints (https://en.wikipedia.org/wiki/LEB128)
+Author(s): Riley Meyerkorth
+Creation Date: 19 October 2026
+"""
+
+import glob
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import BinaryIO, Iterable, Iterator, NamedTuple, Optional
+
+from .constants import AI_DIFFICULTIES, REPLAY_FILE_BYTES, REPLAY_MAGIC, REPLAY_PATH, REPLAY_READ_CHUNK
+from .engine import BoardEngine, create_engine
+from .models import BoardEngineType, BoardPos, BoardSize, GameMode, PlayerType
+
+# Move actions; the TURN_ ones go through the co-op turn logic
+ACTION_REVEAL = 0
+ACTION_FLAG = 1
+ACTION_TURN_REVEAL = 2
+ACTION_TURN_FLAG = 3
+
+# Header flag bits
+_FLAG_COOP = 1
+_FLAG_LAYOUT = 2
+_FLAG_WON = 4
+_FLAG_SEEDED = 8
+
+_PLAYERS = (PlayerType.HUMAN, PlayerType.AI)
+
+
+def write_varint(out: bytearray, value: int) -> None:
+    """
+    Description: appends an unsigned LEB128 varint
+    Inputs: out (bytearray): buffer, value (int): non-negative integer
+    Outputs: None
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    """
+    Description: decodes an unsigned LEB128 varint
+    Inputs: data (bytes): buffer, pos (int): offset of the varint
+    Outputs: tuple[int, int]: value and the offset after it; raises IndexError if data ends first
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+class Move(NamedTuple):
+    """
+    Description: One decoded move.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    action: int
+    player: PlayerType
+    row: int
+    col: int
+    delay_ms: int
+
+
+class MoveLog:
+    """
+    Description: Moves of a game in progress, already varint-encoded so recording costs a few bytes
+    per move and the log pickles with the game.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    __slots__ = ("data", "count", "stamp", "placed_at")
+
+    def __init__(self):
+        """
+        Description: creates an empty log
+        Inputs: None
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self.data: bytearray = bytearray()
+        self.count: int = 0
+        # wall clock of the previous move in ms; wall time so any worker can continue the log
+        self.stamp: Optional[int] = None
+        # index of the move the mines were dealt for
+        self.placed_at: Optional[int] = None
+
+    def __getstate__(self) -> tuple:
+        """
+        Description: pickled state
+        Inputs: None
+        Outputs: tuple: data, count, stamp and placement
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return self.data, self.count, self.stamp, self.placed_at
+
+    def __setstate__(self, state: tuple) -> None:
+        """
+        Description: restores a pickled log
+        Inputs: state (tuple): output of __getstate__
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self.data, self.count, self.stamp, self.placed_at = state
+
+    def placed(self) -> None:
+        """
+        Description: notes that the mines were dealt for the next recorded move
+        Inputs: None
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self.placed_at = self.count
+
+    def add(self, action: int, player: PlayerType, pos: BoardPos, cols: int) -> None:
+        """
+        Description: records a move
+        Inputs: action (int): ACTION_* value, player (PlayerType): who moved,
+                pos (BoardPos): cell, cols (int): board width
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        now = int(time.time() * 1000)
+        delay = max(0, now - self.stamp) if self.stamp is not None else 0
+        self.stamp = now
+        cell = pos.x * cols + pos.y
+        write_varint(self.data, (cell << 3) | (action << 1) | (player == PlayerType.AI))
+        write_varint(self.data, delay)
+        self.count += 1
+
+
+@dataclass
+class Replay:
+    """
+    Description: One recorded game. Moves stay encoded until moves() is called, so scans that only
+    need the header never decode them.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    rows: int
+    cols: int
+    mines: int
+    game_mode: GameMode = GameMode.SOLO
+    difficulty: Optional[str] = None
+    won: bool = False
+    started: int = 0                             # unix time in seconds
+    seed: Optional[int] = None
+    layout: Optional[list[tuple[int, int]]] = None  # mine cells when the seed cannot rebuild them
+    placed_at: Optional[int] = None              # move the mines were dealt for, None if never dealt
+    move_count: int = 0
+    move_data: bytes = b""
+
+    def encode(self) -> bytes:
+        """
+        Description: serializes the replay without its length prefix
+        Inputs: None
+        Outputs: bytes: payload
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        out = bytearray()
+        flags = ((_FLAG_COOP if self.game_mode == GameMode.COOP else 0)
+                 | (_FLAG_LAYOUT if self.layout is not None else 0)
+                 | (_FLAG_WON if self.won else 0)
+                 | (_FLAG_SEEDED if self.seed is not None else 0))
+        difficulty = AI_DIFFICULTIES.index(self.difficulty) + 1 if self.difficulty in AI_DIFFICULTIES else 0
+        placed_at = self.placed_at + 1 if self.placed_at is not None else 0
+        for value in (flags, self.rows, self.cols, self.mines, difficulty, self.started, self.seed or 0, placed_at):
+            write_varint(out, value)
+        if self.layout is not None:
+            # sorted cell indices, stored as gaps
+            write_varint(out, len(self.layout))
+            previous = 0
+            for cell in sorted(r * self.cols + c for r, c in self.layout):
+                write_varint(out, cell - previous)
+                previous = cell
+        write_varint(out, self.move_count)
+        out += self.move_data
+        return bytes(out)
+
+    @classmethod
+    def decode(cls, data: bytes) -> "Replay":
+        """
+        Description: parses a payload written by encode()
+        Inputs: data (bytes): payload
+        Outputs: Replay: decoded replay with its moves still encoded
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        values = []
+        pos = 0
+        for _ in range(8):
+            value, pos = read_varint(data, pos)
+            values.append(value)
+        flags, rows, cols, mines, difficulty, started, seed, placed_at = values
+        layout = None
+        if flags & _FLAG_LAYOUT:
+            count, pos = read_varint(data, pos)
+            layout, cell = [], 0
+            for _ in range(count):
+                gap, pos = read_varint(data, pos)
+                cell += gap
+                layout.append(divmod(cell, cols))
+        move_count, pos = read_varint(data, pos)
+        return cls(
+            rows=rows, cols=cols, mines=mines,
+            game_mode=GameMode.COOP if flags & _FLAG_COOP else GameMode.SOLO,
+            difficulty=AI_DIFFICULTIES[difficulty - 1] if 0 < difficulty <= len(AI_DIFFICULTIES) else None,
+            won=bool(flags & _FLAG_WON),
+            started=started,
+            seed=seed if flags & _FLAG_SEEDED else None,
+            layout=layout,
+            placed_at=placed_at - 1 if placed_at else None,
+            move_count=move_count,
+            move_data=bytes(data[pos:]),
+        )
+
+    def moves(self) -> Iterator[Move]:
+        """
+        Description: decodes the moves in order
+        Inputs: None
+        Outputs: Iterator[Move]: moves
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        data, pos = self.move_data, 0
+        for _ in range(self.move_count):
+            packed, pos = read_varint(data, pos)
+            delay, pos = read_varint(data, pos)
+            row, col = divmod(packed >> 3, self.cols)
+            yield Move((packed >> 1) & 3, _PLAYERS[packed & 1], row, col, delay)
+
+    def board(self, upto: Optional[int] = None, engine: BoardEngineType = BoardEngineType.LIST) -> BoardEngine:
+        """
+        Description: rebuilds the board by replaying the moves. Mines are dealt before the move they
+        were dealt for on the server, from the layout or from that move's cell and the seed
+        Inputs: upto (int | None): number of moves to apply, None for all,
+                engine (BoardEngineType): board implementation to rebuild with
+        Outputs: BoardEngine: board after the moves
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        if self.seed is None and self.layout is None:
+            raise ValueError("Replay has neither a seed nor a mine layout")
+        board = create_engine(engine, self.mines, self.game_mode, BoardSize(self.rows, self.cols), seed=self.seed)
+        for index, move in enumerate(self.moves()):
+            if upto is not None and index >= upto:
+                break
+            pos = BoardPos(x=move.row, y=move.col)
+            if index == self.placed_at:
+                if self.layout is not None:
+                    board.set_mines(self.layout)
+                else:
+                    board.place_mines(pos)
+                    board.update_mine_counts()
+            if move.action == ACTION_REVEAL:
+                board.reveal_cell(pos)
+            elif move.action == ACTION_FLAG:
+                board.flag_cell(pos)
+            elif move.action == ACTION_TURN_REVEAL:
+                board.handle_player_move(pos, move.player)
+            else:
+                board.handle_player_flag(pos, move.player)
+            if move.action >= ACTION_TURN_REVEAL:
+                # the server settles co-op wins after every turn
+                board.check_coop_win()
+        return board
+
+
+class ReplayWriter:
+    """
+    Description: Appends replays to files in a directory, starting a new file once the current one
+    reaches `max_bytes`. File names carry the start time and process id, so several workers can
+    share a directory.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+
+    def __init__(self, path: str, max_bytes: int = REPLAY_FILE_BYTES):
+        """
+        Description: prepares the directory; files are opened on the first write
+        Inputs: path (str): directory, max_bytes (int): size at which files roll over
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self.path: str = path
+        self.max_bytes: int = max_bytes
+        self._file: Optional[BinaryIO] = None
+        self._size: int = 0
+        self._rolls: int = 0
+        self._lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+
+    def _roll(self) -> None:
+        """
+        Description: closes the current file and starts the next one
+        Inputs: None
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        if self._file is not None:
+            self._file.close()
+        self._rolls += 1
+        name = f"replays-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{self._rolls:04d}.bin"
+        self._file = open(os.path.join(self.path, name), "ab")
+        self._file.write(REPLAY_MAGIC)
+        self._size = len(REPLAY_MAGIC)
+
+    def write(self, replay: Replay) -> None:
+        """
+        Description: appends one replay
+        Inputs: replay (Replay): finished game
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        payload = replay.encode()
+        record = bytearray()
+        write_varint(record, len(payload))
+        record += payload
+        with self._lock:
+            if self._file is None or self._size + len(record) > self.max_bytes:
+                self._roll()
+            self._file.write(record)
+            self._file.flush()
+            self._size += len(record)
+
+    def close(self) -> None:
+        """
+        Description: closes the current file
+        Inputs: None
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def _records(f: BinaryIO) -> Iterator[bytes]:
+    """
+    Description: splits a replay file into payloads, reading it in fixed-size chunks
+    Inputs: f (BinaryIO): file positioned after the magic
+    Outputs: Iterator[bytes]: payloads; a record cut off at the end of the file is skipped
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    buffer, pos = b"", 0
+    while True:
+        try:
+            length, start = read_varint(buffer, pos)
+            if start + length > len(buffer):
+                raise IndexError
+        except IndexError:
+            chunk = f.read(max(REPLAY_READ_CHUNK, len(buffer) - pos + 1))
+            if not chunk:
+                return
+            buffer, pos = buffer[pos:] + chunk, 0
+            continue
+        yield buffer[start:start + length]
+        pos = start + length
+
+
+def read_replays(paths: str | Iterable[str]) -> Iterator[Replay]:
+    """
+    Description: streams the replays stored in files or directories, in file name order
+    Inputs: paths (str | Iterable[str]): replay files and/or directories of them
+    Outputs: Iterator[Replay]: replays, one at a time
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    if isinstance(paths, str):
+        paths = [paths]
+    for path in paths:
+        files = sorted(glob.glob(os.path.join(path, "*.bin"))) if os.path.isdir(path) else [path]
+        for name in files:
+            with open(name, "rb") as f:
+                if f.read(len(REPLAY_MAGIC)) != REPLAY_MAGIC:
+                    raise ValueError(f"{name} is not a replay file")
+                for payload in _records(f):
+                    yield Replay.decode(payload)
+
+
+if __name__ == "__main__":
+    # python -m backend.replay [path...]: summarize recorded games
+    games = won = moves = 0
+    for replay in read_replays(sys.argv[1:] or [REPLAY_PATH]):
+        games += 1
+        won += replay.won
+        moves += replay.move_count
+    print(f"{games} games, {won} won, {moves} moves")
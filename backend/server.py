@@ -7,18 +7,29 @@ External Sources: N/A
 Author(s): Nicholas Holmes
 Creation Date: 18 September 2025
 """
+import asyncio
 import random
+import secrets
+import time
+import uuid
 
-from typing import Optional
+from contextlib import nullcontext
+from typing import Any, Callable, Optional
 
-from fastapi import FastAPI, APIRouter, HTTPException
+from fastapi import FastAPI, APIRouter, Cookie, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import ValidationError
 
 from .models import (
     BoardFrontendModel,
     BoardPos,
+    HintModel,
+    LeaderboardModel,
     NewGameParams,
+    ProfileModel,
+    StoreStatsModel,
     BoardSize,
     GameMode,
     PlayerType,
@@ -27,19 +38,43 @@ from .models import (
 from .constants import (
     API_HOST,
     API_PORT,
+    API_WORKERS,
     APIRoutes,
+    AI_DIFFICULTIES,
+    AI_MAX_DEADLINE_MS,
+    GAME_COOKIE,
+    GAME_STORE_RETRIES,
+    AI_MOVE_COST,
+    CELL_MINE,
+    DEFAULT_PLAYER_NAME,
+    LEADERBOARD_MAX_SIZE,
+    LEADERBOARD_SIZE,
+    MOVE_BURST,
+    MOVE_RATE,
+    NEW_GAME_BURST,
+    NEW_GAME_RATE,
+    PLAYER_COOKIE,
+    PLAYER_COOKIE_MAX_AGE,
+    REPLAY_PATH,
+    SPECTATOR_POLL_SECONDS,
+    STATS_PATH,
 )
 
-from .board import Board
+from .admission import Admission, AdmissionError
+from .engine import create_engine
+from .generator import NoGuessPool
+from .replay import ACTION_FLAG, ACTION_REVEAL, ACTION_TURN_FLAG, ACTION_TURN_REVEAL, Replay, ReplayWriter
+from .spectate import Broadcaster, Subscriber
+from .stats import GameRecord, StatsStore, config_key
+from .store import GameSession, GameStore, StaleGameError, create_store, watch_id
 
 
 class Server:
     """
-    Description: Encapsulates the Minesweeper game state and exposes FastAPI
-    routes. This class avoids module-level globals by containing the FastAPI
-    application instance, the active Board, and related runtime flags. Routes
-    are registered on construction and operate against the instance's board
-    state.
+    Description: Exposes the Minesweeper FastAPI routes. Each browser's game
+    lives in a GameSession kept in a GameStore and identified by a session
+    cookie, so any worker process can serve any request. Routes are registered
+    on construction and load, mutate and save the caller's session.
     Inputs: None
     Outputs: None
     Author(s): Nicholas Holmes
@@ -47,10 +82,10 @@ class Server:
     External Sources: FastAPI, pydantic
     """
 
-    def __init__(self):
+    def __init__(self, store: Optional[GameStore] = None):
         """
         Description: Initialize the FastAPI app, CORS middleware, and routes.
-        Inputs: None
+        Inputs: store (GameStore | None) - where games are kept, defaults to the configured store
         Outputs: None
         Author(s): Nicholas Holmes
         Creation Date: 18 September 2025
@@ -68,66 +103,97 @@ class Server:
             allow_headers=["*"],
         )
 
-        self.board: Optional[Board] = None
-        self.initialized: bool = False
-        self.alive: bool = True
-        self.game_mode: GameMode = GameMode.SOLO
-        self.ai_difficulty: str = "medium"
+        self.store: GameStore = store if store is not None else create_store()
+        self.app.router.on_shutdown.append(self.store.close)
+        # Rate limits, per-game pending moves and slots for expensive work
+        self.admission: Admission = Admission()
+        self.app.add_exception_handler(AdmissionError, self._refused)
+        # Finished games are appended to rolling replay files
+        self.replays: Optional[ReplayWriter] = ReplayWriter(REPLAY_PATH) if REPLAY_PATH else None
+        if self.replays is not None:
+            self.app.router.on_shutdown.append(self.replays.close)
+        # Finished games feed the leaderboards and player profiles
+        self.stats: Optional[StatsStore] = StatsStore(STATS_PATH) if STATS_PATH else None
+        if self.stats is not None:
+            self.app.router.on_shutdown.append(self.stats.close)
+        # Spectator streams of the games this worker serves
+        self.spectators: Broadcaster = Broadcaster()
+        # Background generator for no-guess boards; worker processes start on first use
+        self.generator: NoGuessPool = NoGuessPool()
+        self.app.router.on_shutdown.append(self.generator.shutdown)
 
         router = APIRouter()
 
         @router.post(APIRoutes.API_ROUTE_NEW_GAME)
-        def new_game(params: NewGameParams):
+        def new_game(params: NewGameParams, request: Request, response: Response,
+                     game_id: Optional[str] = Cookie(default=None, alias=GAME_COOKIE),
+                     player_id: Optional[str] = Cookie(default=None, alias=PLAYER_COOKIE)):
             """
             Description: Start a new game.
             Inputs: params (NewGameParams) - validated new game parameters
+                    request (Request) - caller, for the per-client new game limit
+                    game_id (str | None) - session cookie of the game being replaced
+                    player_id (str | None) - player cookie, issued here on a player's first game
             Outputs: BoardFrontendModel containing ok/error and optional state
             Author(s): Nicholas Holmes, Changwen Gong
             Creation Date: 18 September 2025
             External Sources: pydantic ValidationError
             """
-            try:
-                self.game_mode = params.game_mode
-                self.ai_difficulty = params.ai_difficulty
-                self.board = Board(params.mines, self.game_mode)
-                self.board.size = BoardSize(params.rows, params.cols)
-                self.board.board = [[0 for _ in range(params.cols)] for _ in range(params.rows)]
-                self.board.revealed = [[False for _ in range(params.cols)] for _ in range(params.rows)]
-                self.board.flags = [[False for _ in range(params.cols)] for _ in range(params.rows)]
-                self.board.flag_count = 0
-                self.board.isAlive = True
-                self.initialized = False
-                self.alive = True
-                return BoardFrontendModel(ok=True, state=self.board.to_dict())
-            except ValidationError as e:
-                return BoardFrontendModel(ok=False, error=str(e))
-            except Exception as e:
-                return BoardFrontendModel(ok=False, error=f"Failed to create new game: {str(e)}")
+            self.admission.rate(f"new:{request.client.host if request.client else ''}", NEW_GAME_RATE, NEW_GAME_BURST)
+            with self.admission.slot("generation"):
+                try:
+                    session = GameSession(
+                        game_id=uuid.uuid4().hex,
+                        game_mode=params.game_mode,
+                        ai_difficulty=params.ai_difficulty,
+                        no_guess=params.no_guess,
+                        ai_deadline_ms=params.ai_deadline_ms,
+                        player=player_id if player_id and player_id.isalnum() else uuid.uuid4().hex,
+                        player_name=params.player_name,
+                    )
+                    if session.no_guess:
+                        # Start filling the inventory while the player picks a first cell
+                        self.generator.ensure(params.rows, params.cols, params.mines)
+                    # Seeded so a replay can deal the same mines again
+                    session.board = create_engine(
+                        params.engine, params.mines, session.game_mode, BoardSize(params.rows, params.cols),
+                        params.lazy_counts, secrets.randbits(63)
+                    )
+                    self.store.save(session)
+                    # The new game replaces the caller's previous one
+                    if game_id is not None:
+                        self.store.delete(game_id)
+                    response.set_cookie(GAME_COOKIE, session.game_id, httponly=True, samesite="lax")
+                    if session.player != player_id:
+                        response.set_cookie(PLAYER_COOKIE, session.player, max_age=PLAYER_COOKIE_MAX_AGE,
+                                            httponly=True, samesite="lax")
+                    return BoardFrontendModel(ok=True, state=session.board.to_dict(), watch_id=watch_id(session.game_id))
+                except ValidationError as e:
+                    return BoardFrontendModel(ok=False, error=str(e))
+                except Exception as e:
+                    return BoardFrontendModel(ok=False, error=f"Failed to create new game: {str(e)}")
 
         @router.get(APIRoutes.API_ROUTE_STATE)
-        def state():
+        def state(game_id: Optional[str] = Cookie(default=None, alias=GAME_COOKIE)):
             """
             Description: Retrieve the current game state.
-            Inputs: None
+            Inputs: game_id (str | None) - session cookie
             Outputs: BoardFrontendModel with current state or error message
             Author(s): Nicholas Holmes
             Creation Date: 18 September 2025
             External Sources: N/A
             """
+            session = self._load(game_id)
             # If no board exists, return an error
-            if self.board is None:
+            if session is None or session.board is None:
                 return BoardFrontendModel(ok=False, error="No game in progress")
             # Otherwise, return the current state
-            state_model = self.board.to_dict(reveal_all=(not self.alive))
-            return BoardFrontendModel(
-                ok=True,
-                state=state_model,
-                alive=self.alive,
-                win=self.board.check_win(),
-            )
+            view = self._view(session)
+            view.watch_id = watch_id(session.game_id)
+            return view
 
         @router.post(APIRoutes.API_ROUTE_CLICK)
-        def click(c: BoardPos):
+        def click(c: BoardPos, game_id: Optional[str] = Cookie(default=None, alias=GAME_COOKIE)):
             """
             Description: Process a click at the provided board position.
             Outputs: BoardFrontendModel with updated state and alive/win status
@@ -135,217 +201,590 @@ class Server:
             Creation Date: 18 September 2025
             External Sources: Board implementation
             """
-            if self.board is None:
-                return BoardFrontendModel(ok=False, error="No board available to click")
+            def apply(session: Optional[GameSession]):
+                if session is None or session.board is None:
+                    return BoardFrontendModel(ok=False, error="No board available to click"), False
             
-            # Check co-op mode turn restrictions
-            if self.game_mode == GameMode.COOP:
-                if self.board.current_player != PlayerType.HUMAN:
-                    return BoardFrontendModel(ok=False, error="Not your turn")
-                if not self.board.human_alive:
-                    return BoardFrontendModel(ok=False, error="Human player is out")
+                # Check co-op mode turn restrictions
+                if session.game_mode == GameMode.COOP:
+                    if session.board.current_player != PlayerType.HUMAN:
+                        return BoardFrontendModel(ok=False, error="Not your turn"), False
+                    if not session.board.human_alive:
+                        return BoardFrontendModel(ok=False, error="Human player is out"), False
             
-            if not self.alive:
+                if not session.alive:
+                    return BoardFrontendModel(
+                        ok=True,
+                        state=session.board.to_dict(reveal_all=True),
+                        alive=session.alive,
+                        win=False,
+                    ), False
+
+                # First click: place mines and compute counts
+                if not session.initialized:
+                    self._place_mines(session, BoardPos(x=c.x, y=c.y))
+                    session.initialized = True
+
+                # Handle the move based on game mode
+                if session.game_mode == GameMode.COOP:
+                    print(f"[DEBUG] Human move in co-op mode - before: current_player={session.board.current_player}")
+                    success = session.board.handle_player_move(BoardPos(x=c.x, y=c.y), PlayerType.HUMAN)
+                    session.moves.add(ACTION_TURN_REVEAL, PlayerType.HUMAN, c, session.board.size.cols)
+                    session.alive = success
+                    win = session.board.check_coop_win()
+                    print(f"[DEBUG] Human move in co-op mode - after: current_player={session.board.current_player}, success={success}")
+                else:
+                    session.alive = session.board.reveal_cell(BoardPos(x=c.x, y=c.y))
+                    session.moves.add(ACTION_REVEAL, PlayerType.HUMAN, c, session.board.size.cols)
+                    win = session.board.check_win()
+                self._finish(session)
+
                 return BoardFrontendModel(
                     ok=True,
-                    state=self.board.to_dict(reveal_all=True),
-                    alive=self.alive,
-                    win=False,
-                )
-
-            # First click: place mines and compute counts
-            if not self.initialized:
-                self.board.place_mines(BoardPos(x=c.x, y=c.y))
-                self.board.update_mine_counts()
-                self.initialized = True
-
-            # Handle the move based on game mode
-            if self.game_mode == GameMode.COOP:
-                print(f"[DEBUG] Human move in co-op mode - before: current_player={self.board.current_player}")
-                success = self.board.handle_player_move(BoardPos(x=c.x, y=c.y), PlayerType.HUMAN)
-                self.alive = success
-                win = self.board.check_coop_win()
-                print(f"[DEBUG] Human move in co-op mode - after: current_player={self.board.current_player}, success={success}")
-            else:
-                self.alive = self.board.reveal_cell(BoardPos(x=c.x, y=c.y))
-                win = self.board.check_win()
-
-            return BoardFrontendModel(
-                ok=True,
-                alive=self.alive,
-                win=win,
-                state=self.board.to_dict(reveal_all=(not self.alive)),
-            )
+                    alive=session.alive,
+                    win=win,
+                    state=session.board.to_dict(reveal_all=(not session.alive)),
+                    no_guess=session.no_guess,
+                ), True
+
+            return self._update(game_id, apply)
 
         @router.post(APIRoutes.API_ROUTE_FLAG)
-        def toggle_flag(c: BoardPos):
+        def toggle_flag(c: BoardPos, game_id: Optional[str] = Cookie(default=None, alias=GAME_COOKIE)):
             """
             Description: Toggle a flag at the provided board position.
             Inputs: c (BoardPos) - position to toggle flag
+                    game_id (str | None) - session cookie
             Outputs: BoardFrontendModel with updated state
             Author(s): Nicholas Holmes, Kobe Jordan
             Creation Date: 18 September 2025
             External Sources: N/A
             """
-            if self.board is None:
-                return BoardFrontendModel(ok=False, error="No board available to flag")
+            def apply(session: Optional[GameSession]):
+                if session is None or session.board is None:
+                    return BoardFrontendModel(ok=False, error="No board available to flag"), False
             
-            # Check co-op mode turn restrictions
-            if self.game_mode == GameMode.COOP:
-                if self.board.current_player != PlayerType.HUMAN:
-                    return BoardFrontendModel(ok=False, error="Not your turn")
-                if not self.board.human_alive:
-                    return BoardFrontendModel(ok=False, error="Human player is out")
+                # Check co-op mode turn restrictions
+                if session.game_mode == GameMode.COOP:
+                    if session.board.current_player != PlayerType.HUMAN:
+                        return BoardFrontendModel(ok=False, error="Not your turn"), False
+                    if not session.board.human_alive:
+                        return BoardFrontendModel(ok=False, error="Human player is out"), False
             
-            if not self.alive:
+                if not session.alive:
+                    return BoardFrontendModel(
+                        ok=True,
+                        alive=session.alive,
+                        win=False,
+                        state=session.board.to_dict(reveal_all=True),
+                    ), False
+
+                # In co-op mode, flagging uses up the human's turn
+                session.board.handle_player_flag(BoardPos(x=c.x, y=c.y), PlayerType.HUMAN)
+                session.moves.add(ACTION_TURN_FLAG, PlayerType.HUMAN, c, session.board.size.cols)
+                self._finish(session)
+
                 return BoardFrontendModel(
                     ok=True,
-                    alive=self.alive,
-                    win=False,
-                    state=self.board.to_dict(reveal_all=True),
-                )
+                    state=session.board.to_dict(),
+                    alive=session.alive,
+                    win=session.board.check_win(),
+                ), True
 
-            self.board.flag_cell(BoardPos(x=c.x, y=c.y))
-            
-            # In co-op mode, flagging should switch turns to AI
-            if self.game_mode == GameMode.COOP:
-                self.board.current_player = PlayerType.AI
-                print(f"[DEBUG] Flag move in co-op mode - switched to AI turn")
-
-            return BoardFrontendModel(
-                ok=True,
-                state=self.board.to_dict(),
-                alive=self.alive,
-                win=self.board.check_win(),
-            )
+            return self._update(game_id, apply)
+
+        @router.get(APIRoutes.API_ROUTE_HINT)
+        def hint(game_id: Optional[str] = Cookie(default=None, alias=GAME_COOKIE)):
+            """
+            Description: Report provably safe cells, provable mines and a mine-probability
+            heatmap for the visible board. Hints are cached per position across games, and the game
+            is only saved by the first hint, which marks it assisted.
+            Inputs: game_id (str | None) - session cookie
+            Outputs: HintModel with the hint or an error message
+            Author(s): Riley Meyerkorth
+            Creation Date: 19 October 2026
+            External Sources: N/A
+            """
+            def apply(session: Optional[GameSession]):
+                if session is None or session.board is None:
+                    return HintModel(ok=False, error="No game in progress"), False
+                if not session.alive:
+                    return HintModel(ok=False, error="Game is over"), False
+                # A hinted game no longer counts for the leaderboard
+                changed = not session.assisted
+                session.assisted = True
+                return session.board.hint(), changed
+
+            # Reads the board under the game's lock, since the memory store hands out the live board
+            return self._update(game_id, apply)
+
+        @router.get(f"{APIRoutes.API_ROUTE_SPECTATE}/{{watch}}")
+        async def spectate(watch: str, request: Request):
+            """
+            Description: Stream a game's state to a read-only spectator as server-sent events.
+            The current state is sent on connect and every later version as it is saved.
+            Inputs: watch (str) - the game's public watch id
+                    request (Request) - connection, checked for disconnects
+            Outputs: StreamingResponse of text/event-stream frames
+            Author(s): Riley Meyerkorth
+            Creation Date: 19 October 2026
+            External Sources: N/A
+            """
+            game_id = await run_in_threadpool(self.store.find_watched, watch)
+            if game_id is None:
+                raise HTTPException(status_code=404, detail="No such game")
+
+            async def events():
+                subscriber = Subscriber(asyncio.get_running_loop())
+                self.spectators.subscribe(game_id, subscriber)
+                try:
+                    # Send the current state, then whatever later requests publish
+                    if not await run_in_threadpool(self._refresh_spectators, game_id):
+                        return
+                    while not await request.is_disconnected():
+                        frame = await subscriber.next(SPECTATOR_POLL_SECONDS)
+                        if frame is not None:
+                            yield frame
+                            continue
+                        # Moves handled by other workers only show up in the store
+                        if not await run_in_threadpool(self._refresh_spectators, game_id):
+                            return
+                        yield b": keepalive\n\n"
+                finally:
+                    self.spectators.unsubscribe(game_id, subscriber)
+
+            return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+        @router.get(APIRoutes.API_ROUTE_STORE_STATS)
+        def store_stats() -> StoreStatsModel:
+            """
+            Description: Report how many games this worker's store holds in memory and on disk.
+            Inputs: None
+            Outputs: StoreStatsModel with game counts and byte usage
+            Author(s): Riley Meyerkorth
+            Creation Date: 19 October 2026
+            External Sources: N/A
+            """
+            return self.store.stats()
+
+        @router.get(APIRoutes.API_ROUTE_LEADERBOARD)
+        def leaderboard(rows: int, cols: int, mines: int, game_mode: GameMode = GameMode.SOLO,
+                        ai_difficulty: Optional[str] = None, no_guess: bool = False,
+                        limit: int = Query(default=LEADERBOARD_SIZE, ge=1, le=LEADERBOARD_MAX_SIZE)) -> LeaderboardModel:
+            """
+            Description: Fastest winning times for one game configuration.
+            Inputs: rows, cols, mines (int) - board configuration
+                    game_mode (GameMode) - solo or co-op
+                    ai_difficulty (str | None) - AI difficulty of co-op games
+                    no_guess (bool) - no-guess boards
+                    limit (int) - number of entries
+            Outputs: LeaderboardModel with one entry per player, fastest first
+            Author(s): Riley Meyerkorth
+            Creation Date: 19 October 2026
+            External Sources: N/A
+            """
+            if self.stats is None:
+                return LeaderboardModel(ok=False, error="Statistics are turned off")
+            config = config_key(rows, cols, mines, game_mode, ai_difficulty, no_guess)
+            return LeaderboardModel(ok=True, config=config, entries=self.stats.leaderboard(config, limit))
+
+        @router.get(APIRoutes.API_ROUTE_PROFILE)
+        def profile(player_id: Optional[str] = Cookie(default=None, alias=PLAYER_COOKIE)) -> ProfileModel:
+            """
+            Description: The calling player's statistics for every configuration they have finished a game in.
+            Inputs: player_id (str | None) - player cookie
+            Outputs: ProfileModel with the player's name and aggregates
+            Author(s): Riley Meyerkorth
+            Creation Date: 19 October 2026
+            External Sources: N/A
+            """
+            if self.stats is None:
+                return ProfileModel(ok=False, error="Statistics are turned off")
+            if player_id is None:
+                return ProfileModel(ok=False, error="No games played yet")
+            name, configs = self.stats.profile(player_id)
+            return ProfileModel(ok=True, name=name, configs=configs)
 
         @router.get("/api/ai/{difficulty}")
-        def ai_move(difficulty: str):
+        def ai_move(difficulty: str, deadline_ms: Optional[int] = Query(default=None, ge=1, le=AI_MAX_DEADLINE_MS),
+                    game_id: Optional[str] = Cookie(default=None, alias=GAME_COOKIE)):
             """
             Description: Compute and apply an AI move based on the specified difficulty.
             Inputs: difficulty (str) - one of 'easy', 'medium', 'hard'
+                    deadline_ms (int | None) - search budget for this move, defaults to the game's
+                    game_id (str | None) - session cookie
             Outputs: dict containing 'action', 'pos', and 'state' or an error
             Author(s): Raj Kaura, Kobe Jordan
             Creation Date: 1 October 2025
             External Sources: N/A
             """
-            if not self.initialized:
-                rows = self.board.size.rows
-                cols = self.board.size.cols
-
-                # pick a random hidden cell
-                r = random.randrange(rows)
-                c = random.randrange(cols)
-                first_pos = BoardPos(x=r, y=c)
-
-                # place mines around that first click and compute counts
-                self.board.place_mines(first_pos)
-                self.board.update_mine_counts()
-                self.initialized = True
-
-                # reveal the chosen cell (will not be a mine because place_mines avoids it)
-                self.alive = self.board.reveal_cell(first_pos)
+            def apply(session: Optional[GameSession]):
+                if session is None or session.board is None:
+                    return {"error": "No game in progress"}, False
+                if difficulty not in AI_DIFFICULTIES:
+                    return {"error": "Invalid difficulty"}, False
+                if not session.initialized:
+                    rows = session.board.size.rows
+                    cols = session.board.size.cols
+
+                    # pick a random hidden cell
+                    r = random.randrange(rows)
+                    c = random.randrange(cols)
+                    first_pos = BoardPos(x=r, y=c)
+
+                    # place mines around that first click and compute counts
+                    self._place_mines(session, first_pos)
+                    session.initialized = True
+
+                    # reveal the chosen cell (will not be a mine because place_mines avoids it)
+                    session.alive = session.board.reveal_cell(first_pos)
+                    session.moves.add(ACTION_REVEAL, PlayerType.AI, first_pos, session.board.size.cols)
+                    # The AI played on the caller's behalf, so the game no longer counts for the leaderboard
+                    session.assisted = True
+                    self._finish(session)
+
+                    # return the state after the initial reveal so the frontend can update
+                    return {
+                        "action": "reveal",
+                        "pos": first_pos.dict(),
+                        "state": session.board.to_dict(reveal_all=(not session.alive)),
+                        "no_guess": session.no_guess,
+                    }, True
+
+                action, pos = session.board.ai_move(difficulty, self._ai_deadline(session, deadline_ms))
+
+                if pos is None:
+                    return {"action": "none", "pos": None}, False
+
+                # Apply the move
+                if action == "reveal":
+                    session.alive = session.board.reveal_cell(pos)
+                    session.moves.add(ACTION_REVEAL, PlayerType.AI, pos, session.board.size.cols)
+                elif action == "flag":
+                    session.board.flag_cell(pos)
+                    session.moves.add(ACTION_FLAG, PlayerType.AI, pos, session.board.size.cols)
+                session.assisted = True
+                self._finish(session)
 
-                # return the state after the initial reveal so the frontend can update
                 return {
-                    "action": "reveal",
-                    "pos": first_pos.dict(),
-                    "state": self.board.to_dict(reveal_all=(not self.alive)),
-                }
-
-            if difficulty == "easy":
-                action, pos = self.board.ai_move_easy()
-            elif difficulty == "medium":
-                action, pos = self.board.ai_move_medium()
-            elif difficulty == "hard":
-                action, pos = self.board.ai_move_hard()
-            else:
-                return {"error": "Invalid difficulty"}
-
-            if pos is None:
-                return {"action": "none", "pos": None}
-
-            # Apply the move
-            if action == "reveal":
-                self.alive = self.board.reveal_cell(pos)
-            elif action == "flag":
-                self.board.flag_cell(pos)
-
-            return {
-                "action": action,
-                "pos": pos.dict() if pos else None,
-                "state": self.board.to_dict(reveal_all=(not self.alive)),
-            }
+                    "action": action,
+                    "pos": pos.dict() if pos else None,
+                    "state": session.board.to_dict(reveal_all=(not session.alive)),
+                }, True
+
+            return self._update(game_id, apply, AI_MOVE_COST, "ai")
 
         @router.post("/api/ai-turn")
-        def ai_turn():
+        def ai_turn(deadline_ms: Optional[int] = Query(default=None, ge=1, le=AI_MAX_DEADLINE_MS),
+                    game_id: Optional[str] = Cookie(default=None, alias=GAME_COOKIE)):
             """
             Description: Compute and apply an AI move based on the specified difficulty.
-            Inputs: None (uses server's stored board & difficulty)
+            Inputs: deadline_ms (int | None) - search budget for this move, defaults to the game's
+                    (otherwise uses server's stored board & difficulty)
+                    game_id (str | None) - session cookie
             Outputs: BoardFrontendModel with updated state and alive/win flags
             Author(s): Raj Kaura, Kobe Jordan
             Creation Date: 1 October 2025
             External Sources: N/A
             """
-            print(f"[DEBUG] AI turn requested - game_mode: {self.game_mode}, current_player: {self.board.current_player if self.board else None}")
-            print(f"[DEBUG] AI turn conditions - board exists: {self.board is not None}, game_mode: {self.game_mode}, current_player: {self.board.current_player if self.board else None}, ai_alive: {self.board.ai_alive if self.board else None}")
+            def apply(session: Optional[GameSession]):
+                if session is None:
+                    return BoardFrontendModel(ok=False, error="No game in progress"), False
+                print(f"[DEBUG] AI turn requested - game_mode: {session.game_mode}, current_player: {session.board.current_player if session.board else None}")
+                print(f"[DEBUG] AI turn conditions - board exists: {session.board is not None}, game_mode: {session.game_mode}, current_player: {session.board.current_player if session.board else None}, ai_alive: {session.board.ai_alive if session.board else None}")
             
-            if self.board is None:
-                print("[DEBUG] AI turn failed: No board")
-                return BoardFrontendModel(ok=False, error="No game in progress")
-            if self.game_mode != GameMode.COOP:
-                print("[DEBUG] AI turn failed: Not in co-op mode")
-                return BoardFrontendModel(ok=False, error="Not in co-op mode")
-            if self.board.current_player != PlayerType.AI:
-                print(f"[DEBUG] AI turn failed: Not AI's turn (current: {self.board.current_player})")
-                return BoardFrontendModel(ok=False, error="Not AI's turn")
-            if not self.board.ai_alive:
-                print("[DEBUG] AI turn failed: AI not alive")
-                return BoardFrontendModel(ok=False, error="AI player is out")
+                if session.board is None:
+                    print("[DEBUG] AI turn failed: No board")
+                    return BoardFrontendModel(ok=False, error="No game in progress"), False
+                if session.game_mode != GameMode.COOP:
+                    print("[DEBUG] AI turn failed: Not in co-op mode")
+                    return BoardFrontendModel(ok=False, error="Not in co-op mode"), False
+                if session.board.current_player != PlayerType.AI:
+                    print(f"[DEBUG] AI turn failed: Not AI's turn (current: {session.board.current_player})")
+                    return BoardFrontendModel(ok=False, error="Not AI's turn"), False
+                if not session.board.ai_alive:
+                    print("[DEBUG] AI turn failed: AI not alive")
+                    return BoardFrontendModel(ok=False, error="AI player is out"), False
             
-            # Make AI move based on difficulty
-            if self.ai_difficulty == "easy":
-                action, pos = self.board.ai_move_easy()
-            elif self.ai_difficulty == "medium":
-                action, pos = self.board.ai_move_medium()
-            elif self.ai_difficulty == "hard":
-                action, pos = self.board.ai_move_hard()
-            else:
-                return BoardFrontendModel(ok=False, error="Invalid AI difficulty")
+                # Make AI move based on difficulty
+                if session.ai_difficulty not in AI_DIFFICULTIES:
+                    return BoardFrontendModel(ok=False, error="Invalid AI difficulty"), False
+                action, pos = session.board.ai_move(session.ai_difficulty, self._ai_deadline(session, deadline_ms))
             
-            print(f"[DEBUG] AI move: action={action}, pos={pos}")
+                print(f"[DEBUG] AI move: action={action}, pos={pos}")
             
-            if pos is None:
-                return BoardFrontendModel(ok=False, error="AI has no moves")
+                if pos is None:
+                    return BoardFrontendModel(ok=False, error="AI has no moves"), False
             
-            # Handle the AI move
-            if action == "reveal":
-                success = self.board.handle_player_move(pos, PlayerType.AI)
-                self.alive = success
-                print(f"[DEBUG] AI reveal move success: {success}")
-            elif action == "flag":
-                self.board.flag_cell(pos)
-                # Switch turns after flagging
-                self.board.current_player = PlayerType.HUMAN
-                print(f"[DEBUG] AI flag move, switched to human turn")
+                # Handle the AI move
+                if action == "reveal":
+                    # The AI may open the game (after a human flag), so deal the mines for its cell
+                    if not session.initialized:
+                        self._place_mines(session, pos)
+                        session.initialized = True
+                    success = session.board.handle_player_move(pos, PlayerType.AI)
+                    session.moves.add(ACTION_TURN_REVEAL, PlayerType.AI, pos, session.board.size.cols)
+                    session.alive = success
+                    print(f"[DEBUG] AI reveal move success: {success}")
+                elif action == "flag":
+                    # Flagging uses up the AI's turn
+                    session.board.handle_player_flag(pos, PlayerType.AI)
+                    session.moves.add(ACTION_TURN_FLAG, PlayerType.AI, pos, session.board.size.cols)
             
-            win = self.board.check_coop_win()
+                win = session.board.check_coop_win()
+                self._finish(session)
             
-            print(f"[DEBUG] AI turn complete - current_player: {self.board.current_player}, alive: {self.alive}, win: {win}")
+                print(f"[DEBUG] AI turn complete - current_player: {session.board.current_player}, alive: {session.alive}, win: {win}")
             
-            return BoardFrontendModel(
-                ok=True,
-                alive=self.alive,
-                win=win,
-                state=self.board.to_dict(reveal_all=(not self.alive)),
-            )
+                return BoardFrontendModel(
+                    ok=True,
+                    alive=session.alive,
+                    win=win,
+                    state=session.board.to_dict(reveal_all=(not session.alive)),
+                    no_guess=session.no_guess,
+                ), True
+
+            return self._update(game_id, apply, AI_MOVE_COST, "ai")
 
         # Register routes *after* defining them all
         self.app.include_router(router)
 
+    def _load(self, game_id: Optional[str]) -> Optional[GameSession]:
+        """
+        Description: Read a game without locking it, for handlers that do not change it.
+        Inputs: game_id (str | None) - session cookie
+        Outputs: GameSession | None - the stored game, or None if there is none
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        if game_id is None:
+            return None
+        return self.store.load(game_id)
+
+    def _update(self, game_id: Optional[str], apply: Callable[[Optional[GameSession]], tuple[Any, bool]],
+                cost: float = 1, slot: Optional[str] = None) -> Any:
+        """
+        Description: Run a handler against a game under the game's lock and save the game if the
+        handler changed it. The request is first charged to the game's token bucket, counted against
+        its pending-move limit and, if it needs one, given a work slot, so admission errors are raised
+        before the handler touches the game. If another worker saved the game in between, the change
+        is thrown away and the handler runs again on the fresh copy.
+        Inputs: game_id (str | None) - session cookie
+                apply (callable) - handler taking the session (or None) and returning the response
+                and whether it changed the game
+                cost (float) - tokens the request takes from the game's bucket
+                slot (str | None) - admission slot the handler's work needs
+        Outputs: the response returned by apply
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        if game_id is None:
+            return apply(None)[0]
+        self.admission.rate(f"game:{game_id}", MOVE_RATE, MOVE_BURST, cost)
+        with self.admission.pending(game_id), (self.admission.slot(slot) if slot else nullcontext()):
+            for _ in range(GAME_STORE_RETRIES):
+                with self.store.lock(game_id):
+                    session = self.store.load(game_id)
+                    recorded = session is not None and session.recorded
+                    result, changed = apply(session)
+                    if not changed:
+                        return result
+                    try:
+                        self.store.save(session)
+                    except StaleGameError:
+                        continue
+                self.spectators.publish(game_id, session.version, lambda: self._view(session))
+                # Written only once the save that finished the game went through
+                if session.recorded and not recorded:
+                    if self.replays is not None:
+                        self.replays.write(self._replay(session))
+                    if self.stats is not None and session.player is not None:
+                        self.stats.record(self._game_record(session))
+                return result
+        raise HTTPException(status_code=409, detail="Game was changed by another request, try again")
+
+    @staticmethod
+    async def _refused(request: Request, error: AdmissionError) -> JSONResponse:
+        """
+        Description: Answer a request turned away by admission control.
+        Inputs: request (Request) - the refused request
+                error (AdmissionError) - why it was refused
+        Outputs: JSONResponse - 429 or 503 with a Retry-After header
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return JSONResponse(
+            status_code=error.status,
+            content={"detail": error.reason},
+            headers={"Retry-After": str(error.retry_after)},
+        )
+
+    def _view(self, session: GameSession) -> BoardFrontendModel:
+        """
+        Description: The state response for a game, as sent to its player and its spectators.
+        Inputs: session (GameSession) - game to show
+        Outputs: BoardFrontendModel - board, alive and win status
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return BoardFrontendModel(
+            ok=True,
+            state=session.board.to_dict(reveal_all=(not session.alive)),
+            alive=session.alive,
+            win=session.board.check_win(),
+            no_guess=session.no_guess,
+        )
+
+    def _refresh_spectators(self, game_id: str) -> bool:
+        """
+        Description: Publish the stored version of a game if its spectators have not seen it yet.
+        Inputs: game_id (str) - watched game
+        Outputs: bool - False once the game no longer exists
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        version = self.store.version_of(game_id)
+        if version is None:
+            return False
+        sent = self.spectators.sent_version(game_id)
+        if sent is not None and version > sent:
+            session = self.store.load(game_id)
+            if session is None:
+                return False
+            self.spectators.publish(game_id, session.version, lambda: self._view(session))
+        return True
+
+    def _finish(self, session: GameSession) -> None:
+        """
+        Description: Mark a game that just ended so _update writes its replay and statistics.
+        Inputs: session (GameSession) - game a move was applied to
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        if not session.recorded and (not session.alive or session.board.check_win()):
+            session.recorded = True
+
+    def _replay(self, session: GameSession) -> Replay:
+        """
+        Description: The replay of a finished game. No-guess boards may come from the generator
+        rather than the seed, so their mine layout is stored as well.
+        Inputs: session (GameSession) - finished game
+        Outputs: Replay - header and recorded moves
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        board = session.board
+        layout = None
+        if session.no_guess:
+            cells = board.to_dict(reveal_all=True).board
+            layout = [(r, c) for r, row in enumerate(cells) for c, value in enumerate(row) if value == CELL_MINE]
+        return Replay(
+            rows=board.size.rows,
+            cols=board.size.cols,
+            mines=board.mines,
+            game_mode=session.game_mode,
+            difficulty=session.ai_difficulty if session.game_mode == GameMode.COOP else None,
+            won=session.alive and board.check_win(),
+            started=int(session.started),
+            seed=board.seed,
+            layout=layout,
+            placed_at=session.moves.placed_at,
+            move_count=session.moves.count,
+            move_data=bytes(session.moves.data),
+        )
+
+    def _game_record(self, session: GameSession) -> GameRecord:
+        """
+        Description: The statistics of a finished game. A co-op game counts as won when the
+        board was cleared or the AI hit a mine; games that used hints or AI moves are recorded
+        under their own assisted configuration.
+        Inputs: session (GameSession) - finished game
+        Outputs: GameRecord - what the statistics store keeps
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        board = session.board
+        if session.game_mode == GameMode.COOP:
+            won = board.game_over and board.winner != PlayerType.AI
+        else:
+            won = session.alive and board.check_win()
+        finished = time.time()
+        return GameRecord(
+            player=session.player,
+            name=session.player_name or DEFAULT_PLAYER_NAME,
+            rows=board.size.rows,
+            cols=board.size.cols,
+            mines=board.mines,
+            game_mode=session.game_mode,
+            difficulty=session.ai_difficulty if session.game_mode == GameMode.COOP else None,
+            no_guess=session.no_guess,
+            won=won,
+            seconds=finished - session.started,
+            moves=session.moves.count,
+            finished=finished,
+            assisted=session.assisted,
+        )
+
+    def _ai_deadline(self, session: GameSession, deadline_ms: Optional[int]) -> float:
+        """
+        Description: Turn a per-request (or, if missing, per-game) AI budget into a deadline.
+        Inputs: session (GameSession) - game the move is for
+                deadline_ms (int | None) - budget from the request
+        Outputs: float - time.monotonic() value the AI must finish by
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        budget = deadline_ms if deadline_ms is not None else session.ai_deadline_ms
+        return time.monotonic() + budget / 1000
+
+    def _place_mines(self, session: GameSession, first_pos: BoardPos) -> None:
+        """
+        Description: Place mines for the first click and compute counts. No-guess games take a
+        pre-generated layout matching the click. Searching for one on the request path is too slow,
+        so on a miss the game gets a regular random board and stops being a no-guess game.
+        Inputs: session (GameSession) - game being started
+                first_pos (BoardPos) - position of the first click
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        session.moves.placed()
+        if session.no_guess:
+            rows, cols, mines = session.board.size.rows, session.board.size.cols, session.board.mines
+            layout = self.generator.take(rows, cols, mines, (first_pos.x, first_pos.y))
+            if layout is not None:
+                session.board.set_mines(layout.mines)
+                return
+            # The board may need guessing, so keep it off the no-guess leaderboards and replays
+            session.no_guess = False
+        session.board.place_mines(first_pos)
+        session.board.update_mine_counts()
+
+def create_app() -> FastAPI:
+    """
+    Description: App factory so uvicorn can build one server per worker process.
+    Inputs: None
+    Outputs: FastAPI - the app of a new Server
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    return Server().app
+
 
 if __name__ == "__main__":
     import uvicorn
 
-    server = Server()
-    uvicorn.run(server.app, host=API_HOST, port=API_PORT)
\ No newline at end of file
+    # Workers share games through the store, so each one builds its own Server
+    uvicorn.run("backend.server:create_app", factory=True, host=API_HOST, port=API_PORT, workers=API_WORKERS)
\ No newline at end of file
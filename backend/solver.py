@@ -0,0 +1,643 @@
+"""
+Name: solver.py
+Description: Constraint solver for the visible Minesweeper board. Finds cells that are provably
+safe or provably mines, and the mine probability of every other hidden cell, by enumerating every
+mine layout consistent with the revealed numbers. Frontiers too large to enumerate fall back to a
+Markov chain Monte Carlo estimate with error bounds.
+Inputs: None
+Outputs: None
+External Sources: N/A
+Author(s): Riley Meyerkorth
+Creation Date: 19 October 2026
+"""
+
+import random
+import time
+from dataclasses import dataclass, field
+from math import comb, sqrt
+from typing import Optional
+
+from .constants import (
+    CELL_MINE,
+    MC_BATCHES,
+    MC_BLOCK_SIZE,
+    MC_BURN_IN,
+    MC_SAMPLES,
+    SOLVER_NODE_BUDGET,
+)
+from .models import Cell
+
+
+@dataclass
+class Analysis:
+    """
+    Description: Result of analysing the visible board.
+    Inputs: safe (set[Cell]), mines (set[Cell]), probabilities (dict[Cell, float]),
+            uncertainty (dict[Cell, float]), exact (bool)
+    Outputs: container consumed by the AI, hints and board generation
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    """
+    safe: set[Cell] = field(default_factory=set)
+    mines: set[Cell] = field(default_factory=set)
+    # Mine probability of each hidden cell; cells are missing when it could not be computed
+    probabilities: dict[Cell, float] = field(default_factory=dict)
+    # 95% error bound of each sampled probability; empty when every probability is exact
+    uncertainty: dict[Cell, float] = field(default_factory=dict)
+    # False when some frontier component was too large to enumerate within the budget
+    exact: bool = True
+    # True when the deadline cut the analysis short, so it should not be cached
+    timed_out: bool = False
+
+
+@dataclass
+class _Component:
+    """
+    Description: A group of frontier cells linked by shared number constraints, with the
+    number of consistent layouts for each mine total k and how often each cell is a mine.
+    Inputs: cells, constraints
+    Outputs: enumeration results filled in by _enumerate
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    """
+    cells: list[Cell]
+    constraints: list[tuple[tuple[int, ...], int]]
+    counts: dict[int, int] = field(default_factory=dict)
+    cell_counts: dict[int, list[int]] = field(default_factory=dict)
+    solved: bool = False
+    timed_out: bool = False
+
+
+def _frontier(board) -> tuple[list[Cell], list[tuple[tuple[Cell, ...], int]]]:
+    """
+    Description: collects every hidden cell and one constraint per revealed number that still
+    touches hidden cells. Flags are player guesses, so flagged cells are treated as hidden.
+    Inputs: board (Board): board to analyse
+    Outputs: (hidden cells, list of (hidden neighbor cells, number) constraints)
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    rows, cols = board.size.rows, board.size.cols
+    neighbors = board._neighbors.coords
+    hidden: list[Cell] = []
+    constraints: list[tuple[tuple[Cell, ...], int]] = []
+    for r in range(rows):
+        revealed_row = board.revealed[r]
+        for c in range(cols):
+            if not revealed_row[c]:
+                hidden.append((r, c))
+                continue
+            value = board.board[r][c]
+            if value == CELL_MINE:
+                continue
+            unknown = []
+            for nr, nc in neighbors[r * cols + c]:
+                if not board.revealed[nr][nc]:
+                    unknown.append((nr, nc))
+                elif board.board[nr][nc] == CELL_MINE:
+                    # A mine revealed by a co-op loss already accounts for part of the number
+                    value -= 1
+            if unknown:
+                constraints.append((tuple(unknown), value))
+    return hidden, constraints
+
+
+def _components(constraints: list[tuple[tuple[Cell, ...], int]]) -> list[_Component]:
+    """
+    Description: splits the frontier into independent components (union-find over constraints)
+    Inputs: constraints (list): (cells, number) constraints from _frontier
+    Outputs: list[_Component]: components with cell-index based constraints
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    parent: dict[Cell, Cell] = {}
+
+    def find(cell: Cell) -> Cell:
+        # Path-halving find
+        while parent[cell] != cell:
+            parent[cell] = parent[parent[cell]]
+            cell = parent[cell]
+        return cell
+
+    for cells, _ in constraints:
+        for cell in cells:
+            parent.setdefault(cell, cell)
+        root = find(cells[0])
+        for cell in cells[1:]:
+            other = find(cell)
+            if other != root:
+                parent[other] = root
+
+    grouped: dict[Cell, _Component] = {}
+    for cells, value in constraints:
+        comp = grouped.setdefault(find(cells[0]), _Component(cells=[], constraints=[]))
+        comp.constraints.append((cells, value))
+
+    components = []
+    for comp in grouped.values():
+        # Order cells so neighbouring cells are assigned together, which prunes earlier
+        index: dict[Cell, int] = {}
+        for cells, _ in comp.constraints:
+            for cell in cells:
+                if cell not in index:
+                    index[cell] = len(index)
+        comp.cells = list(index)
+        comp.constraints = [(tuple(index[cell] for cell in cells), value) for cells, value in comp.constraints]
+        components.append(comp)
+    return components
+
+
+def _enumerate(comp: _Component, budget: int, deadline: Optional[float] = None) -> bool:
+    """
+    Description: enumerates every mine assignment of a component that satisfies its constraints,
+    counting layouts per mine total and per cell. Gives up after `budget` search nodes or once
+    time.monotonic() passes `deadline`.
+    Inputs: comp (_Component): component to enumerate, budget (int): maximum search nodes,
+            deadline (float | None): monotonic time limit
+    Outputs: bool: True if the enumeration finished
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    n = len(comp.cells)
+    # For each cell, the constraints it takes part in
+    cell_constraints: list[list[int]] = [[] for _ in range(n)]
+    for ci, (cells, _) in enumerate(comp.constraints):
+        for i in cells:
+            cell_constraints[i].append(ci)
+    need = [value for _, value in comp.constraints]
+    left = [len(cells) for cells, _ in comp.constraints]
+    assignment = [0] * n
+    nodes = 0
+
+    def record(mines: int) -> None:
+        comp.counts[mines] = comp.counts.get(mines, 0) + 1
+        per_cell = comp.cell_counts.setdefault(mines, [0] * n)
+        for i in range(n):
+            if assignment[i]:
+                per_cell[i] += 1
+
+    def search(i: int, mines: int) -> bool:
+        nonlocal nodes
+        nodes += 1
+        if nodes > budget:
+            return False
+        # Checking the clock is comparatively slow, so only do it every 1024 nodes
+        if deadline is not None and not nodes & 1023 and time.monotonic() > deadline:
+            comp.timed_out = True
+            return False
+        if i == n:
+            record(mines)
+            return True
+        for value in (0, 1):
+            # Tentatively assign the cell and check every constraint it touches
+            feasible = True
+            for ci in cell_constraints[i]:
+                left[ci] -= 1
+                need[ci] -= value
+                if need[ci] < 0 or need[ci] > left[ci]:
+                    feasible = False
+            finished = True
+            if feasible:
+                assignment[i] = value
+                finished = search(i + 1, mines + value)
+                assignment[i] = 0
+            # Undo the assignment
+            for ci in cell_constraints[i]:
+                left[ci] += 1
+                need[ci] += value
+            if not finished:
+                return False
+        return True
+
+    comp.solved = search(0, 0)
+    return comp.solved
+
+
+def _convolve(a: dict[int, int], b: dict[int, int]) -> dict[int, int]:
+    """
+    Description: combines two independent "layouts per mine total" distributions
+    Inputs: a, b (dict[int, int]): mine total -> number of layouts
+    Outputs: dict[int, int]: distribution of the combined mine total
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    out: dict[int, int] = {}
+    for ka, wa in a.items():
+        for kb, wb in b.items():
+            out[ka + kb] = out.get(ka + kb, 0) + wa * wb
+    return out
+
+
+def analyze(board, budget: int = SOLVER_NODE_BUDGET, deadline: Optional[float] = None) -> Analysis:
+    """
+    Description: finds every provably safe cell and provable mine on the visible board, using the
+    revealed numbers and the total mine count. With a deadline, whatever has been worked out
+    when time.monotonic() passes it is returned.
+    Inputs: board (Board): board to analyse, budget (int): search nodes allowed per component,
+            deadline (float | None): monotonic time limit
+    Outputs: Analysis: safe cells, mine cells and whether the result is exact
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    hidden, constraints = _frontier(board)
+    components = _components(constraints)
+    result = Analysis()
+
+    for comp in components:
+        _enumerate(comp, budget, deadline)
+    solved = [comp for comp in components if comp.solved and comp.counts]
+    result.exact = len(solved) == len(components)
+    result.timed_out = any(comp.timed_out for comp in components)
+
+    # Layouts of the cells no number touches are weighted by how many mines are left for them
+    frontier_cells = {cell for comp in components for cell in comp.cells}
+    outside = [cell for cell in hidden if cell not in frontier_cells]
+    remaining = board.mines - _revealed_mines(board)
+
+    if not result.exact:
+        # Without every component we cannot use the global mine count, but a cell that is safe
+        # (or a mine) in every local layout still is globally
+        for comp in solved:
+            total = sum(comp.counts.values())
+            for i, cell in enumerate(comp.cells):
+                hits = sum(per_cell[i] for per_cell in comp.cell_counts.values())
+                if hits == 0:
+                    result.safe.add(cell)
+                    result.probabilities[cell] = 0.0
+                elif hits == total:
+                    result.mines.add(cell)
+                    result.probabilities[cell] = 1.0
+        # Sample the rest so the AI can still make an informed guess; seeding the chain with the
+        # position's hash makes the estimate reproducible and equal to any cached copy
+        sampled = estimate(board, rng=random.Random(board.zobrist), deadline=deadline)
+        if sampled is not None:
+            result.timed_out = result.timed_out or sampled.timed_out
+            for cell, probability in sampled.probabilities.items():
+                if cell not in result.probabilities:
+                    result.probabilities[cell] = probability
+                    result.uncertainty[cell] = sampled.uncertainty[cell]
+        return result
+
+    weight = _Weights(components, len(outside), remaining)
+    if weight.total == 0:
+        return result
+    for ci, comp in enumerate(components):
+        for i, cell in enumerate(comp.cells):
+            hits = weight.cell(ci, i)
+            result.probabilities[cell] = hits / weight.total
+            if hits == 0:
+                result.safe.add(cell)
+            elif hits == weight.total:
+                result.mines.add(cell)
+    if outside:
+        hits = weight.outside()
+        probability = hits / weight.total
+        for cell in outside:
+            result.probabilities[cell] = probability
+        target = result.safe if hits == 0 else result.mines if hits == weight.total else None
+        if target is not None:
+            target.update(outside)
+    return result
+
+
+def _revealed_mines(board) -> int:
+    """
+    Description: counts mines that are already revealed (only possible after a co-op loss)
+    Inputs: board (Board)
+    Outputs: int: number of revealed mines
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    return sum(
+        1
+        for r in range(board.size.rows)
+        for c in range(board.size.cols)
+        if board.revealed[r][c] and board.board[r][c] == CELL_MINE
+    )
+
+
+class _Weights:
+    """
+    Description: Exact layout counts for the whole hidden area, combining the frontier
+    components with the cells outside the frontier.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+
+    def __init__(self, components: list[_Component], outside: int, remaining: int):
+        """
+        Description: precomputes the component distributions needed for per-cell counts
+        Inputs: components (list[_Component]): enumerated components, outside (int): number of
+                cells off the frontier, remaining (int): mines not yet revealed
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self.components = components
+        self.outside_cells = outside
+        self.remaining = remaining
+        # prefix[i] combines components[:i], suffix[i] combines components[i:]
+        prefix = [{0: 1}]
+        for comp in components:
+            prefix.append(_convolve(prefix[-1], comp.counts))
+        suffix = [{0: 1}]
+        for comp in reversed(components):
+            suffix.append(_convolve(suffix[-1], comp.counts))
+        suffix.reverse()
+        self._prefix = prefix
+        self._suffix = suffix
+        self._others: dict[int, dict[int, int]] = {}
+        self.frontier = prefix[-1]
+        self.total = sum(w * self._fill(k) for k, w in self.frontier.items())
+
+    def _fill(self, k: int, outside: int | None = None, remaining: int | None = None) -> int:
+        """
+        Description: number of ways to put the leftover mines on the outside cells
+        Inputs: k (int): mines on the frontier, outside/remaining (int | None): overrides
+        Outputs: int: number of outside layouts
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        outside = self.outside_cells if outside is None else outside
+        remaining = self.remaining if remaining is None else remaining
+        left = remaining - k
+        if left < 0 or left > outside:
+            return 0
+        return comb(outside, left)
+
+    def cell(self, ci: int, i: int) -> int:
+        """
+        Description: number of full layouts in which cell i of component ci is a mine
+        Inputs: ci (int): component index, i (int): cell index within the component
+        Outputs: int: layout count
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        # Weight of each component mine total k, given every other component and the outside cells
+        if ci not in self._others:
+            others = _convolve(self._prefix[ci], self._suffix[ci + 1])
+            self._others[ci] = {
+                k: sum(w * self._fill(k + ko) for ko, w in others.items())
+                for k in self.components[ci].cell_counts
+            }
+        context = self._others[ci]
+        return sum(per_cell[i] * context[k] for k, per_cell in self.components[ci].cell_counts.items())
+
+    def outside(self) -> int:
+        """
+        Description: number of full layouts in which one particular outside cell is a mine
+        Inputs: None
+        Outputs: int: layout count
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return sum(
+            w * self._fill(k, self.outside_cells - 1, self.remaining - 1)
+            for k, w in self.frontier.items()
+        )
+
+
+def estimate(board, samples: int = MC_SAMPLES, rng: Optional[random.Random] = None, deadline: Optional[float] = None) -> Optional[Analysis]:
+    """
+    Description: estimates mine probabilities by sampling layouts consistent with the revealed
+    numbers and the remaining mine count. The chain state is a frontier assignment weighted by the
+    number of ways to fill the outside cells; each step re-draws a small block of neighbouring
+    frontier cells from its exact conditional distribution (block Gibbs sampling).
+    Inputs: board (Board): board to analyse, samples (int): chain steps to record,
+            rng (random.Random | None): random generator, deadline (float | None): monotonic time
+            limit; sampling stops early when it passes
+    Outputs: Analysis | None: sampled probabilities with 95% error bounds (exact=False), or None
+             if no consistent layout was found or nothing was recorded in time
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: Block Gibbs sampling (standard MCMC technique)
+    """
+    rng = rng or random.Random()
+    hidden, constraints = _frontier(board)
+    remaining = board.mines - _revealed_mines(board)
+
+    # Flat indices for the frontier cells and the constraints touching each of them
+    index: dict[Cell, int] = {}
+    for cells, _ in constraints:
+        for cell in cells:
+            index.setdefault(cell, len(index))
+    frontier = list(index)
+    n = len(frontier)
+    cons = [[index[cell] for cell in cells] for cells, _ in constraints]
+    need = [value for _, value in constraints]
+    touching: list[list[int]] = [[] for _ in range(n)]
+    for ci, cells in enumerate(cons):
+        for i in cells:
+            touching[i].append(ci)
+    outside = len(hidden) - n
+
+    def fill(k: int) -> int:
+        # Ways to place the leftover mines on the outside cells
+        left = remaining - k
+        return comb(outside, left) if 0 <= left <= outside else 0
+
+    state = _initial_assignment(n, cons, need, touching, fill, rng, deadline)
+    if state is None:
+        return None
+    mines = sum(state)
+
+    hits = [0] * n
+    outside_hits = 0.0
+    batch_size = max(1, samples // MC_BATCHES)
+    batch_hits: list[list[int]] = []
+    batch_outside: list[float] = []
+    current = [0] * n
+    current_outside = 0.0
+
+    timed_out = False
+    for step in range(MC_BURN_IN + samples):
+        if deadline is not None and time.monotonic() > deadline:
+            timed_out = True
+            break
+        mines = _gibbs_block(state, mines, cons, need, touching, fill, rng)
+        if step < MC_BURN_IN:
+            continue
+        for i in range(n):
+            current[i] += state[i]
+        if outside:
+            current_outside += (remaining - mines) / outside
+        if (step - MC_BURN_IN + 1) % batch_size == 0:
+            batch_hits.append(current)
+            batch_outside.append(current_outside)
+            for i in range(n):
+                hits[i] += current[i]
+            outside_hits += current_outside
+            current = [0] * n
+            current_outside = 0.0
+
+    recorded = batch_size * len(batch_hits)
+    if not recorded:
+        return None
+    result = Analysis(exact=False, timed_out=timed_out)
+    for i, cell in enumerate(frontier):
+        means = [batch[i] / batch_size for batch in batch_hits]
+        result.probabilities[cell] = hits[i] / recorded
+        result.uncertainty[cell] = _error_bound(hits[i] / recorded, means, recorded)
+    if outside:
+        means = [value / batch_size for value in batch_outside]
+        probability = outside_hits / recorded
+        bound = _error_bound(probability, means, recorded)
+        for cell in hidden:
+            if cell not in index:
+                result.probabilities[cell] = probability
+                result.uncertainty[cell] = bound
+    return result
+
+
+def _initial_assignment(n, cons, need, touching, fill, rng: random.Random, deadline: Optional[float] = None) -> Optional[list[int]]:
+    """
+    Description: finds one frontier assignment that satisfies every constraint and leaves a valid
+    number of mines for the outside cells, trying values in random order
+    Inputs: n (int): frontier cells, cons/need/touching: constraint structure, fill: outside weight,
+            rng (random.Random): random generator, deadline (float | None): monotonic time limit
+    Outputs: list[int] | None: 0/1 per frontier cell, or None if the search budget or time ran out
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    assignment = [0] * n
+    want = list(need)
+    left = [len(cells) for cells in cons]
+    nodes = 0
+
+    def search(i: int, mines: int) -> bool:
+        nonlocal nodes
+        nodes += 1
+        if nodes > SOLVER_NODE_BUDGET:
+            return False
+        if deadline is not None and not nodes & 1023 and time.monotonic() > deadline:
+            return False
+        if i == n:
+            return fill(mines) > 0
+        values = [0, 1]
+        rng.shuffle(values)
+        for value in values:
+            feasible = True
+            for ci in touching[i]:
+                left[ci] -= 1
+                want[ci] -= value
+                if want[ci] < 0 or want[ci] > left[ci]:
+                    feasible = False
+            found = False
+            if feasible:
+                assignment[i] = value
+                found = search(i + 1, mines + value)
+            for ci in touching[i]:
+                left[ci] += 1
+                want[ci] += value
+            if found:
+                return True
+            assignment[i] = 0
+        return False
+
+    return assignment if search(0, 0) else None
+
+
+def _gibbs_block(state, mines, cons, need, touching, fill, rng: random.Random) -> int:
+    """
+    Description: re-draws a block of connected frontier cells from its exact conditional
+    distribution given the rest of the assignment
+    Inputs: state (list[int]): assignment, updated in place, mines (int): mines in `state`,
+            cons/need/touching: constraint structure, fill: outside weight, rng: random generator
+    Outputs: int: mines in the updated assignment
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    n = len(state)
+    if n == 0:
+        return mines
+    # Grow a block from a random cell through shared constraints
+    start = rng.randrange(n)
+    block = [start]
+    members = {start}
+    queue = [start]
+    while queue and len(block) < MC_BLOCK_SIZE:
+        i = queue.pop(0)
+        for ci in touching[i]:
+            for j in cons[ci]:
+                if j not in members and len(block) < MC_BLOCK_SIZE:
+                    members.add(j)
+                    block.append(j)
+                    queue.append(j)
+
+    # What each touched constraint still needs from the block once the rest is fixed
+    want: dict[int, int] = {}
+    left: dict[int, int] = {}
+    for i in block:
+        for ci in touching[i]:
+            if ci not in want:
+                want[ci] = need[ci] - sum(state[j] for j in cons[ci] if j not in members)
+                left[ci] = sum(1 for j in cons[ci] if j in members)
+    base = mines - sum(state[i] for i in block)
+
+    options: list[tuple[list[int], int]] = []
+    choice = [0] * len(block)
+
+    def search(k: int, placed: int) -> None:
+        if k == len(block):
+            weight = fill(base + placed)
+            if weight:
+                options.append((list(choice), weight))
+            return
+        for value in (0, 1):
+            feasible = True
+            for ci in touching[block[k]]:
+                left[ci] -= 1
+                want[ci] -= value
+                if want[ci] < 0 or want[ci] > left[ci]:
+                    feasible = False
+            if feasible:
+                choice[k] = value
+                search(k + 1, placed + value)
+            for ci in touching[block[k]]:
+                left[ci] += 1
+                want[ci] += value
+        choice[k] = 0
+
+    search(0, 0)
+    # The current values are always an option, so this is never empty
+    total = sum(weight for _, weight in options)
+    pick = rng.randrange(total)
+    for values, weight in options:
+        pick -= weight
+        if pick < 0:
+            break
+    for i, value in zip(block, values):
+        state[i] = value
+    return base + sum(values)
+
+
+def _error_bound(probability: float, batch_means: list[float], samples: int) -> float:
+    """
+    Description: 95% error bound of a sampled probability, from the spread of batch means
+    (which accounts for correlation between chain steps), never below the binomial bound
+    Inputs: probability (float): estimate, batch_means (list[float]): per-batch estimates,
+            samples (int): recorded steps
+    Outputs: float: half-width of the 95% interval
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    binomial = sqrt(probability * (1 - probability) / samples)
+    batches = len(batch_means)
+    if batches < 2:
+        return 1.96 * binomial
+    spread = sum((m - probability) ** 2 for m in batch_means) / (batches - 1)
+    return 1.96 * max(sqrt(spread / batches), binomial)
@@ -0,0 +1,224 @@
+"""
+Name: spectate.py
+Description: Fan-out of game states to read-only spectators. Each game with watchers has a Channel
+that serializes a state once per stored version into a ready-to-send server-sent event; every
+subscriber gets the same bytes through a small bounded queue that drops its oldest frames when the
+subscriber falls behind, so a slow viewer skips ahead to the latest board instead of holding memory.
+Inputs: None
+Outputs: None
+External Sources: Server-sent events (https://html.spec.whatwg.org/multipage/server-sent-events.html)
+Author(s): Riley Meyerkorth
+Creation Date: 19 October 2026
+"""
+
+import asyncio
+import threading
+from collections import deque
+from typing import Callable, Optional
+
+from pydantic import BaseModel
+
+from .constants import SPECTATOR_QUEUE_SIZE
+
+
+def encode_frame(version: int, payload: BaseModel) -> bytes:
+    """
+    Description: serializes a state into one server-sent event
+    Inputs: version (int): stored version of the game, payload (BaseModel): state to send
+    Outputs: bytes: event ready to write to any subscriber
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    return b"id: %d\nevent: state\ndata: %s\n\n" % (version, payload.model_dump_json().encode())
+
+
+class Subscriber:
+    """
+    Description: One spectator connection. Frames are pushed from request threads and read by the
+    connection's event loop; the queue keeps only the newest SPECTATOR_QUEUE_SIZE frames.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, size: int = SPECTATOR_QUEUE_SIZE):
+        """
+        Description: creates an empty queue bound to the connection's event loop
+        Inputs: loop (AbstractEventLoop): loop serving the connection, size (int): frames kept
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self.loop: asyncio.AbstractEventLoop = loop
+        self.frames: deque[bytes] = deque(maxlen=size)
+        self.dropped: int = 0
+        self._ready = asyncio.Event()
+
+    def push(self, frame: bytes) -> None:
+        """
+        Description: queues a frame from any thread, dropping the oldest one if the queue is full
+        Inputs: frame (bytes): encoded event
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        if len(self.frames) == self.frames.maxlen:
+            self.dropped += 1
+        self.frames.append(frame)
+        self.loop.call_soon_threadsafe(self._ready.set)
+
+    async def next(self, timeout: float) -> Optional[bytes]:
+        """
+        Description: waits for the next frame
+        Inputs: timeout (float): seconds to wait
+        Outputs: bytes | None: frame, or None if nothing arrived in time
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        # push() appends before it sets the event, so clearing first cannot lose a frame
+        self._ready.clear()
+        if not self.frames:
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        return self.frames.popleft() if self.frames else None
+
+
+class Channel:
+    """
+    Description: Subscribers of one game and the last frame sent to them.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+
+    def __init__(self):
+        """
+        Description: creates a channel that has not sent anything yet
+        Inputs: None
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self.subscribers: set[Subscriber] = set()
+        self.version: int = 0
+        self.frame: Optional[bytes] = None
+        self._lock = threading.Lock()
+
+    def publish(self, version: int, render: Callable[[], BaseModel]) -> None:
+        """
+        Description: sends a version to every subscriber, serializing it only if no newer or equal
+        version was sent before
+        Inputs: version (int): stored version, render (callable): builds the state to send
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        with self._lock:
+            if version <= self.version:
+                return
+            self.version = version
+            self.frame = encode_frame(version, render())
+            for subscriber in self.subscribers:
+                subscriber.push(self.frame)
+
+
+class Broadcaster:
+    """
+    Description: Channels of every watched game in this worker. Publishing to a game nobody
+    watches costs a dictionary lookup.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+
+    def __init__(self):
+        """
+        Description: creates a broadcaster with no channels
+        Inputs: None
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self._channels: dict[str, Channel] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, game_id: str, subscriber: Subscriber) -> Channel:
+        """
+        Description: adds a subscriber to a game, queueing the last frame if one was sent
+        Inputs: game_id (str): game to watch, subscriber (Subscriber): connection
+        Outputs: Channel: the game's channel
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        with self._lock:
+            channel = self._channels.setdefault(game_id, Channel())
+            with channel._lock:
+                channel.subscribers.add(subscriber)
+                if channel.frame is not None:
+                    subscriber.push(channel.frame)
+        return channel
+
+    def unsubscribe(self, game_id: str, subscriber: Subscriber) -> None:
+        """
+        Description: removes a subscriber, dropping the channel with its last one
+        Inputs: game_id (str): watched game, subscriber (Subscriber): connection
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        with self._lock:
+            channel = self._channels.get(game_id)
+            if channel is None:
+                return
+            with channel._lock:
+                channel.subscribers.discard(subscriber)
+                if not channel.subscribers:
+                    del self._channels[game_id]
+
+    def publish(self, game_id: str, version: int, render: Callable[[], BaseModel]) -> None:
+        """
+        Description: sends a game's new version to its spectators, if it has any
+        Inputs: game_id (str): game, version (int): stored version, render (callable): builds the state
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        channel = self._channels.get(game_id)
+        if channel is not None:
+            channel.publish(version, render)
+
+    def sent_version(self, game_id: str) -> Optional[int]:
+        """
+        Description: last version sent to a game's spectators
+        Inputs: game_id (str): game
+        Outputs: int | None: version (0 before the first frame), or None if nobody watches the game
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        channel = self._channels.get(game_id)
+        return channel.version if channel is not None else None
+
+    def watchers(self, game_id: str) -> int:
+        """
+        Description: number of spectators of a game in this worker
+        Inputs: game_id (str): game
+        Outputs: int: subscriber count
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        channel = self._channels.get(game_id)
+        return len(channel.subscribers) if channel is not None else 0
@@ -0,0 +1,298 @@
+"""
+Name: stats.py
+Description: Statistics for finished games. Each game is queued by the server and written by a
+background thread in batches, one SQLite transaction per batch, so recording never holds up a
+request. Every write also folds the game into per-player, per-configuration aggregates (games,
+wins, best and total time, current and best win streak), and the leaderboard reads an index over
+those aggregates, so neither the leaderboard nor a profile ever scans the game history.
+Inputs: None
+Outputs: None
+External Sources: SQLite UPSERT (https://www.sqlite.org/lang_upsert.html)
+Author(s): Riley Meyerkorth
+Creation Date: 19 October 2026
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import NamedTuple, Optional
+
+from .constants import (
+    GAME_STORE_BUSY_TIMEOUT_MS,
+    STATS_BATCH_SIZE,
+    STATS_FLUSH_SECONDS,
+    STATS_PATH,
+    STATS_QUEUE_SIZE
+)
+from .models import GameMode, LeaderboardEntryModel, ProfileConfigModel
+
+
+class GameRecord(NamedTuple):
+    """
+    Description: One finished game as recorded in the statistics store
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    player: str
+    name: str
+    rows: int
+    cols: int
+    mines: int
+    game_mode: GameMode
+    difficulty: Optional[str]   # AI difficulty of co-op games
+    no_guess: bool
+    won: bool
+    seconds: float
+    moves: int
+    finished: float
+    assisted: bool = False      # hints or AI moves were used
+
+
+def config_key(rows: int, cols: int, mines: int, game_mode: GameMode = GameMode.SOLO,
+               difficulty: Optional[str] = None, no_guess: bool = False, assisted: bool = False) -> str:
+    """
+    Description: name of a game configuration; games are only ranked against the same configuration.
+    Assisted games get their own configuration, so their times and streaks never reach the
+    leaderboards of unassisted play
+    Inputs: rows, cols, mines (int): board, game_mode (GameMode): solo or co-op,
+            difficulty (str | None): AI difficulty (co-op only), no_guess (bool): no-guess boards,
+            assisted (bool): hints or AI moves were used
+    Outputs: str: key such as "16x16x40-solo", "10x10x10-coop-hard-ng" or "16x16x40-solo-assisted"
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    key = f"{rows}x{cols}x{mines}-{game_mode.value}"
+    if game_mode == GameMode.COOP and difficulty:
+        key += f"-{difficulty}"
+    return key + ("-ng" if no_guess else "") + ("-assisted" if assisted else "")
+
+
+class StatsStore:
+    """
+    Description: SQLite statistics database. record() only queues the game; a writer thread owns
+    the write connection and commits queued games in batches. Reads use one connection per thread,
+    and WAL mode keeps them from waiting on the writer (or on other worker processes).
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: SQLite WAL mode
+    """
+
+    def __init__(self, path: str = STATS_PATH, batch_size: int = STATS_BATCH_SIZE,
+                 flush_seconds: float = STATS_FLUSH_SECONDS, queue_size: int = STATS_QUEUE_SIZE):
+        """
+        Description: opens (and if needed creates) the database and starts the writer thread
+        Inputs: path (str): database file, batch_size (int): most games committed together,
+                flush_seconds (float): longest a queued game waits for its batch to fill,
+                queue_size (int): games queued before new ones are dropped
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self.path: str = path
+        self.batch_size: int = batch_size
+        self.flush_seconds: float = flush_seconds
+        # games lost because the queue was full or their batch failed; statistics never slow a request down
+        self.dropped: int = 0
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._local = threading.local()
+        with self._connection() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS games ("
+                "id INTEGER PRIMARY KEY, player TEXT NOT NULL, config TEXT NOT NULL, won INTEGER NOT NULL, "
+                "seconds REAL NOT NULL, moves INTEGER NOT NULL, finished REAL NOT NULL)"
+            )
+            db.execute("CREATE TABLE IF NOT EXISTS players (player TEXT PRIMARY KEY, name TEXT NOT NULL)")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS aggregates ("
+                "player TEXT NOT NULL, config TEXT NOT NULL, played INTEGER NOT NULL, won INTEGER NOT NULL, "
+                "best_seconds REAL, total_seconds REAL NOT NULL, streak INTEGER NOT NULL, "
+                "best_streak INTEGER NOT NULL, last_finished REAL NOT NULL, PRIMARY KEY (player, config))"
+            )
+            # Leaderboards read the best times of one configuration in order, straight off this index
+            db.execute(
+                "CREATE INDEX IF NOT EXISTS aggregates_best ON aggregates (config, best_seconds) "
+                "WHERE best_seconds IS NOT NULL"
+            )
+        self._queue: queue.Queue[Optional[GameRecord]] = queue.Queue(maxsize=queue_size)
+        self._writer = threading.Thread(target=self._run, name="stats-writer", daemon=True)
+        self._writer.start()
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Description: this thread's connection, opened in WAL mode on first use
+        Inputs: None
+        Outputs: sqlite3.Connection: connection usable as a transaction context manager
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=GAME_STORE_BUSY_TIMEOUT_MS / 1000)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    def record(self, game: GameRecord) -> None:
+        """
+        Description: queues a finished game for the writer thread
+        Inputs: game (GameRecord): game to record
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        try:
+            self._queue.put_nowait(game)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self) -> None:
+        """
+        Description: writer thread: takes the first queued game, waits up to flush_seconds for
+        the batch to fill and commits it; stops at the None sentinel queued by close()
+        Inputs: None
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_seconds
+            while batch[-1] is not None and len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+            stop = batch[-1] is None
+            games = batch[:-1] if stop else batch
+            try:
+                if games:
+                    self._write(games)
+            except sqlite3.Error:
+                # a batch that cannot be written is lost, but the writer keeps going
+                self.dropped += len(games)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                self._connection().close()
+                return
+
+    def _write(self, games: list[GameRecord]) -> None:
+        """
+        Description: inserts a batch of games and updates their aggregates in one transaction
+        Inputs: games (list[GameRecord]): games in the order they finished
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        rows = [
+            (game.player,
+             config_key(game.rows, game.cols, game.mines, game.game_mode, game.difficulty, game.no_guess, game.assisted),
+             int(game.won), game.seconds, game.moves, game.finished)
+            for game in games
+        ]
+        with self._connection() as db:
+            db.executemany(
+                "INSERT INTO games (player, config, won, seconds, moves, finished) VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+            db.executemany(
+                "INSERT INTO players (player, name) VALUES (?, ?) "
+                "ON CONFLICT (player) DO UPDATE SET name = excluded.name",
+                [(game.player, game.name) for game in games],
+            )
+            # Every SET expression sees the row as it was before this game, so the streak is
+            # computed the same way in both streak columns
+            db.executemany(
+                "INSERT INTO aggregates (player, config, played, won, best_seconds, total_seconds, streak, "
+                "best_streak, last_finished) VALUES (?1, ?2, 1, ?3, CASE WHEN ?3 THEN ?4 END, ?4, ?3, ?3, ?6) "
+                "ON CONFLICT (player, config) DO UPDATE SET "
+                "played = played + 1, "
+                "won = won + excluded.won, "
+                "best_seconds = CASE WHEN excluded.won THEN min(coalesce(best_seconds, excluded.total_seconds), "
+                "excluded.total_seconds) ELSE best_seconds END, "
+                "total_seconds = total_seconds + excluded.total_seconds, "
+                "streak = CASE WHEN excluded.won THEN streak + 1 ELSE 0 END, "
+                "best_streak = max(best_streak, CASE WHEN excluded.won THEN streak + 1 ELSE 0 END), "
+                "last_finished = max(last_finished, excluded.last_finished)",
+                rows,
+            )
+
+    def flush(self) -> None:
+        """
+        Description: waits until every queued game has been written
+        Inputs: None
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self._queue.join()
+
+    def leaderboard(self, config: str, limit: int) -> list[LeaderboardEntryModel]:
+        """
+        Description: fastest winning times for a configuration, one entry per player
+        Inputs: config (str): key from config_key, limit (int): entries to return
+        Outputs: list[LeaderboardEntryModel]: best first
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        rows = self._connection().execute(
+            "SELECT players.name, a.best_seconds, a.played, a.won, a.best_streak "
+            "FROM aggregates AS a JOIN players USING (player) "
+            "WHERE a.config = ? AND a.best_seconds IS NOT NULL "
+            "ORDER BY a.best_seconds, a.last_finished LIMIT ?",
+            (config, limit),
+        ).fetchall()
+        return [
+            LeaderboardEntryModel(rank=rank, name=name, best_seconds=best, played=played, won=won,
+                                  win_rate=won / played, best_streak=best_streak)
+            for rank, (name, best, played, won, best_streak) in enumerate(rows, start=1)
+        ]
+
+    def profile(self, player: str) -> tuple[Optional[str], list[ProfileConfigModel]]:
+        """
+        Description: a player's name and aggregates for every configuration they have played
+        Inputs: player (str): player id
+        Outputs: tuple: name (None for unknown players), aggregates most recently played first
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        db = self._connection()
+        name = db.execute("SELECT name FROM players WHERE player = ?", (player,)).fetchone()
+        rows = db.execute(
+            "SELECT config, played, won, best_seconds, total_seconds, streak, best_streak "
+            "FROM aggregates WHERE player = ? ORDER BY last_finished DESC",
+            (player,),
+        ).fetchall()
+        configs = [
+            ProfileConfigModel(config=config, played=played, won=won, win_rate=won / played,
+                               best_seconds=best, average_seconds=total / played,
+                               streak=streak, best_streak=best_streak)
+            for config, played, won, best, total, streak, best_streak in rows
+        ]
+        return (name[0] if name else None), configs
+
+    def close(self) -> None:
+        """
+        Description: writes what is still queued and stops the writer thread
+        Inputs: None
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
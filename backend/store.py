@@ -0,0 +1,776 @@
+"""
+Name: store.py
+Description: Game-state storage for the server. A GameSession holds everything one game needs
+between requests; a GameStore loads, locks and saves sessions with optimistic versioning, so any
+worker process can serve any game. MemoryStore keeps sessions in the process and hibernates idle
+ones to compressed files under a memory budget, SQLiteStore shares them between processes through
+a WAL-mode database. Both delete games nobody has touched for GAME_EXPIRE_SECONDS.
+Inputs: None
+Outputs: None
+External Sources: SQLite write-ahead logging (https://www.sqlite.org/wal.html)
+Author(s): Riley Meyerkorth
+Creation Date: 19 October 2026
+"""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Iterator, Optional
+
+from .constants import (
+    AI_DEFAULT_DEADLINE_MS,
+    GAME_EXPIRE_INTERVAL,
+    GAME_EXPIRE_SECONDS,
+    GAME_HIBERNATE_LEVEL,
+    GAME_HIBERNATE_PATH,
+    GAME_IDLE_SECONDS,
+    GAME_MEMORY_BUDGET,
+    GAME_STORE,
+    GAME_STORE_BUSY_TIMEOUT_MS,
+    GAME_STORE_PATH
+)
+from .engine import BoardEngine
+from .models import GameMode, StoreStatsModel
+from .replay import MoveLog
+
+
+class StaleGameError(Exception):
+    """
+    Description: Raised when saving a session that another request saved first.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+
+
+def watch_id(game_id: str) -> str:
+    """
+    Description: public id spectators use to watch a game. It is derived one way from the game id,
+    so sharing it does not let anyone play the game
+    Inputs: game_id (str): game
+    Outputs: str: hex watch id
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    return hashlib.blake2b(game_id.encode(), digest_size=16, person=b"spectate").hexdigest()
+
+
+@dataclass
+class GameSession:
+    """
+    Description: Per-game state the server used to keep in instance attributes.
+    `version` is the stored version the session was loaded at.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    game_id: str
+    board: Optional[BoardEngine] = None
+    initialized: bool = False
+    alive: bool = True
+    game_mode: GameMode = GameMode.SOLO
+    ai_difficulty: str = "medium"
+    no_guess: bool = False
+    ai_deadline_ms: int = AI_DEFAULT_DEADLINE_MS
+    version: int = 0
+    # moves so far and whether the finished game was written out as a replay
+    moves: MoveLog = field(default_factory=MoveLog)
+    started: float = field(default_factory=time.time)
+    recorded: bool = False
+    # player cookie and display name the finished game is credited to in the statistics
+    player: Optional[str] = None
+    player_name: Optional[str] = None
+    # set once the player asked for a hint or an AI move, which keeps the game off the leaderboard
+    assisted: bool = False
+
+
+class GameStore(ABC):
+    """
+    Description: Storage interface. Handlers load a game under lock() and save it only if they
+    changed it; save() raises StaleGameError if the stored version moved on, and the caller retries
+    from a fresh load. MemoryStore hands out its live session, so a handler must not fail after it
+    started changing one. Saves also expire abandoned games now and then.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+
+    def __init__(self, expire_seconds: float = GAME_EXPIRE_SECONDS):
+        """
+        Description: sets up the per-game lock table and the expiry schedule
+        Inputs: expire_seconds (float): idle time after which a game is deleted
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+        self.expire_seconds: float = expire_seconds
+        # games this store deleted for being idle, and when the next sweep is due
+        self.expired: int = 0
+        self._next_expiry: float = 0.0
+
+    @abstractmethod
+    def load(self, game_id: str) -> Optional[GameSession]:
+        """
+        Description: loads a stored session
+        Inputs: game_id (str): game to load
+        Outputs: GameSession | None: the session, or None for unknown games
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+
+    @abstractmethod
+    def save(self, session: GameSession) -> None:
+        """
+        Description: stores a session loaded at session.version and advances its version; raises StaleGameError
+        if the stored version moved on
+        Inputs: session (GameSession): session to store
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+
+    @abstractmethod
+    def delete(self, game_id: str) -> None:
+        """
+        Description: forgets a game
+        Inputs: game_id (str): game to drop
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+
+    @abstractmethod
+    def version_of(self, game_id: str) -> Optional[int]:
+        """
+        Description: stored version of a game, read without loading it
+        Inputs: game_id (str): game
+        Outputs: int | None: version, or None for unknown games
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+
+    @abstractmethod
+    def find_watched(self, watch: str) -> Optional[str]:
+        """
+        Description: game id behind a watch id
+        Inputs: watch (str): watch id
+        Outputs: str | None: game id, or None if no game has that watch id
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+
+    @abstractmethod
+    def stats(self) -> StoreStatsModel:
+        """
+        Description: how many games are stored and how much memory and disk they use
+        Inputs: None
+        Outputs: StoreStatsModel: current figures
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+
+    @abstractmethod
+    def expire(self) -> int:
+        """
+        Description: deletes every game nobody has touched for expire_seconds
+        Inputs: None
+        Outputs: int: games deleted
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+
+    def _expire_due(self) -> bool:
+        """
+        Description: whether the next expiry sweep is due; claims it if so, so saves sweep at most once
+        every GAME_EXPIRE_INTERVAL seconds
+        Inputs: None
+        Outputs: bool: True if the caller should sweep now
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        now = time.monotonic()
+        if now < self._next_expiry:
+            return False
+        self._next_expiry = now + GAME_EXPIRE_INTERVAL
+        return True
+
+    @contextmanager
+    def lock(self, game_id: str) -> Iterator[None]:
+        """
+        Description: serializes requests for one game inside this process; across processes the
+        version check in save() catches conflicting writes
+        Inputs: game_id (str): game to lock
+        Outputs: context manager holding the lock
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        with self._locks_lock:
+            lock = self._locks.setdefault(game_id, threading.Lock())
+        with lock:
+            yield
+
+    def close(self) -> None:
+        """
+        Description: releases any resources held by the store
+        Inputs: None
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+
+
+def _deep_size(obj: Any, seen: set[int]) -> int:
+    """
+    Description: approximate bytes held by an object graph. Shared singletons (small ints, bools,
+    None, enum members, classes) are free, and objects count what they would pickle, so boards do
+    not charge themselves for the per-size tables they share
+    Inputs: obj (Any): root object, seen (set[int]): ids already counted
+    Outputs: int: size in bytes
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    if obj is None or isinstance(obj, (bool, Enum, type)) or id(obj) in seen:
+        return 0
+    if isinstance(obj, int) and -5 <= obj <= 256:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (int, float, str, bytes, array)):
+        return size
+    if isinstance(obj, dict):
+        return size + sum(_deep_size(key, seen) + _deep_size(value, seen) for key, value in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        # grids are mostly small ints and bools; skip them without a call per cell
+        return size + sum(
+            _deep_size(item, seen) for item in obj
+            if not (type(item) is int and -5 <= item <= 256 or type(item) is bool)
+        )
+    return size + _deep_size(obj.__getstate__(), seen)
+
+
+class MemoryStore(GameStore):
+    """
+    Description: Sessions kept as live objects in this process. Only valid with a single worker.
+    Games idle for `idle_seconds`, and the least recently used games whenever the resident ones
+    outgrow `budget_bytes`, are pickled, compressed and moved to `hibernate_path`; their next load
+    brings them back transparently. Games idle for `expire_seconds` are deleted from both tiers.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+
+    def __init__(self, hibernate_path: Optional[str] = None, idle_seconds: float = GAME_IDLE_SECONDS,
+                 budget_bytes: int = GAME_MEMORY_BUDGET, expire_seconds: float = GAME_EXPIRE_SECONDS):
+        """
+        Description: creates an empty store
+        Inputs: hibernate_path (str | None): directory for hibernated games, None keeps every game resident,
+                idle_seconds (float): idle time before a game is hibernated,
+                budget_bytes (int): approximate memory allowed for resident games,
+                expire_seconds (float): idle time after which a game is deleted
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        super().__init__(expire_seconds)
+        # least recently used first
+        self._sessions: OrderedDict[str, GameSession] = OrderedDict()
+        self._versions: dict[str, int] = {}
+        # watch id -> game id
+        self._watched: dict[str, str] = {}
+        self._touched: dict[str, float] = {}
+        # game -> (initialized when measured, approximate bytes)
+        self._sizes: dict[str, tuple[bool, int]] = {}
+        self._resident_bytes: int = 0
+        # hibernated game -> compressed size on disk
+        self._hibernated: dict[str, int] = {}
+        self.hibernate_path: Optional[str] = hibernate_path
+        self.idle_seconds: float = idle_seconds
+        self.budget_bytes: int = budget_bytes
+        if hibernate_path is not None:
+            os.makedirs(hibernate_path, exist_ok=True)
+
+    def _file(self, game_id: str) -> str:
+        """
+        Description: path of a game's hibernation file
+        Inputs: game_id (str): game
+        Outputs: str: file path
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return os.path.join(self.hibernate_path, f"{game_id}.game")
+
+    def _drop_resident(self, game_id: str) -> Optional[GameSession]:
+        """
+        Description: removes a game from memory and from the resident byte count
+        Inputs: game_id (str): game
+        Outputs: GameSession | None: the removed session
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self._touched.pop(game_id, None)
+        self._resident_bytes -= self._sizes.pop(game_id, (False, 0))[1]
+        return self._sessions.pop(game_id, None)
+
+    def _wake(self, game_id: str) -> Optional[GameSession]:
+        """
+        Description: reads a hibernated game back into memory
+        Inputs: game_id (str): game
+        Outputs: GameSession | None: the session, or None if it was never hibernated
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        # game ids come from a cookie, so only ids this store could have issued name a file
+        if self.hibernate_path is None or not game_id.isalnum():
+            return None
+        try:
+            with open(self._file(game_id), "rb") as f:
+                session = pickle.loads(zlib.decompress(f.read()))
+        except FileNotFoundError:
+            return None
+        os.remove(self._file(game_id))
+        self._hibernated.pop(game_id, None)
+        # Files left by an earlier process carry their own version
+        self._versions.setdefault(game_id, session.version)
+        self._watched[watch_id(game_id)] = game_id
+        self._sessions[game_id] = session
+        self._touched[game_id] = time.monotonic()
+        self._measure(session)
+        return session
+
+    def _measure(self, session: GameSession) -> None:
+        """
+        Description: records a resident game's footprint. Boards keep the same structures from the
+        first click on, so a game is measured when it enters memory and once more after its mines
+        are placed rather than on every move
+        Inputs: session (GameSession): resident session
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        measured = self._sizes.get(session.game_id)
+        if measured is not None and measured[0] == session.initialized:
+            return
+        size = _deep_size(session, set())
+        self._resident_bytes += size - (measured[1] if measured is not None else 0)
+        self._sizes[session.game_id] = (session.initialized, size)
+
+    def _hibernate(self, game_id: str) -> None:
+        """
+        Description: compresses a resident game to disk and drops it from memory
+        Inputs: game_id (str): game
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        session = self._drop_resident(game_id)
+        data = zlib.compress(pickle.dumps(session, protocol=pickle.HIGHEST_PROTOCOL), GAME_HIBERNATE_LEVEL)
+        with open(self._file(game_id), "wb") as f:
+            f.write(data)
+        self._hibernated[game_id] = len(data)
+
+    def _sweep(self) -> None:
+        """
+        Description: hibernates idle games, then least recently used ones until the resident games
+        fit the budget. Games whose lock is held are in use and stay resident
+        Inputs: None
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        if self.hibernate_path is None:
+            return
+        idle_before = time.monotonic() - self.idle_seconds
+        for game_id in list(self._sessions):
+            idle = self._touched[game_id] < idle_before
+            if not idle and self._resident_bytes <= self.budget_bytes:
+                break
+            lock = self._locks.get(game_id)
+            if lock is None or not lock.locked():
+                self._hibernate(game_id)
+
+    def load(self, game_id: str) -> Optional[GameSession]:
+        """
+        Description: returns the live session object, waking it from disk if it was hibernated
+        Inputs: game_id (str): game to load
+        Outputs: GameSession | None: stored session
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        with self._locks_lock:
+            session = self._sessions.get(game_id)
+            if session is None:
+                return self._wake(game_id)
+            self._sessions.move_to_end(game_id)
+            self._touched[game_id] = time.monotonic()
+            return session
+
+    def save(self, session: GameSession) -> None:
+        """
+        Description: stores the session if nobody saved a newer version in between, then
+        hibernates whatever no longer fits
+        Inputs: session (GameSession): session to store
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        with self._locks_lock:
+            stored = self._versions.get(session.game_id, 0)
+            if stored != session.version:
+                raise StaleGameError(session.game_id)
+            session.version = stored + 1
+            self._versions[session.game_id] = session.version
+            if stored == 0:
+                self._watched[watch_id(session.game_id)] = session.game_id
+            if self._sessions.get(session.game_id) is not session:
+                self._drop_resident(session.game_id)
+            self._sessions[session.game_id] = session
+            self._sessions.move_to_end(session.game_id)
+            self._touched[session.game_id] = time.monotonic()
+            self._measure(session)
+            self._sweep()
+            if self._expire_due():
+                self._expire()
+
+    def delete(self, game_id: str) -> None:
+        """
+        Description: forgets a game, including its hibernation file
+        Inputs: game_id (str): game to drop
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        with self._locks_lock:
+            self._forget(game_id)
+
+    def _forget(self, game_id: str) -> None:
+        """
+        Description: drops every trace of a game; the caller holds the store lock
+        Inputs: game_id (str): game to drop
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self._drop_resident(game_id)
+        self._versions.pop(game_id, None)
+        self._watched.pop(watch_id(game_id), None)
+        self._locks.pop(game_id, None)
+        self._hibernated.pop(game_id, None)
+        # Files left by an earlier process are not in _hibernated, so always look for one
+        if self.hibernate_path is not None and game_id.isalnum():
+            try:
+                os.remove(self._file(game_id))
+            except FileNotFoundError:
+                pass
+
+    def expire(self) -> int:
+        """
+        Description: deletes resident and hibernated games nobody has touched for expire_seconds
+        Inputs: None
+        Outputs: int: games deleted
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        with self._locks_lock:
+            return self._expire()
+
+    def _expire(self) -> int:
+        """
+        Description: expiry sweep; the caller holds the store lock. Resident games go by their last use,
+        hibernated ones by the time their file was written, which also covers files left by an
+        earlier process. Games whose lock is held are in use and stay
+        Inputs: None
+        Outputs: int: games deleted
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        idle_before = time.monotonic() - self.expire_seconds
+        stale = []
+        for game_id, touched in self._touched.items():
+            lock = self._locks.get(game_id)
+            if touched < idle_before and (lock is None or not lock.locked()):
+                stale.append(game_id)
+        if self.hibernate_path is not None:
+            written_before = time.time() - self.expire_seconds
+            with os.scandir(self.hibernate_path) as entries:
+                for entry in entries:
+                    game_id, suffix = os.path.splitext(entry.name)
+                    if suffix == ".game" and game_id not in self._sessions and entry.stat().st_mtime < written_before:
+                        stale.append(game_id)
+        for game_id in stale:
+            self._forget(game_id)
+        self.expired += len(stale)
+        return len(stale)
+
+    def version_of(self, game_id: str) -> Optional[int]:
+        """
+        Description: stored version of a game, resident or hibernated
+        Inputs: game_id (str): game
+        Outputs: int | None: version, or None for unknown games
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return self._versions.get(game_id)
+
+    def find_watched(self, watch: str) -> Optional[str]:
+        """
+        Description: game id behind a watch id
+        Inputs: watch (str): watch id
+        Outputs: str | None: game id, or None if no game here has that watch id
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return self._watched.get(watch)
+
+    def stats(self) -> StoreStatsModel:
+        """
+        Description: resident versus hibernated games and the bytes each tier uses
+        Inputs: None
+        Outputs: StoreStatsModel: current figures
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        with self._locks_lock:
+            return StoreStatsModel(
+                kind="memory",
+                resident=len(self._sessions),
+                hibernated=len(self._hibernated),
+                resident_bytes=self._resident_bytes,
+                hibernated_bytes=sum(self._hibernated.values()),
+                budget_bytes=self.budget_bytes if self.hibernate_path is not None else None,
+                expired=self.expired,
+                expire_seconds=self.expire_seconds,
+            )
+
+
+class SQLiteStore(GameStore):
+    """
+    Description: Sessions pickled into a WAL-mode SQLite database shared by every worker. Readers
+    never block the writer, and an UPDATE guarded by the loaded version makes concurrent saves of
+    the same game fail instead of overwriting each other. Rows not updated for expire_seconds are
+    deleted.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: SQLite WAL mode
+    """
+
+    def __init__(self, path: str = GAME_STORE_PATH, expire_seconds: float = GAME_EXPIRE_SECONDS):
+        """
+        Description: opens (and if needed creates) the database
+        Inputs: path (str): database file, expire_seconds (float): idle time after which a game is deleted
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        super().__init__(expire_seconds)
+        self.path: str = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # one connection per thread, since FastAPI runs sync handlers in a thread pool
+        self._local = threading.local()
+        with self._connection() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS games ("
+                "id TEXT PRIMARY KEY, version INTEGER NOT NULL, data BLOB NOT NULL, updated REAL NOT NULL)"
+            )
+            # Databases created before spectating lack the watch column
+            if "watch" not in [row[1] for row in db.execute("PRAGMA table_info(games)")]:
+                db.execute("ALTER TABLE games ADD COLUMN watch TEXT")
+            db.execute("CREATE INDEX IF NOT EXISTS games_watch ON games (watch)")
+            # Expiry deletes the oldest rows straight off this index
+            db.execute("CREATE INDEX IF NOT EXISTS games_updated ON games (updated)")
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Description: this thread's connection, opened in WAL mode on first use
+        Inputs: None
+        Outputs: sqlite3.Connection: connection usable as a transaction context manager
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=GAME_STORE_BUSY_TIMEOUT_MS / 1000)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    def load(self, game_id: str) -> Optional[GameSession]:
+        """
+        Description: reads and unpickles a session
+        Inputs: game_id (str): game to load
+        Outputs: GameSession | None: a private copy of the stored session
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        row = self._connection().execute("SELECT version, data FROM games WHERE id = ?", (game_id,)).fetchone()
+        if row is None:
+            return None
+        session = pickle.loads(row[1])
+        session.version = row[0]
+        return session
+
+    def save(self, session: GameSession) -> None:
+        """
+        Description: writes the session if the stored version still matches the loaded one
+        Inputs: session (GameSession): session to store
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        data = pickle.dumps(session, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._connection() as db:
+            if session.version == 0:
+                cursor = db.execute(
+                    "INSERT OR IGNORE INTO games (id, version, data, updated, watch) VALUES (?, 1, ?, ?, ?)",
+                    (session.game_id, data, time.time(), watch_id(session.game_id)),
+                )
+            else:
+                cursor = db.execute(
+                    "UPDATE games SET version = version + 1, data = ?, updated = ? WHERE id = ? AND version = ?",
+                    (data, time.time(), session.game_id, session.version),
+                )
+        if cursor.rowcount != 1:
+            raise StaleGameError(session.game_id)
+        session.version += 1
+        if self._expire_due():
+            self.expire()
+
+    def delete(self, game_id: str) -> None:
+        """
+        Description: forgets a game
+        Inputs: game_id (str): game to drop
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        with self._connection() as db:
+            db.execute("DELETE FROM games WHERE id = ?", (game_id,))
+
+    def expire(self) -> int:
+        """
+        Description: deletes games whose row was not updated for expire_seconds. A request that loaded one
+        of them just before gets StaleGameError on save and then finds no game
+        Inputs: None
+        Outputs: int: games deleted
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        with self._connection() as db:
+            cursor = db.execute("DELETE FROM games WHERE updated < ?", (time.time() - self.expire_seconds,))
+        self.expired += cursor.rowcount
+        return cursor.rowcount
+
+    def version_of(self, game_id: str) -> Optional[int]:
+        """
+        Description: stored version of a game, read without unpickling it
+        Inputs: game_id (str): game
+        Outputs: int | None: version, or None for unknown games
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        row = self._connection().execute("SELECT version FROM games WHERE id = ?", (game_id,)).fetchone()
+        return row[0] if row is not None else None
+
+    def find_watched(self, watch: str) -> Optional[str]:
+        """
+        Description: game id behind a watch id
+        Inputs: watch (str): watch id
+        Outputs: str | None: game id, or None if no stored game has that watch id
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        row = self._connection().execute("SELECT id FROM games WHERE watch = ?", (watch,)).fetchone()
+        return row[0] if row is not None else None
+
+    def stats(self) -> StoreStatsModel:
+        """
+        Description: every game lives in the database, so all of them count as hibernated
+        Inputs: None
+        Outputs: StoreStatsModel: current figures
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        count, size = self._connection().execute("SELECT COUNT(*), COALESCE(SUM(LENGTH(data)), 0) FROM games").fetchone()
+        return StoreStatsModel(kind="sqlite", hibernated=count, hibernated_bytes=size,
+                               expired=self.expired, expire_seconds=self.expire_seconds)
+
+    def close(self) -> None:
+        """
+        Description: closes this thread's connection
+        Inputs: None
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        db = getattr(self._local, "db", None)
+        if db is not None:
+            db.close()
+            self._local.db = None
+
+
+def create_store(kind: str = GAME_STORE) -> GameStore:
+    """
+    Description: builds the configured store
+    Inputs: kind (str): "memory" or "sqlite"
+    Outputs: GameStore: new store
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    if kind == "memory":
+        return MemoryStore(GAME_HIBERNATE_PATH)
+    if kind == "sqlite":
+        return SQLiteStore()
+    raise ValueError(f"Unknown game store: {kind}")
@@ -0,0 +1,370 @@
+"""
+Name: vector_env.py
+Description: Batched Minesweeper environment for bots and experiments. N games of the same size are
+stacked into one integer bitset per plane (mines, revealed, flags, counts), so a step applies one
+action to every game with a handful of whole-stack bit operations instead of N Board method calls.
+Finished games are reset automatically. Mines are dealt by draw_mines, the first-click-safe rule
+Board.place_mines uses, and reveals expand exactly like Board.reveal_cell.
+Inputs: None
+Outputs: None
+External Sources: N/A
+Author(s): Riley Meyerkorth
+Creation Date: 19 October 2026
+"""
+
+import random
+from dataclasses import dataclass, field
+from typing import Sequence
+
+from .bitboard import COUNT_PLANES, count_planes, flood
+from .board import draw_mines
+from .constants import CELL_MINE, DEFAULT_COLS, DEFAULT_MINE_COUNT, DEFAULT_ROWS
+from .models import Cell
+
+# Observation values for cells the player cannot read
+OBS_HIDDEN = -2
+OBS_FLAG = -3
+
+
+@dataclass(frozen=True)
+class StackLayout:
+    """
+    Description: Geometry of N boards stacked in one bitset. Each board is a block of
+    `block_rows` rows of `width` bits (cols plus at least one padding column); the rows below the
+    board are padding too, so shifts never reach a neighboring board, and every block is a whole
+    number of bytes so per-game slices come straight from int.to_bytes.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    games: int
+    rows: int
+    cols: int
+    width: int = field(init=False)
+    stride: int = field(init=False)
+    block_bytes: int = field(init=False)
+    cells: int = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """
+        Description: derives the padded block size and the on-board mask of the whole stack
+        Inputs: None
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        width = self.cols + 1
+        block_rows = self.rows + 1
+        while (block_rows * width) % 8:
+            block_rows += 1
+        row_mask = (1 << self.cols) - 1
+        block = sum(row_mask << (r * width) for r in range(self.rows))
+        # frozen dataclass: derived fields are set once here
+        object.__setattr__(self, "width", width)
+        object.__setattr__(self, "stride", block_rows * width)
+        object.__setattr__(self, "block_bytes", block_rows * width // 8)
+        object.__setattr__(self, "cells", self.replicate(block))
+
+    def replicate(self, block: int) -> int:
+        """
+        Description: the same single-board mask repeated for every game
+        Inputs: block (int): mask of one board
+        Outputs: int: stacked mask
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return int.from_bytes(block.to_bytes(self.block_bytes, "little") * self.games, "little")
+
+    def index(self, game: int, row: int, col: int) -> int:
+        """
+        Description: bit index of a cell of one game
+        Inputs: game (int), row (int), col (int): cell to locate
+        Outputs: int: bit index in the stack
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return game * self.stride + row * self.width + col
+
+    def blocks(self, mask: int) -> list[int]:
+        """
+        Description: splits a stacked mask into one mask per game
+        Inputs: mask (int): stacked mask
+        Outputs: list[int]: per-game masks in board-local bit positions
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        size = self.block_bytes
+        data = mask.to_bytes(size * self.games, "little")
+        return [int.from_bytes(data[g * size:(g + 1) * size], "little") for g in range(self.games)]
+
+    def any(self, mask: int) -> list[bool]:
+        """
+        Description: whether each game has any bit set in a stacked mask
+        Inputs: mask (int): stacked mask
+        Outputs: list[bool]: one flag per game
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        size = self.block_bytes
+        data = mask.to_bytes(size * self.games, "little")
+        empty = bytes(size)
+        return [data[g * size:(g + 1) * size] != empty for g in range(self.games)]
+
+    def with_blocks(self, mask: int, blocks: dict[int, int]) -> int:
+        """
+        Description: replaces the blocks of some games in a stacked mask
+        Inputs: mask (int): stacked mask, blocks (dict[int, int]): new board-local mask by game
+        Outputs: int: updated stacked mask
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        size = self.block_bytes
+        data = bytearray(mask.to_bytes(size * self.games, "little"))
+        for game, block in blocks.items():
+            data[game * size:(game + 1) * size] = block.to_bytes(size, "little")
+        return int.from_bytes(data, "little")
+
+
+@dataclass(frozen=True)
+class Observation:
+    """
+    Description: What the players of every game can see after a step, as stacked bitsets.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    layout: StackLayout
+    revealed: int
+    flags: int
+    # count planes and mines, restricted to revealed cells
+    counts: tuple[int, ...]
+    mines: int
+
+    def grids(self) -> list[list[list[int]]]:
+        """
+        Description: the observation as a (games, rows, cols) nested list: counts and CELL_MINE for
+        revealed cells, OBS_FLAG for flags and OBS_HIDDEN for everything else
+        Inputs: None
+        Outputs: list[list[list[int]]]: one grid per game
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        layout = self.layout
+        planes = [layout.blocks(plane) for plane in (self.revealed, self.flags, self.mines, *self.counts)]
+        grids = []
+        for game in range(layout.games):
+            revealed, flags, mines, *counts = (plane[game] for plane in planes)
+            grid = []
+            for r in range(layout.rows):
+                row = []
+                for c in range(layout.cols):
+                    i = r * layout.width + c
+                    if (revealed >> i) & 1:
+                        if (mines >> i) & 1:
+                            row.append(CELL_MINE)
+                        else:
+                            row.append(sum(((plane >> i) & 1) << k for k, plane in enumerate(counts)))
+                    else:
+                        row.append(OBS_FLAG if (flags >> i) & 1 else OBS_HIDDEN)
+                grid.append(row)
+            grids.append(grid)
+        return grids
+
+
+@dataclass(frozen=True)
+class StepResult:
+    """
+    Description: Result of one batched step. `done` and `win` describe the game that just ended;
+    its slot in `observation` already shows the fresh game that replaced it.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    observation: Observation
+    done: list[bool]
+    win: list[bool]
+
+
+class VectorEnv:
+    """
+    Description: N independent games of the same size stepped together. Actions are
+    ("reveal" | "flag", row, col), one per game per step.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+
+    def __init__(self, games: int, rows: int = DEFAULT_ROWS, cols: int = DEFAULT_COLS,
+                 mines: int = DEFAULT_MINE_COUNT, seed: int | None = None):
+        """
+        Description: creates the environment with every game waiting for its first click
+        Inputs: games (int): number of parallel games, rows (int), cols (int): board size,
+                mines (int): mines per game, seed (int | None): seed for mine placement
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        # the first click keeps up to nine cells clear
+        if games < 1 or mines < 0 or mines > rows * cols - 9:
+            raise ValueError(f"Invalid environment: {games} games of {rows}x{cols} with {mines} mines")
+        self.layout: StackLayout = StackLayout(games, rows, cols)
+        self.mines: int = mines
+        self.episodes: int = 0
+        self.wins: int = 0
+        self._rng = random.Random(seed)
+        self.reset()
+
+    def reset(self) -> Observation:
+        """
+        Description: starts a new game in every slot
+        Inputs: None
+        Outputs: Observation: all cells hidden
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self._mines: int = 0
+        self._revealed: int = 0
+        self._flags: int = 0
+        self._planes: list[int] = [0] * COUNT_PLANES
+        self._zero: int = 0
+        self._placed: list[bool] = [False] * self.layout.games
+        return self.observe()
+
+    def observe(self) -> Observation:
+        """
+        Description: the current visible state of every game
+        Inputs: None
+        Outputs: Observation: stacked visible state
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        revealed = self._revealed
+        return Observation(
+            layout=self.layout,
+            revealed=revealed,
+            flags=self._flags,
+            counts=tuple(plane & revealed for plane in self._planes),
+            mines=self._mines & revealed,
+        )
+
+    def mine_cells(self, game: int) -> list[Cell]:
+        """
+        Description: the mines of one game, for debugging and replays
+        Inputs: game (int): game slot
+        Outputs: list[Cell]: (row, col) of every mine, empty before the first click
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        block = self.layout.blocks(self._mines)[game]
+        width = self.layout.width
+        cells = []
+        while block:
+            low = block & -block
+            cells.append(divmod(low.bit_length() - 1, width))
+            block ^= low
+        return cells
+
+    def _place(self, row: int, col: int) -> int:
+        """
+        Description: draws one game's mines with draw_mines, the rule Board.place_mines uses, so the
+        first click and its neighbors stay clear
+        Inputs: row (int), col (int): first click
+        Outputs: int: board-local mine mask
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        layout = self.layout
+        block = 0
+        for r, c in draw_mines(self._rng.randint, layout.rows, layout.cols, self.mines, (row, col)):
+            block |= 1 << (r * layout.width + c)
+        return block
+
+    def _recount(self) -> None:
+        """
+        Description: recomputes the count planes and blank mask of the whole stack after mines change
+        Inputs: None
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        layout = self.layout
+        self._planes = count_planes(self._mines, layout.cells, layout.width)
+        nonzero = 0
+        for plane in self._planes:
+            nonzero |= plane
+        self._zero = layout.cells & ~self._mines & ~nonzero
+
+    def step(self, actions: Sequence[tuple[str, int, int]]) -> StepResult:
+        """
+        Description: applies one action to every game. First reveals place that game's mines, flags
+        toggle on hidden cells, reveals of flagged or revealed cells do nothing, and all reveals
+        flood together. Lost and won games are reported and then reset.
+        Inputs: actions (Sequence[tuple[str, int, int]]): ("reveal" | "flag", row, col) per game
+        Outputs: StepResult: observation after auto-reset plus per-game done/win flags
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        layout = self.layout
+        if len(actions) != layout.games:
+            raise ValueError(f"Expected {layout.games} actions, got {len(actions)}")
+
+        # Collect this step's reveals and flags as stacked masks, placing mines on first reveals
+        size = layout.block_bytes * layout.games
+        reveals = bytearray(size)
+        flags = bytearray(size)
+        placed: dict[int, int] = {}
+        for game, (kind, row, col) in enumerate(actions):
+            if not (0 <= row < layout.rows and 0 <= col < layout.cols):
+                raise ValueError(f"Position out of bounds in game {game}: ({row}, {col})")
+            index = layout.index(game, row, col)
+            if kind == "reveal":
+                if not self._placed[game]:
+                    placed[game] = self._place(row, col)
+                    self._placed[game] = True
+                reveals[index >> 3] |= 1 << (index & 7)
+            elif kind == "flag":
+                flags[index >> 3] |= 1 << (index & 7)
+            else:
+                raise ValueError(f"Invalid action in game {game}: {kind}")
+        if placed:
+            self._mines = layout.with_blocks(self._mines, placed)
+            self._recount()
+
+        # Flags only toggle on hidden cells; reveals skip flagged and revealed cells
+        self._flags ^= int.from_bytes(flags, "little") & ~self._revealed
+        seeds = int.from_bytes(reveals, "little") & ~self._flags & ~self._revealed
+        hits = seeds & self._mines
+        allowed = layout.cells & ~self._mines & ~self._flags & ~self._revealed
+        self._revealed |= hits | flood(seeds & ~self._mines, self._zero, allowed, layout.cells, layout.width)
+
+        lost = layout.any(hits)
+        unsolved = layout.any(layout.cells & ~self._mines & ~self._revealed)
+        win = [self._placed[g] and not lost[g] and not unsolved[g] for g in range(layout.games)]
+        done = [lost[g] or win[g] for g in range(layout.games)]
+
+        # Auto-reset finished games
+        finished = {g: 0 for g in range(layout.games) if done[g]}
+        if finished:
+            self._mines = layout.with_blocks(self._mines, finished)
+            self._revealed = layout.with_blocks(self._revealed, finished)
+            self._flags = layout.with_blocks(self._flags, finished)
+            for game in finished:
+                self._placed[game] = False
+            self._recount()
+            self.episodes += len(finished)
+            self.wins += sum(win)
+        return StepResult(observation=self.observe(), done=done, win=win)
@@ -0,0 +1,186 @@
+"""
+Name: zobrist.py
+Description: Zobrist hashing of the visible board state and a process-wide transposition table
+that caches AI decisions and solver results by that hash.
+Inputs: None
+Outputs: None
+External Sources: Zobrist hashing (A. Zobrist, 1970)
+Author(s): Riley Meyerkorth
+Creation Date: 19 October 2026
+"""
+
+import random
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Hashable
+
+from .constants import TRANSPOSITION_TABLE_SIZE
+
+# Visible states a cell can add to the hash: revealed numbers 0-8, a revealed mine, and a flag.
+# Hidden, unflagged cells contribute nothing.
+ZOBRIST_MINE = 9
+ZOBRIST_FLAG = 10
+ZOBRIST_STATES = 11
+
+
+class ZobristKeys:
+    """
+    Description: Random 64-bit keys for every (cell, visible state) pair of a rows x cols board.
+    Keys are seeded from the board size so hashes agree across processes.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    __slots__ = ("rows", "cols", "keys", "__weakref__")
+
+    def __init__(self, rows: int, cols: int):
+        """
+        Description: draws the keys for every cell
+        Inputs: rows (int), cols (int): board dimensions
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        rng = random.Random(f"zobrist:{rows}x{cols}")
+        self.rows: int = rows
+        self.cols: int = cols
+        # keys[flat cell index][state]
+        self.keys: tuple[tuple[int, ...], ...] = tuple(
+            tuple(rng.getrandbits(64) for _ in range(ZOBRIST_STATES))
+            for _ in range(rows * cols)
+        )
+
+    def value_key(self, row: int, col: int, value: int) -> int:
+        """
+        Description: key for a revealed cell showing `value` (a count, or CELL_MINE)
+        Inputs: row (int), col (int), value (int): revealed cell and its value
+        Outputs: int: 64-bit key
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return self.keys[row * self.cols + col][value if value >= 0 else ZOBRIST_MINE]
+
+    def flag_key(self, row: int, col: int) -> int:
+        """
+        Description: key for a flagged cell
+        Inputs: row (int), col (int): flagged cell
+        Outputs: int: 64-bit key
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return self.keys[row * self.cols + col][ZOBRIST_FLAG]
+
+
+_keys: "weakref.WeakValueDictionary[tuple[int, int], ZobristKeys]" = weakref.WeakValueDictionary()
+_keys_lock = threading.Lock()
+
+
+def get_zobrist_keys(rows: int, cols: int) -> ZobristKeys:
+    """
+    Description: returns the shared keys for a board size, building them on first use
+    Inputs: rows (int), cols (int): board dimensions
+    Outputs: ZobristKeys: shared read-only keys
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+    with _keys_lock:
+        keys = _keys.get((rows, cols))
+        if keys is None:
+            keys = ZobristKeys(rows, cols)
+            _keys[(rows, cols)] = keys
+        return keys
+
+
+# Returned by TranspositionTable.get when nothing is stored, since None is a valid cached result
+MISSING = object()
+
+
+class TranspositionTable:
+    """
+    Description: Bounded, thread-safe LRU cache of results keyed by visible-state hashes.
+    Author(s): Riley Meyerkorth
+    Creation Date: 19 October 2026
+    External Sources: N/A
+    """
+
+    def __init__(self, capacity: int = TRANSPOSITION_TABLE_SIZE):
+        """
+        Description: creates an empty table
+        Inputs: capacity (int): maximum number of entries
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        self.capacity: int = capacity
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Description: looks up a cached result and marks it as recently used
+        Inputs: key (Hashable): lookup key
+        Outputs: the cached value, or MISSING
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        with self._lock:
+            value = self._entries.get(key, MISSING)
+            if value is MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Description: stores a result, evicting the least recently used entry when full
+        Inputs: key (Hashable): lookup key, value (Any): result to cache (treated as read-only)
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Description: drops every entry and resets the hit counters
+        Inputs: None
+        Outputs: None
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        """
+        Description: number of cached entries
+        Inputs: None
+        Outputs: int: entry count
+        Author(s): Riley Meyerkorth
+        Creation Date: 19 October 2026
+        External Sources: N/A
+        """
+        return len(self._entries)
+
+
+# Shared by every board in this process
+TRANSPOSITION_TABLE = TranspositionTable()
@@ -1,7 +1,40 @@
 # test_minesweeper.py
+import asyncio
+import json
+import os
+import pickle
+import random
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi.testclient import TestClient
+
 from backend.board import Board, BoardPos
+from backend.bitboard import BitBoard
+from backend.engine import create_engine
+from backend.fuzz import fuzz_engines
+from backend.vector_env import OBS_HIDDEN, VectorEnv
+from backend.infinite import InfiniteBoard
+from backend.server import Server
+from backend.store import GameSession, MemoryStore, SQLiteStore, StaleGameError
+from backend.spectate import Broadcaster, Subscriber
+from backend.admission import Admission, AdmissionError, TokenBucket
+from backend.controller import Controller, parse_cell, parse_script
+from backend.coop_sim import OUTCOMES, STRATEGIES, play_match, register_strategy, run_tournament
+from backend.corpus import COLUMNS, Corpus, bbbv, deal, write_corpus
+from backend.stats import GameRecord, StatsStore, config_key
+from backend.render import TerminalRenderer, parse_row_label, row_label
+from backend.replay import ACTION_FLAG, ACTION_REVEAL, MoveLog, Replay, ReplayWriter, read_replays, read_varint, write_varint
+from backend.constants import CELL_MINE, CELL_UNCOUNTED, CHUNK_SIZE, DIRECTIONS
 from backend.constants import DEFAULT_ROWS, DEFAULT_COLS
-from backend.models import BoardSize, BoardStateModel
+from backend.models import BoardEngineType, BoardSize, BoardStateModel, GameMode, PlayerType
+from backend.neighbors import get_neighbor_table
+from backend.patterns import PatternTable, get_pattern_table, write_pattern_db
+from backend.solver import analyze, estimate
+from backend.zobrist import TRANSPOSITION_TABLE
+from backend.generator import Layout, NoGuessPool, generate_layout, is_no_guess, symmetries
 
 class TestBoardCreation:
     # test that board.__init__ creates a board with the correct properties
@@ -28,6 +61,25 @@ class TestBoardCreation:
             for cell in row:
                 assert cell == False
 
+    def test_board_custom_size(self):
+        # test that a board can be created with a non-default size
+        board = Board(10, size=BoardSize(12, 15))
+        assert len(board.board) == 12
+        assert len(board.board[0]) == 15
+
+class TestNeighborTable:
+    def test_edge_cells_have_fewer_neighbors(self):
+        # test that corners, edges and interior cells get 3, 5 and 8 neighbors
+        table = get_neighbor_table(10, 12)
+        assert len(table.of(0, 0)) == 3
+        assert len(table.of(0, 5)) == 5
+        assert len(table.of(4, 4)) == 8
+        assert (1, 1) in table.of(0, 0)
+
+    def test_table_is_shared_between_boards(self):
+        # test that boards of the same size share one table
+        assert Board(10)._neighbors is Board(12)._neighbors
+
 class TestBoardPos:
     def test_board_pos_creation(self):
         # test that boardpos stores x and y coordinates
@@ -80,6 +132,19 @@ class TestUpdateMineCounts:
         assert board.board[0][2] == 2  # has 2 mines below it
         assert board.board[1][2] == 2  # has 2 mines adjacent
 
+class TestLazyCounts:
+    def test_counts_only_revealed_area(self):
+        # test that a lazy board counts cells as they are revealed and memoizes them
+        board = Board(2, lazy_counts=True)
+        board.set_mines([(0, 0), (9, 9)])
+        assert board.board[5][5] == CELL_UNCOUNTED
+
+        board.reveal_cell(BoardPos(x=0, y=1))
+        assert board.board[0][1] == 1
+        assert board.board[5][5] == CELL_UNCOUNTED
+        assert board.count(8, 8) == 1
+        assert board.board[8][8] == 1
+
 class TestRevealCell:
     def test_reveal_non_mine_returns_true(self):
         # test that revealing a non-mine cell returns true
@@ -113,6 +178,1010 @@ class TestRevealCell:
         result = board.reveal_cell(pos)
         assert result == True
 
+    def test_reveal_blank_expands_without_crossing_flags(self):
+        # test that flood fill stops at flagged cells and never reveals mines
+        board = Board(1)
+        board.board[0][0] = -1
+        board.update_mine_counts()
+        board.flag_cell(BoardPos(x=5, y=5))
+
+        assert board.reveal_cell(BoardPos(x=9, y=9)) == True
+        assert board.revealed[0][0] == False
+        assert board.revealed[5][5] == False
+        assert board.revealed[0][1] == True  # numbered border is revealed
+
+    def test_openings_are_labeled_at_placement(self):
+        # test that blank regions and their borders are precomputed and revealed in one step
+        board = Board(1)
+        board.board[0][0] = -1
+        board.update_mine_counts()
+        assert board.opening_sizes() == [99]
+
+        assert board.reveal_cell(BoardPos(x=9, y=9)) == True
+        assert board.hidden_count == 1
+        assert board.revealed[0][0] == False
+
+class TestAIMoves:
+    def test_ai_moves_return_board_pos(self):
+        # test that AI helpers hand BoardPos objects back to the API layer
+        board = Board(1)
+        board.board[0][0] = -1
+        board.update_mine_counts()
+        board.reveal_cell(BoardPos(x=9, y=9))
+
+        action, pos = board.ai_move_medium()
+        assert action == "flag"
+        assert isinstance(pos, BoardPos)
+        assert (pos.x, pos.y) == (0, 0)
+
+        action, pos = board.ai_move_hard()
+        assert isinstance(pos, BoardPos)
+
+    def test_hard_ai_solves_one_two_one(self):
+        # test that the pattern database deduces the safe cells of a 1-2-1 along a wall
+        board = Board(2)
+        board.board[0][2] = -1
+        board.board[0][4] = -1
+        board.update_mine_counts()
+        for row in range(1, DEFAULT_ROWS):
+            for col in range(DEFAULT_COLS):
+                board.revealed[row][col] = True
+        board.rehash()
+
+        action, pos = board.ai_move_hard()
+        assert action == "reveal"
+        assert board.board[pos.x][pos.y] != -1
+
+    def test_pattern_table_without_a_writable_file(self, tmp_path):
+        # test that the pattern table falls back to memory when its file cannot be written
+        blocker = tmp_path / "blocker"
+        blocker.write_text("")
+        table = PatternTable(str(blocker / "patterns.bin"))
+        for mask in (0b1, 0b110, 0b1111111111):
+            assert table.lookup(1, 1, mask) == get_pattern_table().lookup(1, 1, mask)
+
+        # a failed write leaves no temporary file behind
+        target = tmp_path / "taken"
+        target.mkdir()
+        with pytest.raises(OSError):
+            write_pattern_db(str(target))
+        assert {p.name for p in tmp_path.iterdir()} == {"blocker", "taken"}
+
+    def test_hard_ai_respects_deadline(self):
+        # test that an already expired deadline still yields a legal move quickly
+        random.seed(2)
+        board = Board(20, size=BoardSize(20, 20))
+        board.place_mines(BoardPos(x=10, y=10))
+        board.update_mine_counts()
+        board.reveal_cell(BoardPos(x=10, y=10))
+
+        start = time.monotonic()
+        action, pos = board.ai_move("hard", deadline=start)
+        assert time.monotonic() - start < 1.0
+        assert action in ("reveal", "flag")
+        assert not board.revealed[pos.x][pos.y]
+
+    def test_hidden_index_tracks_reveals_and_flags(self):
+        # test that the hidden-cell count follows reveals, flags and unflags
+        board = Board(0)
+        total = DEFAULT_ROWS * DEFAULT_COLS
+        assert board.hidden_count == total
+
+        board.flag_cell(BoardPos(x=0, y=0))
+        assert board.hidden_count == total - 1
+        board.flag_cell(BoardPos(x=0, y=0))
+        assert board.hidden_count == total
+
+        board.board[5][5] = 1  # stop the flood fill at a single cell
+        board.reveal_cell(BoardPos(x=5, y=5))
+        assert board.hidden_count == total - 1
+        for _ in range(50):
+            action, pos = board.ai_move_easy()
+            assert (pos.x, pos.y) != (5, 5)
+
+class TestSolver:
+    def test_analyze_finds_forced_cells(self):
+        # test that a lone 1 with one hidden neighbor marks it as a mine and the rest as safe
+        board = Board(1)
+        board.board[0][0] = -1
+        board.update_mine_counts()
+        board.reveal_cell(BoardPos(x=9, y=9))
+
+        analysis = analyze(board)
+        assert analysis.exact
+        assert analysis.mines == {(0, 0)}
+        assert analysis.safe == set()
+
+    def test_hint_is_memoized_per_version(self):
+        # test that hints are reused until the board changes
+        board = Board(1)
+        board.board[0][0] = -1
+        board.update_mine_counts()
+        board.reveal_cell(BoardPos(x=9, y=9))
+
+        hint = board.hint()
+        assert board.hint() is hint
+        assert hint.probabilities[0][0] == 1.0
+        assert hint.probabilities[9][9] is None
+
+        board.flag_cell(BoardPos(x=0, y=0))
+        assert board.hint() is not hint
+
+class TestZobrist:
+    def test_incremental_hash_matches_rehash(self):
+        # test that the hash kept by reveal_cell/flag_cell equals a full recomputation
+        board = Board(10)
+        board.place_mines(BoardPos(x=5, y=5))
+        board.update_mine_counts()
+        board.reveal_cell(BoardPos(x=5, y=5))
+        board.flag_cell(BoardPos(x=0, y=0))
+        incremental = board.zobrist
+        assert incremental != 0
+
+        board.rehash()
+        assert board.zobrist == incremental
+
+    def test_same_visible_position_shares_cached_moves(self):
+        # test that two boards showing the same position reuse the cached AI decision
+        boards = []
+        for _ in range(2):
+            board = Board(1)
+            board.board[0][0] = -1
+            board.update_mine_counts()
+            board.reveal_cell(BoardPos(x=9, y=9))
+            boards.append(board)
+        assert boards[0].zobrist == boards[1].zobrist
+
+        TRANSPOSITION_TABLE.clear()
+        first = boards[0].ai_move_medium()
+        second = boards[1].ai_move_medium()
+        assert first == second
+        assert TRANSPOSITION_TABLE.hits >= 1
+
+    def test_estimate_agrees_with_exact_probabilities(self):
+        # test that the Monte Carlo estimate lands near the exact probabilities
+        random.seed(4)
+        board = Board(15)
+        board.place_mines(BoardPos(x=5, y=5))
+        board.update_mine_counts()
+        board.reveal_cell(BoardPos(x=5, y=5))
+
+        exact = analyze(board)
+        sampled = estimate(board, rng=random.Random(4))
+        assert not sampled.exact
+        for cell, probability in exact.probabilities.items():
+            assert abs(sampled.probabilities[cell] - probability) < 0.15
+            assert sampled.uncertainty[cell] >= 0
+
+class TestNoGuessGeneration:
+    def test_generated_layout_is_solvable_from_its_starts(self):
+        # test that every advertised start cell solves the board without guessing
+        layout = generate_layout(10, 10, 15, seed=7)
+        assert layout is not None
+        assert len(layout.mines) == 15
+        start = sorted(layout.starts)[0]
+        board = Board(15)
+        board.set_mines(layout.mines)
+        assert is_no_guess(board, start)
+        assert board.check_win()
+
+    def test_symmetries_preserve_layout(self):
+        # test that reflected layouts keep their mine count and stay on the board
+        layout = generate_layout(10, 12, 12, seed=3)
+        for transform in symmetries(10, 12):
+            moved = layout.transformed(transform)
+            assert len(moved.mines) == 12
+            assert all(0 <= r < 10 and 0 <= c < 12 for r, c in moved.mines)
+
+    def test_stock_turns_over_on_a_miss(self):
+        # test that a click no stocked layout fits evicts the oldest layout and schedules a replacement
+        pool = NoGuessPool(capacity=2)
+        pool._executor = ThreadPoolExecutor(max_workers=1)
+        # Layouts that only start from a corner never fit a click in the middle
+        oldest = Layout(6, 6, frozenset({(0, 1)}), frozenset({(5, 5)}))
+        newest = Layout(6, 6, frozenset({(1, 0)}), frozenset({(5, 5)}))
+        pool._inventory[(6, 6, 1)] = deque([oldest, newest], maxlen=2)
+        try:
+            assert pool.take(6, 6, 1, (2, 2)) is None
+            assert list(pool._inventory[(6, 6, 1)])[0] is newest
+            deadline = time.monotonic() + 10
+            while pool.stocked(6, 6, 1) < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert pool.stocked(6, 6, 1) == 2
+            assert oldest not in pool._inventory[(6, 6, 1)]
+        finally:
+            pool.shutdown()
+
+class TestBitBoard:
+    def test_counts_match_list_board(self):
+        # test that the bit-sliced counts equal the list board's counts
+        mines = [(0, 0), (0, 1), (4, 9), (9, 9), (5, 5), (6, 5), (5, 6), (6, 6)]
+        board = Board(len(mines))
+        board.set_mines(mines)
+        bits = BitBoard(len(mines))
+        bits.set_mines(mines)
+        assert bits.values() == board.board
+
+    def test_reveal_and_flags_match_list_board(self):
+        # test that flood fill, flags and the win check behave like the list board
+        board = Board(1)
+        board.set_mines([(0, 0)])
+        bits = BitBoard(1)
+        bits.set_mines([(0, 0)])
+        for engine in (board, bits):
+            engine.flag_cell(BoardPos(x=5, y=5))
+            assert engine.reveal_cell(BoardPos(x=9, y=9)) == True
+        assert bits.to_dict() == board.to_dict()
+        assert bits.zobrist == board.zobrist
+        assert not bits.check_win()
+
+        bits.flag_cell(BoardPos(x=5, y=5))
+        bits.reveal_cell(BoardPos(x=5, y=5))
+        assert bits.check_win()
+
+class TestEngines:
+    def test_create_engine_uses_registry(self):
+        # test that engines are picked by type
+        assert isinstance(create_engine(BoardEngineType.LIST, 10), Board)
+        assert isinstance(create_engine(BoardEngineType.BITBOARD, 10), BitBoard)
+
+    def test_flag_switches_coop_turn(self):
+        # test that a co-op flag hands the turn to the other player
+        for kind in BoardEngineType:
+            board = create_engine(kind, 10, GameMode.COOP)
+            board.handle_player_flag(BoardPos(x=1, y=1), PlayerType.HUMAN)
+            assert board.current_player == PlayerType.AI
+            assert board.flag_count == 1
+
+    def test_lazy_counts_match_reference_under_fuzzing(self):
+        # test that counting cells on first use gives the same games as eager counting
+        assert fuzz_engines(BoardEngineType.LIST, seed=2, games=8, steps=40, lazy_counts=True) == 8 * 42
+
+    def test_bitboard_matches_reference_under_fuzzing(self):
+        # test that random move sequences leave both engines in the same observable state
+        assert fuzz_engines(BoardEngineType.BITBOARD, seed=1, games=8, steps=40) == 8 * 42
+
+class TestVectorEnv:
+    def test_first_reveal_is_safe_in_every_game(self):
+        # test that each game's first click opens a blank area instead of hitting a mine
+        env = VectorEnv(16, 10, 10, 20, seed=5)
+        result = env.step([("reveal", 4, 4)] * 16)
+        grids = result.observation.grids()
+        for game in range(16):
+            if not result.done[game]:
+                assert grids[game][4][4] == 0
+                assert len(env.mine_cells(game)) == 20
+        assert not any(d and not w for d, w in zip(result.done, result.win))
+
+    def test_matches_board_and_resets_finished_games(self):
+        # test that a step reveals like Board and that a lost game starts over
+        env = VectorEnv(2, 10, 10, 10, seed=2)
+        env.step([("reveal", 0, 0), ("flag", 9, 9)])
+        board = Board(10)
+        board.set_mines(env.mine_cells(0))
+        board.reveal_cell(BoardPos(x=0, y=0))
+        grid = env.observe().grids()[0]
+        assert all((grid[r][c] != OBS_HIDDEN) == board.revealed[r][c] for r in range(10) for c in range(10))
+
+        mine = env.mine_cells(0)[0]
+        result = env.step([("reveal", *mine), ("flag", 9, 9)])
+        assert result.done == [True, False]
+        assert result.win == [False, False]
+        assert env.mine_cells(0) == []
+        assert result.observation.grids()[0][0][0] == OBS_HIDDEN
+
+    def test_placement_matches_board(self):
+        # test that a seeded environment deals the layout a Board with the same seed deals, edges included
+        for first in [(0, 0), (4, 7), (8, 3)]:
+            env = VectorEnv(1, 9, 8, 12, seed=11)
+            env.step([("reveal", *first)])
+            board = Board(12, size=BoardSize(9, 8), seed=11)
+            board.place_mines(BoardPos(x=first[0], y=first[1]))
+            mines = [(r, c) for r in range(9) for c in range(8) if board.board[r][c] == CELL_MINE]
+            assert sorted(env.mine_cells(0)) == mines
+
+class TestInfiniteBoard:
+    def test_same_seed_gives_same_board(self):
+        # test that chunks are derived from the seed, including far and negative coordinates
+        first, second = InfiniteBoard(seed=11), InfiniteBoard(seed=11)
+        for row, col in [(0, 0), (-50, 3), (1000, -1000)]:
+            assert first.value(row, col) == second.value(row, col)
+
+    def test_reveal_is_safe_and_counts_are_correct(self):
+        # test that the first click is safe and revealed counts match the mines around them
+        board = InfiniteBoard(seed=3)
+        assert board.reveal_cell(BoardPos(x=-20, y=7)) == True
+        assert board.visible(-20, 7) == 0
+        for row in range(-40, 0):
+            for col in range(-13, 27):
+                shown = board.visible(row, col)
+                if shown is not None:
+                    mines = sum(board.value(row + dr, col + dc) == -1 for dr, dc in DIRECTIONS)
+                    assert shown == mines
+
+    def test_only_clean_chunks_are_evicted(self):
+        # test that memory follows the explored area and played chunks survive eviction
+        board = InfiniteBoard(seed=5, cache_size=4)
+        board.flag_cell(BoardPos(x=0, y=0))
+        for k in range(1, 50):
+            board.value(k * 100, k * 100)
+        assert board.loaded_chunks == 4
+        assert board.is_flagged(0, 0)
+
+    def test_flood_limit_keeps_the_frontier(self, monkeypatch):
+        # test that a reveal cut off by the flood limit resumes until no blank cell has hidden neighbors
+        monkeypatch.setattr("backend.infinite.INFINITE_FLOOD_LIMIT", 40)
+        board = InfiniteBoard(seed=1, density=0.12)
+        assert board.reveal_cell(BoardPos(x=0, y=0))
+        assert board.revealed_count == 40
+        assert board.expanding
+        rounds = 0
+        while board.expanding and rounds < 1000:
+            assert board.expand() <= 40
+            rounds += 1
+        assert not board.expanding
+        assert board.revealed_count > 40
+        span = range(-3 * CHUNK_SIZE, 3 * CHUNK_SIZE)
+        for row in span:
+            for col in span:
+                if board.visible(row, col) == 0:
+                    assert all(board.visible(row + dr, col + dc) is not None for dr, dc in DIRECTIONS)
+
+class TestGameStore:
+    def test_memory_store_rejects_stale_saves(self):
+        # test that a session saved over a newer stored version is refused
+        store = MemoryStore()
+        store.save(GameSession(game_id="g"))
+        store.save(store.load("g"))
+        assert store.load("g").version == 2
+        with pytest.raises(StaleGameError):
+            store.save(GameSession(game_id="g", version=1))
+
+    def test_sqlite_store_rejects_stale_saves(self, tmp_path):
+        # test that the shared database store detects conflicting saves between workers
+        store = SQLiteStore(str(tmp_path / "games.sqlite3"))
+        store.save(GameSession(game_id="g", board=Board(5, GameMode.SOLO, BoardSize(6, 6))))
+        first, second = store.load("g"), store.load("g")
+        first.alive = False
+        store.save(first)
+        assert store.load("g").alive == False
+        with pytest.raises(StaleGameError):
+            store.save(second)
+        store.delete("g")
+        assert store.load("g") is None
+        store.close()
+
+    def test_idle_games_hibernate_and_wake(self, tmp_path):
+        # test that idle games move to disk and come back unchanged on their next load
+        store = MemoryStore(str(tmp_path), idle_seconds=0)
+        board = Board(10, GameMode.SOLO, BoardSize(9, 9))
+        board.set_mines([(r, r) for r in range(9)] + [(0, 8)])
+        board.reveal_cell(BoardPos(x=8, y=0))
+        store.save(GameSession(game_id="a", board=board, initialized=True))
+        store.save(GameSession(game_id="b"))
+        stats = store.stats()
+        assert (stats.resident, stats.hibernated) == (0, 2)
+        assert stats.resident_bytes == 0 and stats.hibernated_bytes > 0
+        session = store.load("a")
+        assert session.initialized and session.version == 1
+        assert session.board.to_dict() == board.to_dict()
+        assert store.stats().resident == 1
+        store.delete("b")
+        assert store.load("b") is None
+        assert store.stats().hibernated == 0
+
+    def test_memory_budget_keeps_recent_games(self, tmp_path):
+        # test that the least recently used games are hibernated once the budget is exceeded
+        store = MemoryStore(str(tmp_path), budget_bytes=1)
+        with store.lock("busy"):
+            store.save(GameSession(game_id="busy", board=Board(5, GameMode.SOLO, BoardSize(8, 8))))
+            store.save(GameSession(game_id="idle", board=Board(5, GameMode.SOLO, BoardSize(8, 8))))
+            stats = store.stats()
+        assert (stats.resident, stats.hibernated) == (1, 1)
+        assert store.load("idle").board is not None
+
+    def test_abandoned_games_expire(self, tmp_path):
+        # test that games idle past the TTL are deleted from memory, from disk and from the database
+        store = MemoryStore(str(tmp_path / "hibernated"), expire_seconds=60)
+        for game_id in ("resident", "hibernated", "leftover", "fresh"):
+            store.save(GameSession(game_id=game_id, board=Board(5, GameMode.SOLO, BoardSize(8, 8))))
+        store._hibernate("hibernated")
+        store._hibernate("leftover")
+        # a file written by an earlier process, which this store never hibernated itself
+        del store._hibernated["leftover"]
+        store._touched["resident"] -= 120
+        old = time.time() - 120
+        os.utime(tmp_path / "hibernated" / "hibernated.game", (old, old))
+        os.utime(tmp_path / "hibernated" / "leftover.game", (old, old))
+        assert store.expire() == 3
+        assert [store.load(game_id) is None for game_id in ("resident", "hibernated", "leftover", "fresh")] == [True, True, True, False]
+        assert os.listdir(tmp_path / "hibernated") == []
+        assert store.stats().expired == 3
+
+        database = SQLiteStore(str(tmp_path / "games.sqlite3"), expire_seconds=60)
+        database.save(GameSession(game_id="old"))
+        database.save(GameSession(game_id="new"))
+        with database._connection() as db:
+            db.execute("UPDATE games SET updated = updated - 120 WHERE id = 'old'")
+        assert database.expire() == 1
+        assert database.load("old") is None and database.load("new") is not None
+        assert database.stats().expired == 1
+        database.close()
+
+    def test_board_survives_pickling(self):
+        # test that a stored board plays on exactly like the original
+        board = Board(10, GameMode.SOLO, BoardSize(9, 9))
+        board.set_mines([(r, r) for r in range(9)] + [(0, 8)])
+        board.reveal_cell(BoardPos(x=8, y=0))
+        copy = pickle.loads(pickle.dumps(board))
+        assert copy.to_dict() == board.to_dict()
+        assert copy.zobrist == board.zobrist
+        assert copy.reveal_cell(BoardPos(x=0, y=4)) == board.reveal_cell(BoardPos(x=0, y=4))
+        assert copy.to_dict() == board.to_dict()
+
+class TestSpectators:
+    def test_each_version_is_serialized_once_for_all_subscribers(self):
+        # test that every spectator receives the very same bytes and repeated versions are skipped
+        async def watch():
+            loop = asyncio.get_running_loop()
+            broadcaster, renders = Broadcaster(), []
+            board = Board(10, GameMode.SOLO, BoardSize(10, 10))
+            subscribers = [Subscriber(loop) for _ in range(3)]
+            for subscriber in subscribers:
+                broadcaster.subscribe("g", subscriber)
+            def render():
+                renders.append(1)
+                return board.to_dict()
+            broadcaster.publish("g", 1, render)
+            broadcaster.publish("g", 1, render)
+            frames = [await subscriber.next(1) for subscriber in subscribers]
+            assert len(renders) == 1
+            assert all(frame is frames[0] for frame in frames)
+            assert frames[0].startswith(b"id: 1\nevent: state\ndata: ")
+            assert await subscribers[0].next(0.01) is None
+        asyncio.run(watch())
+
+    def test_slow_subscriber_skips_to_latest(self):
+        # test that a spectator that falls behind keeps only the newest frames
+        async def watch():
+            broadcaster, board = Broadcaster(), Board(10, GameMode.SOLO, BoardSize(10, 10))
+            subscriber = Subscriber(asyncio.get_running_loop(), size=2)
+            broadcaster.subscribe("g", subscriber)
+            for version in range(1, 6):
+                broadcaster.publish("g", version, board.to_dict)
+            assert subscriber.dropped == 3
+            assert (await subscriber.next(1)).startswith(b"id: 4")
+            assert (await subscriber.next(1)).startswith(b"id: 5")
+            broadcaster.unsubscribe("g", subscriber)
+            assert broadcaster.watchers("g") == 0
+        asyncio.run(watch())
+
+class TestAdmission:
+    def test_token_bucket_allows_burst_then_refills(self):
+        # test that a bucket admits its burst, refuses with a wait time, and refills over time
+        bucket = TokenBucket(rate=1000, burst=3)
+        assert [bucket.take() for _ in range(3)] == [0, 0, 0]
+        assert bucket.take(2) > 0
+        time.sleep(0.01)
+        assert bucket.take() == 0
+
+    def test_rate_limit_is_per_key(self):
+        # test that one caller running out of tokens does not limit another
+        admission = Admission()
+        admission.rate("a", rate=0.001, burst=1)
+        with pytest.raises(AdmissionError) as refused:
+            admission.rate("a", rate=0.001, burst=1)
+        assert refused.value.status == 429 and refused.value.retry_after >= 1
+        admission.rate("b", rate=0.001, burst=1)
+
+    def test_pending_moves_are_bounded_per_game(self):
+        # test that a game with max_pending moves in flight refuses more until one finishes
+        admission = Admission(max_pending=2)
+        with admission.pending("g"), admission.pending("g"):
+            with pytest.raises(AdmissionError):
+                with admission.pending("g"):
+                    pass
+            with admission.pending("other"):
+                pass
+        with admission.pending("g"):
+            pass
+
+    def test_busy_slots_answer_503(self):
+        # test that expensive work beyond the global slot count is refused instead of queued
+        admission = Admission(ai_slots=1, wait=0.01)
+        with admission.slot("ai"):
+            with pytest.raises(AdmissionError) as refused:
+                with admission.slot("ai"):
+                    pass
+        assert refused.value.status == 503
+        with admission.slot("ai"):
+            pass
+
+class TestReplay:
+    def _play(self):
+        board = Board(15, GameMode.SOLO, BoardSize(10, 10), seed=42)
+        log = MoveLog()
+        log.placed()
+        board.place_mines(BoardPos(x=5, y=5))
+        board.update_mine_counts()
+        for action, pos in [(ACTION_REVEAL, BoardPos(x=5, y=5)), (ACTION_FLAG, BoardPos(x=0, y=0)), (ACTION_REVEAL, BoardPos(x=9, y=9))]:
+            if action == ACTION_REVEAL:
+                board.reveal_cell(pos)
+            else:
+                board.flag_cell(pos)
+            log.add(action, PlayerType.HUMAN, pos, 10)
+        replay = Replay(rows=10, cols=10, mines=15, seed=42, placed_at=log.placed_at,
+                        move_count=log.count, move_data=bytes(log.data))
+        return board, replay
+
+    def test_varints_round_trip(self):
+        # test that varints of every size decode to the value that was written
+        out = bytearray()
+        values = [0, 1, 127, 128, 300, 2**63 - 1]
+        for value in values:
+            write_varint(out, value)
+        pos, decoded = 0, []
+        for _ in values:
+            value, pos = read_varint(out, pos)
+            decoded.append(value)
+        assert decoded == values and pos == len(out)
+
+    def test_seeded_boards_deal_the_same_mines(self):
+        # test that a seed fixes the layout for a given first click, on both engines
+        first = BoardPos(x=3, y=3)
+        boards = [create_engine(kind, 20, GameMode.SOLO, BoardSize(12, 12), seed=7)
+                  for kind in (BoardEngineType.LIST, BoardEngineType.BITBOARD, BoardEngineType.LIST)]
+        for board in boards:
+            board.place_mines(first)
+            board.update_mine_counts()
+        solutions = [board.to_dict(reveal_all=True).board for board in boards]
+        assert solutions[0] == solutions[1] == solutions[2]
+
+    def test_replay_rebuilds_the_board(self):
+        # test that decoding a replay and replaying it reproduces the played board
+        board, replay = self._play()
+        decoded = Replay.decode(replay.encode())
+        assert [move.action for move in decoded.moves()] == [ACTION_REVEAL, ACTION_FLAG, ACTION_REVEAL]
+        assert decoded.board().to_dict(reveal_all=True) == board.to_dict(reveal_all=True)
+        assert decoded.board(upto=0).to_dict().revealed == [[False] * 10 for _ in range(10)]
+
+    def test_layout_replaces_the_seed(self):
+        # test that games dealt from an explicit layout replay from the stored layout
+        replay = Replay(rows=10, cols=10, mines=2, layout=[(0, 1), (9, 9)], placed_at=0)
+        log = MoveLog()
+        log.add(ACTION_REVEAL, PlayerType.HUMAN, BoardPos(x=5, y=5), 10)
+        replay.move_count, replay.move_data = log.count, bytes(log.data)
+        board = Replay.decode(replay.encode()).board()
+        assert board.board[0][1] == -1 and board.board[9][9] == -1
+
+    def test_files_roll_and_stream_back(self, tmp_path):
+        # test that the writer rolls files and the reader streams every record, ignoring a torn tail
+        _, replay = self._play()
+        writer = ReplayWriter(str(tmp_path), max_bytes=64)
+        for _ in range(10):
+            writer.write(replay)
+        writer.close()
+        files = sorted(tmp_path.iterdir())
+        assert len(files) > 1
+        with open(files[-1], "ab") as f:
+            f.write(bytes([50, 1, 2]))
+        assert sum(1 for _ in read_replays(str(tmp_path))) == 10
+
+class TestCorpus:
+    def test_corpus_matches_dealt_boards(self, tmp_path):
+        # test that every corpus entry holds the cells and metadata of the board dealt for its index
+        path = str(tmp_path / "corpus.bin")
+        write_corpus(path, 10, 12, 15, 20, seed=7, workers=1)
+        with Corpus(path) as corpus:
+            assert len(corpus) == 20 and (corpus.rows, corpus.cols, corpus.mines) == (10, 12, 15)
+            for index in range(len(corpus)):
+                board, first = deal(10, 12, 15, 7, index)
+                assert corpus.cells_of(index).tolist() == [value for row in board.board for value in row]
+                assert (corpus.column("first_row")[index], corpus.column("first_col")[index]) == first
+                assert corpus.column("openings")[index] == len(board.openings)
+                assert corpus.column("bbbv")[index] == bbbv(board)
+                assert corpus.column("solvable")[index] == is_no_guess(board, first)
+            assert corpus.board(3).board == deal(10, 12, 15, 7, 3)[0].board
+
+    def test_parallel_workers_write_the_same_file(self, tmp_path):
+        # test that splitting the corpus across worker processes changes nothing in the file
+        serial, parallel = str(tmp_path / "serial.bin"), str(tmp_path / "parallel.bin")
+        write_corpus(serial, 10, 10, 10, 1500, seed=3, workers=1, solvability=False)
+        write_corpus(parallel, 10, 10, 10, 1500, seed=3, workers=2, solvability=False)
+        with open(serial, "rb") as a, open(parallel, "rb") as b:
+            assert a.read() == b.read()
+
+    def test_columns_are_views_into_the_file(self, tmp_path):
+        # test that columns are typed memoryviews with one item per board, and that bad files are refused
+        path = str(tmp_path / "corpus.bin")
+        write_corpus(path, 10, 10, 10, 5, workers=1, solvability=False)
+        with Corpus(path) as corpus:
+            for name, code in COLUMNS.items():
+                column = corpus.column(name)
+                assert isinstance(column, memoryview) and column.format == code and len(column) == 5
+        with open(path, "r+b") as f:
+            f.truncate(100)
+        with pytest.raises(ValueError):
+            Corpus(path)
+
+    def test_large_boards_fit_the_columns(self, tmp_path):
+        # test that boards past 255 rows and 65535 cells are stored, and unstorable ones refused up front
+        path = str(tmp_path / "corpus.bin")
+        write_corpus(path, 300, 300, 100, 1, workers=1, solvability=False)
+        with Corpus(path) as corpus:
+            board, first = deal(300, 300, 100, 0, 0)
+            assert (corpus.column("first_row")[0], corpus.column("first_col")[0]) == first
+            assert corpus.column("largest_opening")[0] == max(board.opening_sizes())
+            assert corpus.column("bbbv")[0] == bbbv(board)
+        for rows, cols, mines in [(70000, 2, 10), (3, 3, 1), (10, 10, 0x10000)]:
+            with pytest.raises(ValueError):
+                write_corpus(str(tmp_path / "bad.bin"), rows, cols, mines, 1, workers=1)
+        assert not (tmp_path / "bad.bin").exists()
+
+
+class TestCoopSim:
+    def test_matches_are_reproducible(self):
+        # test that a match seed fixes the board and the random players' picks
+        for seed in range(5):
+            a = play_match("easy", "medium", seed=seed)
+            b = play_match("easy", "medium", seed=seed)
+            assert a[:4] == b[:4] and a.outcome in OUTCOMES
+
+    def test_losing_player_is_the_one_who_hit_the_mine(self):
+        # test that a player who always reveals a mine loses on its first reveal after the opening
+        @register_strategy("test-mine")
+        def mine_picker(board, deadline):
+            if board.hidden_count == board.size.rows * board.size.cols:
+                return ("reveal", BoardPos(x=0, y=0))
+            for r, row in enumerate(board.to_dict(reveal_all=True).board):
+                if CELL_MINE in row:
+                    return ("reveal", BoardPos(x=r, y=row.index(CELL_MINE)))
+            return ("none", None)
+        try:
+            assert play_match("test-mine", "hard", seed=1).outcome == "second"
+            assert play_match("hard", "test-mine", seed=1).outcome == "first"
+        finally:
+            del STRATEGIES["test-mine"]
+
+    def test_searching_strategies_are_reproducible(self):
+        # test that hard and safe play the same match from the same seed, whatever the caches hold
+        for first, second, shape, seed in [("hard", "safe", (10, 10, 10), 0), ("safe", "hard", (10, 10, 10), 2),
+                                           ("hard", "safe", (16, 30, 99), 1)]:
+            a = play_match(first, second, *shape, seed=seed)
+            TRANSPOSITION_TABLE.clear()
+            b = play_match(first, second, *shape, seed=seed)
+            assert a[:4] == b[:4]
+        board = Board(99, size=BoardSize(16, 30), seed=4)
+        board.place_mines(BoardPos(x=8, y=15))
+        board.update_mine_counts()
+        board.reveal_cell(BoardPos(x=8, y=15))
+        # a one-node budget forces the sampler, which is seeded by the position
+        assert analyze(board, budget=1).probabilities == analyze(board, budget=1).probabilities
+
+    def test_tournament_plays_every_ordered_pairing(self):
+        # test that each ordered pairing plays every game and the outcomes add up
+        report = run_tournament(["easy", "medium"], 6, workers=1)
+        assert set(report.pairings) == {("easy", "easy"), ("easy", "medium"), ("medium", "easy"), ("medium", "medium")}
+        for stats in report.pairings.values():
+            assert stats.games == 6 and sum(stats.outcomes.values()) == 6
+        assert report.games == 24 and "games/s" in report.format()
+        with pytest.raises(ValueError):
+            run_tournament(["nobody"], 1)
+
+
+class TestStats:
+    def _game(self, player, won, seconds, finished, mines=10):
+        return GameRecord(player=player, name=player.upper(), rows=10, cols=10, mines=mines, game_mode=GameMode.SOLO,
+                          difficulty=None, no_guess=False, won=won, seconds=seconds, moves=20, finished=finished)
+
+    def test_aggregates_track_wins_times_and_streaks(self, tmp_path):
+        # test that each game updates the player's counts, best time and streaks for its configuration
+        stats = StatsStore(str(tmp_path / "stats.sqlite3"), flush_seconds=0.01)
+        results = [(True, 50.0), (True, 40.0), (False, 5.0), (True, 60.0), (True, 70.0), (True, 80.0)]
+        for i, (won, seconds) in enumerate(results):
+            stats.record(self._game("ann", won, seconds, i))
+        stats.record(self._game("ann", True, 10.0, 9, mines=12))
+        stats.flush()
+        name, configs = stats.profile("ann")
+        assert name == "ANN" and [config.config for config in configs] == ["10x10x12-solo", "10x10x10-solo"]
+        config = configs[1]
+        assert (config.played, config.won, config.best_seconds) == (6, 5, 40.0)
+        assert (config.streak, config.best_streak) == (3, 3)
+        assert config.average_seconds == pytest.approx(305.0 / 6)
+        assert stats.profile("nobody") == (None, [])
+        stats.close()
+
+    def test_leaderboard_ranks_best_wins_from_the_index(self, tmp_path):
+        # test that the leaderboard lists each winning player once, fastest first, via the partial index
+        stats = StatsStore(str(tmp_path / "stats.sqlite3"), batch_size=2, flush_seconds=0.01)
+        for i, (player, won, seconds) in enumerate([("ann", True, 30.0), ("bob", True, 20.0), ("ann", True, 10.0),
+                                                    ("cat", False, 1.0), ("dan", True, 40.0)]):
+            stats.record(self._game(player, won, seconds, i))
+        stats.close()
+        stats = StatsStore(str(tmp_path / "stats.sqlite3"))
+        config = config_key(10, 10, 10)
+        entries = stats.leaderboard(config, 3)
+        assert [(entry.rank, entry.name, entry.best_seconds) for entry in entries] == [(1, "ANN", 10.0), (2, "BOB", 20.0), (3, "DAN", 40.0)]
+        plan = stats._connection().execute(
+            "EXPLAIN QUERY PLAN SELECT player FROM aggregates WHERE config = ? AND best_seconds IS NOT NULL "
+            "ORDER BY best_seconds LIMIT 3", (config,)).fetchall()
+        assert "aggregates_best" in str(plan)
+        stats.close()
+
+    def test_config_keys_separate_modes(self):
+        # test that co-op difficulty and no-guess boards are ranked separately
+        assert config_key(10, 10, 10) == "10x10x10-solo"
+        assert config_key(10, 10, 10, GameMode.COOP, "hard", True) == "10x10x10-coop-hard-ng"
+        assert config_key(10, 10, 10, GameMode.SOLO, "hard") == "10x10x10-solo"
+        assert config_key(10, 10, 10, assisted=True) == "10x10x10-solo-assisted"
+
+
+class TestServer:
+    @pytest.fixture
+    def server(self, tmp_path, monkeypatch):
+        # statistics go to a scratch database and replays are off
+        monkeypatch.setattr("backend.server.STATS_PATH", str(tmp_path / "stats.sqlite3"))
+        monkeypatch.setattr("backend.server.REPLAY_PATH", "")
+        return Server(MemoryStore())
+
+    def _win(self, server, client):
+        # test helper: opens the caller's game, uncovers all but one safe cell and clicks that one
+        assert client.post("/api/click", json={"x": 0, "y": 0}).json()["ok"]
+        board = server.store.load(client.cookies["game_id"]).board
+        safe = [(r, c) for r in range(board.size.rows) for c in range(board.size.cols)
+                if board.board[r][c] != CELL_MINE and not board.revealed[r][c]]
+        for r, c in safe[:-1]:
+            board.reveal_cell(BoardPos(x=r, y=c))
+        r, c = safe[-1] if safe else (0, 0)
+        return client.post("/api/click", json={"x": r, "y": c}).json()
+
+    def test_assisted_games_stay_off_the_leaderboard(self, server):
+        # test that a game cleared after asking for a hint is recorded apart from unassisted play
+        with TestClient(server.app) as client:
+            client.post("/api/new", json={"rows": 10, "cols": 10, "mines": 10, "player_name": "Ann"})
+            assert client.get("/api/hint").json()["ok"]
+            assert self._win(server, client)["win"]
+            server.stats.flush()
+            board = client.get("/api/stats/leaderboard", params={"rows": 10, "cols": 10, "mines": 10}).json()
+            assert board["ok"] and board["entries"] == []
+            profile = client.get("/api/stats/profile").json()
+            assert [config["config"] for config in profile["configs"]] == ["10x10x10-solo-assisted"]
+            assert profile["configs"][0]["won"] == 1
+
+            client.post("/api/new", json={"rows": 10, "cols": 10, "mines": 10})
+            assert client.get("/api/ai/bogus").json() == {"error": "Invalid difficulty"}
+            assert not server.store.load(client.cookies["game_id"]).assisted
+            client.get("/api/ai/easy")
+            assert server.store.load(client.cookies["game_id"]).assisted
+
+    def test_no_guess_miss_deals_a_regular_board(self, server, monkeypatch):
+        # test that a first click with no stocked layout is answered at once and stops counting as no-guess
+        monkeypatch.setattr(server.generator, "ensure", lambda rows, cols, mines: None)
+        monkeypatch.setattr(server.generator, "take", lambda rows, cols, mines, first: None)
+        with TestClient(server.app) as client:
+            client.post("/api/new", json={"rows": 10, "cols": 10, "mines": 10, "no_guess": True})
+            assert server.store.load(client.cookies["game_id"]).no_guess
+            response = self._win(server, client)
+            assert response["win"] and response["no_guess"] == False
+            server.stats.flush()
+            profile = client.get("/api/stats/profile").json()
+            assert [config["config"] for config in profile["configs"]] == ["10x10x10-solo"]
+
+    def test_cookies_keep_games_apart(self, server):
+        # test that two browsers get separate games and a move in one leaves the other alone
+        with TestClient(server.app) as first, TestClient(server.app) as second:
+            first.post("/api/new", json={"rows": 10, "cols": 10, "mines": 10})
+            second.post("/api/new", json={"rows": 12, "cols": 10, "mines": 10})
+            assert first.cookies["game_id"] != second.cookies["game_id"]
+            assert first.post("/api/click", json={"x": 0, "y": 0}).json()["ok"]
+            mine, other = first.get("/api/state").json()["state"], second.get("/api/state").json()["state"]
+            assert any(any(row) for row in mine["revealed"])
+            assert len(other["revealed"]) == 12 and not any(any(row) for row in other["revealed"])
+            assert TestClient(server.app).get("/api/state").json()["ok"] == False
+
+    def test_refused_moves_are_not_saved(self, server):
+        # test that requests which leave the game alone do not write a new version
+        with TestClient(server.app) as client:
+            client.post("/api/new", json={"rows": 10, "cols": 10, "mines": 10})
+            game_id = client.cookies["game_id"]
+            assert client.post("/api/click", json={"x": 0, "y": 0}).json()["ok"]
+            version = server.store.version_of(game_id)
+            assert client.post("/api/ai-turn").json()["error"] == "Not in co-op mode"
+            assert client.get("/api/ai/bogus").json()["error"] == "Invalid difficulty"
+            assert server.store.version_of(game_id) == version
+            assert client.post("/api/flag", json={"x": 9, "y": 9}).json()["ok"]
+            assert server.store.version_of(game_id) == version + 1
+
+    def test_repeated_hints_are_not_saved(self, tmp_path, monkeypatch):
+        # test that only the first hint writes the game and later ones reuse the cached hint
+        monkeypatch.setattr("backend.server.STATS_PATH", "")
+        monkeypatch.setattr("backend.server.REPLAY_PATH", "")
+        server = Server(SQLiteStore(str(tmp_path / "games.sqlite3")))
+        with TestClient(server.app) as client:
+            client.post("/api/new", json={"rows": 10, "cols": 10, "mines": 10})
+            game_id = client.cookies["game_id"]
+            assert client.post("/api/click", json={"x": 0, "y": 0}).json()["ok"]
+            first = client.get("/api/hint").json()
+            assert server.store.version_of(game_id) == 3
+            monkeypatch.setattr(Board, "_build_hint", lambda board: pytest.fail("hint was rebuilt"))
+            assert client.get("/api/hint").json() == first
+            assert server.store.version_of(game_id) == 3
+
+    def test_stale_save_is_retried(self, tmp_path, monkeypatch):
+        # test that a move losing a save race to another worker is applied again to the fresh copy
+        monkeypatch.setattr("backend.server.STATS_PATH", "")
+        monkeypatch.setattr("backend.server.REPLAY_PATH", "")
+        path = str(tmp_path / "games.sqlite3")
+        server, other = Server(SQLiteStore(path)), SQLiteStore(path)
+        with TestClient(server.app) as client:
+            client.post("/api/new", json={"rows": 10, "cols": 10, "mines": 10})
+            game_id = client.cookies["game_id"]
+            load, loads = server.store.load, []
+
+            def racing_load(game_id):
+                # the other worker flags a cell between this worker's first load and its save
+                session = load(game_id)
+                if not loads:
+                    rival = other.load(game_id)
+                    rival.board.flag_cell(BoardPos(x=9, y=9))
+                    other.save(rival)
+                loads.append(session.version)
+                return session
+
+            monkeypatch.setattr(server.store, "load", racing_load)
+            response = client.post("/api/click", json={"x": 0, "y": 0}).json()
+            assert response["ok"] and loads == [1, 2]
+            assert response["state"]["flags"][9][9]
+            assert other.load(game_id).version == 3
+        other.close()
+
+    def test_drained_bucket_answers_429(self, server, monkeypatch):
+        # test that moves past the game's burst are refused with Retry-After
+        monkeypatch.setattr("backend.server.MOVE_BURST", 2)
+        monkeypatch.setattr("backend.server.MOVE_RATE", 0.01)
+        with TestClient(server.app) as client:
+            client.post("/api/new", json={"rows": 10, "cols": 10, "mines": 10})
+            for _ in range(2):
+                assert client.post("/api/flag", json={"x": 0, "y": 0}).status_code == 200
+            response = client.post("/api/flag", json={"x": 0, "y": 0})
+            assert response.status_code == 429
+            assert float(response.headers["Retry-After"]) > 0
+
+    def test_busy_slot_answers_503(self, server):
+        # test that an AI move waiting too long for a slot is turned away with Retry-After
+        server.admission = Admission(ai_slots=1, wait=0.01)
+        with TestClient(server.app) as client:
+            client.post("/api/new", json={"rows": 10, "cols": 10, "mines": 10})
+            assert client.post("/api/click", json={"x": 0, "y": 0}).json()["ok"]
+            with server.admission.slot("ai"):
+                response = client.get("/api/ai/hard")
+            assert response.status_code == 503
+            assert "Retry-After" in response.headers
+            assert not server.store.load(client.cookies["game_id"]).assisted
+            assert client.get("/api/ai/hard").status_code == 200
+
+    def test_leaderboard_and_profile_after_a_win(self, server):
+        # test that a finished game shows up on its configuration's leaderboard and the player's profile
+        with TestClient(server.app) as client:
+            assert client.get("/api/stats/profile").json()["ok"] == False
+            client.post("/api/new", json={"rows": 10, "cols": 10, "mines": 10, "player_name": "Ann"})
+            assert self._win(server, client)["win"]
+            server.stats.flush()
+            board = client.get("/api/stats/leaderboard", params={"rows": 10, "cols": 10, "mines": 10}).json()
+            assert board["config"] == "10x10x10-solo"
+            assert [(entry["rank"], entry["name"], entry["won"]) for entry in board["entries"]] == [(1, "Ann", 1)]
+            profile = client.get("/api/stats/profile").json()
+            assert profile["name"] == "Ann"
+            assert [(config["config"], config["played"], config["won"]) for config in profile["configs"]] == [("10x10x10-solo", 1, 1)]
+
+    def test_spectator_gets_the_current_frame_on_connect(self, server):
+        # test that a spectator joining mid-game is sent the game's current state first
+        with TestClient(server.app) as client:
+            watch = client.post("/api/new", json={"rows": 10, "cols": 10, "mines": 10}).json()["watch_id"]
+            client.post("/api/click", json={"x": 0, "y": 0})
+            current = client.get("/api/state").json()["state"]
+            assert client.get("/api/spectate/nosuchgame").status_code == 404
+        # TestClient waits for a response to end, so drive the endless event stream over ASGI and
+        # disconnect after its first frame
+        status, frame = asyncio.run(self._first_event(server.app, f"/api/spectate/{watch}"))
+        assert status == 200
+        assert frame.startswith(b"id: 2\nevent: state\ndata: ")
+        assert json.loads(frame.split(b"data: ", 1)[1])["state"] == current
+
+    async def _first_event(self, app, path):
+        # test helper: status and first body chunk of a streaming GET, disconnecting once it arrives
+        received, messages = asyncio.Event(), []
+
+        async def receive():
+            if not messages:
+                messages.append("request")
+                return {"type": "http.request", "body": b"", "more_body": False}
+            await received.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            messages.append(message)
+            if message["type"] == "http.response.body" and message.get("body"):
+                received.set()
+
+        scope = {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+                 "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"",
+                 "root_path": "", "headers": [], "client": ("test", 1), "server": ("testserver", 80)}
+        await asyncio.wait_for(app(scope, receive, send), 10)
+        start = next(message for message in messages[1:] if message["type"] == "http.response.start")
+        body = next(message["body"] for message in messages[1:]
+                    if message["type"] == "http.response.body" and message.get("body"))
+        return start["status"], body
+
+
+class TestHeadlessController:
+    def test_parse_script(self):
+        # test that scripts split into games with their seeds, reveals, flags and quits
+        games = parse_script(["A1", "new 7  # second game", "f B2", "", "J10", "q", "new"])
+        assert [game.seed for game in games] == [None, 7, None]
+        assert games[1].moves == [("flag", BoardPos(x=1, y=1)), ("reveal", BoardPos(x=9, y=9)), ("quit", None)]
+        assert parse_cell("c12") == BoardPos(x=2, y=11)
+        with pytest.raises(ValueError, match="line 2"):
+            parse_script(["A1", "A0"])
+
+    def test_scripted_game_is_won_by_revealing_every_safe_cell(self):
+        # test that a script uncovering every safe cell of a seeded board wins, and a mine loses
+        board = Board(10, seed=3)
+        board.place_mines(BoardPos(x=0, y=0))
+        board.update_mine_counts()
+        safe = [f"{chr(ord('A') + r)}{c + 1}" for r in range(10) for c in range(10) if board.board[r][c] != CELL_MINE]
+        mine = next(f"{chr(ord('A') + r)}{c + 1}" for r in range(10) for c in range(10) if board.board[r][c] == CELL_MINE)
+        controller = Controller()
+        games = parse_script(["new 3", "A1"] + safe + ["new 3", "A1", mine])
+        won, lost = list(controller.run_script(games))
+        assert won.result == "won" and won.moves <= len(safe) + 1
+        assert (lost.result, lost.moves) == ("lost", 2)
+
+    def test_random_play_is_repeatable(self):
+        # test that seeded random play gives the same results on every run
+        controller = Controller()
+        first = [result[:2] for result in controller.run_random(20, seed=4)]
+        assert first == [result[:2] for result in controller.run_random(20, seed=4)]
+        assert all(result in ("won", "lost", "unfinished") for result, _ in first)
+
+
+class TestRenderer:
+    def test_row_labels_scale_past_z(self):
+        # test that row labels continue with two letters after Z and parse back to their rows
+        assert [row_label(r) for r in (0, 25, 26, 51, 52, 701, 702)] == ["A", "Z", "AA", "AZ", "BA", "ZZ", "AAA"]
+        assert all(parse_row_label(row_label(r)) == r for r in range(1000))
+        assert parse_cell("ab12") == BoardPos(x=27, y=11)
+        with pytest.raises(ValueError):
+            parse_row_label("A1")
+
+    def test_frame_lines_up_on_large_boards(self, capsys):
+        # test that a 30 x 40 board prints once with a labeled line per row and glyphs under their column numbers
+        board = Board(100, size=BoardSize(30, 40), seed=2)
+        board.place_mines(BoardPos(x=0, y=0))
+        board.update_mine_counts()
+        board.reveal_cell(BoardPos(x=0, y=0))
+        board.flag_cell(BoardPos(x=29, y=39))
+        board.print_board()
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 32
+        assert [line.split()[0] for line in lines[2:]] == [row_label(r) for r in range(30)]
+        header, last = lines[0], lines[-1]
+        assert last.startswith("AD") and last[header.index("40") + 1] == "F"
+        assert lines[2][header.index(" 1 ") + 1] == str(board.board[0][0])
+
+    def test_ansi_updates_only_changed_cells(self):
+        # test that after the first frame an ANSI renderer rewrites just the cells that changed
+        renderer = TerminalRenderer(12, 12, ansi=True)
+        glyphs = ["/"] * 144
+        first = renderer.update(glyphs)
+        assert first.startswith("\x1b[H\x1b[2J") and first.count("\n") == 14
+        glyphs[12 * 11 + 11] = "F"
+        update = renderer.update(glyphs)
+        assert update.count("\x1b[") == 3 and "\x1b[14;" in update and update.count("F") == 1
+        plain = TerminalRenderer(12, 12)
+        assert plain.update(glyphs) == plain.update(glyphs) == plain.frame(glyphs)
+
+
 class TestCheckWin:
     def test_win_when_all_non_mines_revealed(self):
         # test that check_win returns true when all non-mine cells are revealed